@@ -8,32 +8,177 @@ import os
 import sqlite3
 import logging
 import time
+import queue
+import threading
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 
 logger = logging.getLogger('KARMA-LiveBOT.Database')
 
+# Shared worker threads for blocking sqlite3 calls. Async code hands its DB
+# work to run_db() so lock waits and fsyncs never stall the event loop
+# (and with it the Discord gateway heartbeat).
+_db_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix='karma-db')
+
+async def run_db(func, *args):
+    """Run a blocking DB function in the shared executor and await its result"""
+    return await asyncio.get_running_loop().run_in_executor(_db_executor, func, *args)
+
+class SQLiteConnectionPool:
+    """Small LIFO pool of live sqlite3 connections (checkout/checkin).
+
+    Avoids per-operation connect/close overhead and re-applies the PRAGMAs
+    only once per pooled connection instead of on every request.
+    """
+
+    def __init__(self, db_path, size=6, ephemeral_path=None):
+        self.db_path = db_path
+        self.ephemeral_path = ephemeral_path
+        self.size = size
+        self._pool = queue.LifoQueue(maxsize=size)
+        self._created = 0
+        self._lock = threading.Lock()
+
+    def _create_connection(self):
+        # check_same_thread=False: connections are handed out to worker threads too.
+        # Larger statement cache keeps all the hot polling-loop queries compiled
+        conn = sqlite3.connect(self.db_path, timeout=30, check_same_thread=False,
+                               cached_statements=256)
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.execute('PRAGMA synchronous=NORMAL')
+        conn.execute('PRAGMA temp_store=MEMORY')
+        conn.execute('PRAGMA cache_size=-20000')
+        conn.execute('PRAGMA foreign_keys=ON')
+        conn.execute('PRAGMA busy_timeout=10000')
+        conn.execute('PRAGMA wal_autocheckpoint=1000')
+        # Memory-mapped I/O: page reads come from the OS page cache without
+        # read() syscalls - helps the frequent creators/live_status scans
+        conn.execute('PRAGMA mmap_size=268435456')
+        if self.ephemeral_path:
+            # Ephemeral partition for live_status: its contents are rebuilt
+            # from the platform APIs after a restart, so skipping the fsync
+            # per commit (synchronous=OFF) is safe and removes the dominant
+            # write cost of the per-minute status updates
+            conn.execute("ATTACH DATABASE ? AS eph", (self.ephemeral_path,))
+            conn.execute('PRAGMA eph.journal_mode=WAL')
+            conn.execute('PRAGMA eph.synchronous=OFF')
+        return conn
+
+    @contextmanager
+    def acquire(self):
+        """Check out a connection; it is returned to the pool on exit"""
+        conn = self._checkout()
+        try:
+            yield conn
+        finally:
+            self._checkin(conn)
+
+    def _checkout(self):
+        try:
+            return self._pool.get_nowait()
+        except queue.Empty:
+            pass
+        with self._lock:
+            if self._created < self.size:
+                self._created += 1
+                return self._create_connection()
+        # Pool exhausted: wait for a connection to be returned
+        return self._pool.get(timeout=30)
+
+    def _checkin(self, conn):
+        try:
+            conn.rollback()  # drop any uncommitted state before reuse
+            self._pool.put_nowait(conn)
+        except Exception:
+            with self._lock:
+                self._created -= 1
+            try:
+                conn.close()
+            except Exception:
+                pass
+
+    def close_all(self):
+        """Close all idle pooled connections (shutdown helper)"""
+        first = True
+        while True:
+            try:
+                conn = self._pool.get_nowait()
+            except queue.Empty:
+                break
+            try:
+                if first:
+                    # Once is enough: refreshes the query-planner statistics
+                    # of the write-heavy tables for the next start
+                    conn.execute('PRAGMA optimize')
+                    first = False
+                conn.close()
+            except Exception:
+                pass
+
+
+class _PooledConnection:
+    """Proxy around a pooled connection whose close() checks it back in.
+
+    Lets the many existing `conn = db.get_connection() ... conn.close()`
+    call sites benefit from the pool without being rewritten: close()
+    returns the live connection to the pool instead of tearing it down.
+    """
+
+    __slots__ = ('_pool', '_conn')
+
+    def __init__(self, pool, conn):
+        object.__setattr__(self, '_pool', pool)
+        object.__setattr__(self, '_conn', conn)
+
+    def close(self):
+        conn = self._conn
+        if conn is not None:
+            object.__setattr__(self, '_conn', None)
+            self._pool._checkin(conn)
+
+    def __getattr__(self, name):
+        return getattr(self._conn, name)
+
+    def __setattr__(self, name, value):
+        setattr(self._conn, name, value)
+
+    def __enter__(self):
+        # sqlite3 context manager = transaction scope, not close
+        return self._conn.__enter__()
+
+    def __exit__(self, *exc):
+        return self._conn.__exit__(*exc)
+
+    def __del__(self):
+        # Safety net: a dropped, unclosed proxy must not leak a pool slot
+        self.close()
+
+
 class DatabaseManager:
     """Database manager with better concurrency handling"""
-    
+
+    # Bump this when adding a migration block to init_database; deployments
+    # at the current version skip all migration introspection on startup
+    SCHEMA_VERSION = 1
+
     def __init__(self, db_path='karma_bot.db'):
         # Use persistent storage paths for cloud deployment
         if os.path.exists('/data'):  # Railway.com volume
             db_path = '/data/karma_bot.db'
-        elif os.path.exists('/var/data'):  # Render.com disk  
+        elif os.path.exists('/var/data'):  # Render.com disk
             db_path = '/var/data/karma_bot.db'
         self.db_path = db_path
+        # Ephemeral partition lives next to the main DB file
+        self.ephemeral_path = os.path.join(os.path.dirname(self.db_path) or '.', 'karma_ephemeral.db')
+        self.pool = SQLiteConnectionPool(self.db_path, ephemeral_path=self.ephemeral_path)
         self.init_database()
-    
+
     def get_connection(self, timeout=30, max_retries=2):
-        """Get database connection with retry logic for locked database"""
+        """Get a pooled database connection; close() returns it to the pool"""
         for attempt in range(max_retries):
             try:
-                conn = sqlite3.connect(self.db_path, timeout=timeout)
-                conn.execute('PRAGMA journal_mode=WAL')  # Enable WAL mode for better concurrency
-                conn.execute('PRAGMA synchronous=NORMAL')  # Balance between safety and speed
-                conn.execute('PRAGMA cache_size=10000')  # Increase cache size
-                conn.execute('PRAGMA temp_store=memory')  # Store temp tables in memory
-                conn.execute('PRAGMA busy_timeout=10000')  # Wait up to 10s for locks
-                return conn
+                return _PooledConnection(self.pool, self.pool._checkout())
             except sqlite3.OperationalError as e:
                 if "database is locked" in str(e) and attempt < max_retries - 1:
                     wait_time = 0.1 * (attempt + 1)  # Simple linear backoff: 0.1s, 0.2s
@@ -47,7 +192,13 @@ class DatabaseManager:
         """Initialize database with all required tables"""
         conn = self.get_connection()
         cursor = conn.cursor()
-        
+
+        # Schema version gate: on warm restarts a single integer compare
+        # replaces the per-table PRAGMA table_info introspection and the
+        # idempotent backfill statements of the migration blocks below
+        cursor.execute('PRAGMA user_version')
+        run_migrations = cursor.fetchone()[0] < self.SCHEMA_VERSION
+
         # Creator table
         cursor.execute('''
             CREATE TABLE IF NOT EXISTS creators (
@@ -124,85 +275,108 @@ class DatabaseManager:
             )
         ''')
         
-        # Live Status Tracking (prevents double notifications)
+        # Live Status Tracking (prevents double notifications). Lives in the
+        # attached ephemeral DB (synchronous=OFF): the data is rebuilt from
+        # the platform APIs on restart, so durability is not required. No
+        # creator_id foreign key here - SQLite cannot reference across
+        # attached databases. Column order must stay append-only so the
+        # one-time move from a fully migrated main.live_status below works.
         cursor.execute('''
-            CREATE TABLE IF NOT EXISTS live_status (
+            CREATE TABLE IF NOT EXISTS eph.live_status (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
                 creator_id INTEGER NOT NULL,
                 platform TEXT NOT NULL,
                 is_live BOOLEAN DEFAULT FALSE,
                 last_notification_date DATE,
                 stream_start_time TIMESTAMP,
-                FOREIGN KEY (creator_id) REFERENCES creators (id),
+                message_id TEXT,
+                notification_channel_id TEXT,
+                primary_platform TEXT,
                 UNIQUE(creator_id, platform)
             )
         ''')
         
-        # Migration: Check if user_subscriptions needs platform column migration
-        cursor.execute("PRAGMA table_info(user_subscriptions)")
-        columns = [column[1] for column in cursor.fetchall()]
-        if 'platform' not in columns:
-            # Safe migration: Create new table and migrate data
-            cursor.execute('''
-                CREATE TABLE user_subscriptions_new (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    user_id TEXT NOT NULL,
-                    creator_id INTEGER NOT NULL,
-                    platform TEXT NOT NULL DEFAULT 'all',
-                    subscribed_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    FOREIGN KEY (creator_id) REFERENCES creators (id),
-                    UNIQUE(user_id, creator_id, platform)
-                )
-            ''')
+        if run_migrations:
+            # Migration: Check if user_subscriptions needs platform column migration
+            cursor.execute("PRAGMA table_info(user_subscriptions)")
+            columns = [column[1] for column in cursor.fetchall()]
+            if 'platform' not in columns:
+                # Safe migration: Create new table and migrate data
+                cursor.execute('''
+                    CREATE TABLE user_subscriptions_new (
+                        id INTEGER PRIMARY KEY AUTOINCREMENT,
+                        user_id TEXT NOT NULL,
+                        creator_id INTEGER NOT NULL,
+                        platform TEXT NOT NULL DEFAULT 'all',
+                        subscribed_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                        FOREIGN KEY (creator_id) REFERENCES creators (id),
+                        UNIQUE(user_id, creator_id, platform)
+                    )
+                ''')
             
-            # Copy existing data with default 'all' platform
-            cursor.execute('''
-                INSERT INTO user_subscriptions_new (id, user_id, creator_id, platform, subscribed_at)
-                SELECT id, user_id, creator_id, 'all', subscribed_at FROM user_subscriptions
-            ''')
+                # Copy existing data with default 'all' platform
+                cursor.execute('''
+                    INSERT INTO user_subscriptions_new (id, user_id, creator_id, platform, subscribed_at)
+                    SELECT id, user_id, creator_id, 'all', subscribed_at FROM user_subscriptions
+                ''')
             
-            # Replace old table
-            cursor.execute('DROP TABLE user_subscriptions')
-            cursor.execute('ALTER TABLE user_subscriptions_new RENAME TO user_subscriptions')
+                # Replace old table
+                cursor.execute('DROP TABLE user_subscriptions')
+                cursor.execute('ALTER TABLE user_subscriptions_new RENAME TO user_subscriptions')
+                # Close the implicit transaction before the backfill below
+                # opens its own with BEGIN
+                conn.commit()
         
-        # Migration: Backfill creator_channels from existing creators
-        cursor.execute('SELECT id, notification_channel_id, twitch_username, youtube_username, tiktok_username FROM creators')
-        existing_creators = cursor.fetchall()
-        
-        for creator_id, channel_id, twitch, youtube, tiktok in existing_creators:
-            # Add channel entries for each platform that has a username
-            if twitch:
-                cursor.execute('''
-                    INSERT OR IGNORE INTO creator_channels (creator_id, platform, channel_id)
-                    VALUES (?, ?, ?)
-                ''', (creator_id, 'twitch', channel_id))
-            if youtube:
-                cursor.execute('''
+        if run_migrations:
+            # Migration: Backfill creator_channels from existing creators.
+            # Set-based INSERT-SELECT in one transaction instead of up to three
+            # autocommitted statements per creator row
+            cursor.execute('BEGIN')
+            for platform, username_column in (('twitch', 'twitch_username'),
+                                              ('youtube', 'youtube_username'),
+                                              ('tiktok', 'tiktok_username')):
+                cursor.execute(f'''
                     INSERT OR IGNORE INTO creator_channels (creator_id, platform, channel_id)
-                    VALUES (?, ?, ?)
-                ''', (creator_id, 'youtube', channel_id))
-            if tiktok:
-                cursor.execute('''
-                    INSERT OR IGNORE INTO creator_channels (creator_id, platform, channel_id)
-                    VALUES (?, ?, ?)
-                ''', (creator_id, 'tiktok', channel_id))
-        
-        # Migration: Add message_id and notification_channel_id to live_status table for auto-deletion
-        cursor.execute("PRAGMA table_info(live_status)")
-        live_status_columns = [column[1] for column in cursor.fetchall()]
-        if 'message_id' not in live_status_columns:
-            cursor.execute('ALTER TABLE live_status ADD COLUMN message_id TEXT')
-            logger.info("Added message_id column to live_status table")
-        if 'notification_channel_id' not in live_status_columns:
-            cursor.execute('ALTER TABLE live_status ADD COLUMN notification_channel_id TEXT')
-            logger.info("Added notification_channel_id column to live_status table")
+                    SELECT id, '{platform}', notification_channel_id FROM creators
+                    WHERE {username_column} IS NOT NULL AND {username_column} != ''
+                ''')
+            conn.commit()
+
+        # Index for the frequent creator_id joins/lookups
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_creator_channels_cid ON creator_channels(creator_id)')
+
+        if run_migrations:
+            # Migration: Add message_id and notification_channel_id to live_status table for auto-deletion
+            cursor.execute("PRAGMA table_info(live_status)")
+            live_status_columns = [column[1] for column in cursor.fetchall()]
+            if 'message_id' not in live_status_columns:
+                cursor.execute('ALTER TABLE live_status ADD COLUMN message_id TEXT')
+                logger.info("Added message_id column to live_status table")
+            if 'notification_channel_id' not in live_status_columns:
+                cursor.execute('ALTER TABLE live_status ADD COLUMN notification_channel_id TEXT')
+                logger.info("Added notification_channel_id column to live_status table")
+            if 'primary_platform' not in live_status_columns:
+                cursor.execute('ALTER TABLE live_status ADD COLUMN primary_platform TEXT')
+                logger.info("Added primary_platform column to live_status table")
+
+            # One-time move: legacy deployments had live_status in the main DB.
+            # The column migrations above have just run against that table (the
+            # unqualified name resolves to main first), so a straight SELECT *
+            # copy into the ephemeral partition is safe; dropping the original
+            # makes the unqualified name resolve to eph.live_status from now on.
+            cursor.execute("SELECT name FROM main.sqlite_master WHERE type='table' AND name='live_status'")
+            if cursor.fetchone():
+                cursor.execute('INSERT OR IGNORE INTO eph.live_status SELECT * FROM main.live_status')
+                cursor.execute('DROP TABLE main.live_status')
+                logger.info("Moved live_status into the ephemeral database partition")
         
-        # Migration: Add custom_message column to creators table for custom notifications
-        cursor.execute("PRAGMA table_info(creators)")
-        creators_columns = [column[1] for column in cursor.fetchall()]
-        if 'custom_message' not in creators_columns:
-            cursor.execute('ALTER TABLE creators ADD COLUMN custom_message TEXT DEFAULT NULL')
-            logger.info("Added custom_message column to creators table")
+        if run_migrations:
+            # Migration: Add custom_message column to creators table for custom notifications
+            cursor.execute("PRAGMA table_info(creators)")
+            creators_columns = [column[1] for column in cursor.fetchall()]
+            if 'custom_message' not in creators_columns:
+                cursor.execute('ALTER TABLE creators ADD COLUMN custom_message TEXT DEFAULT NULL')
+                logger.info("Added custom_message column to creators table")
         
         # Stats Channels table (für Voice Channel Statistiken)
         cursor.execute('''
@@ -242,6 +416,34 @@ class DatabaseManager:
             )
         ''')
         
+        # Instant Gaming Search Cache table (persistenter Such-Cache über Neustarts)
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS ig_cache (
+                key TEXT PRIMARY KEY,
+                payload BLOB,
+                ts INTEGER NOT NULL
+            )
+        ''')
+
+        # Twitch User Cache table (login -> user_id mapping survives restarts)
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS twitch_user_cache (
+                username TEXT PRIMARY KEY,
+                user_id TEXT NOT NULL,
+                profile_image_url TEXT,
+                ts INTEGER NOT NULL
+            )
+        ''')
+
+        # Persisted Twitch app access token (single row, survives restarts)
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS twitch_token (
+                id INTEGER PRIMARY KEY CHECK (id = 1),
+                access_token TEXT NOT NULL,
+                expires_at TIMESTAMP NOT NULL
+            )
+        ''')
+
         # Custom Commands table (für Custom Slash Commands pro Server)
         cursor.execute('''
             CREATE TABLE IF NOT EXISTS custom_commands (
@@ -321,7 +523,18 @@ class DatabaseManager:
         
         # Initialize Instant Gaming config if not exists
         cursor.execute('INSERT OR IGNORE INTO instant_gaming_config (id, affiliate_tag) VALUES (1, "tikzzay")')
-        
+
+        # Indexes for the hot query paths of the polling loop
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_creators_type ON creators(streamer_type)')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_creators_discord_uid ON creators(discord_user_id)')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_user_sub_creator ON user_subscriptions(creator_id, platform)')
+
+        # Refresh planner statistics so the new indexes actually get picked
+        cursor.execute('ANALYZE')
+
+        if run_migrations:
+            cursor.execute(f'PRAGMA user_version = {self.SCHEMA_VERSION}')
+
         conn.commit()
         conn.close()
         logger.info("✅ Database initialized successfully")
@@ -6,6 +6,7 @@ import discord
 from discord.ext import commands
 from discord import app_commands
 import sqlite3
+from dataclasses import dataclass
 from typing import List, Optional
 import logging
 from datetime import datetime, timedelta
@@ -22,6 +23,51 @@ from event import EventManager
 
 logger = logging.getLogger('KARMA-LiveBOT.events')
 
+# Shared aiohttp session for all HTTP helpers in this module.
+# One pooled session avoids a fresh TLS handshake per API call.
+_http_session: Optional[aiohttp.ClientSession] = None
+
+def get_http_session() -> aiohttp.ClientSession:
+    """Get (or lazily create) the shared aiohttp session with a bounded connector"""
+    global _http_session
+    if _http_session is None or _http_session.closed:
+        _http_session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit_per_host=64, ttl_dns_cache=300, keepalive_timeout=60)
+        )
+    return _http_session
+
+async def close_http_session():
+    """Close the shared aiohttp session (called on cog unload)"""
+    global _http_session
+    if _http_session is not None and not _http_session.closed:
+        await _http_session.close()
+    _http_session = None
+
+async def send_with_retry(coro_factory, max_retries: int = 3):
+    """Run a Discord REST call, retrying on 429/5xx with jittered backoff.
+
+    coro_factory must be a zero-arg callable returning a fresh coroutine,
+    since a coroutine object can only be awaited once.
+    """
+    for attempt in range(max_retries):
+        try:
+            return await coro_factory()
+        except discord.HTTPException as e:
+            if attempt == max_retries - 1:
+                raise
+            if e.status == 429:
+                # Honor Discord's Retry-After header when present
+                try:
+                    delay = float(e.response.headers.get('Retry-After', 1))
+                except (AttributeError, TypeError, ValueError):
+                    delay = 1.0
+            elif e.status >= 500:
+                delay = 2 ** attempt
+            else:
+                raise
+            logger.warning(f"Discord API returned {e.status}, retrying in {delay:.1f}s (attempt {attempt + 1}/{max_retries})")
+            await asyncio.sleep(delay + random.random() * 0.1)
+
 # DatabaseManager will be set at runtime via set_database function
 
 def has_admin_role():
@@ -71,7 +117,15 @@ class EventCommands(commands.Cog):
     def __init__(self, bot: commands.Bot, db):
         self.bot = bot
         self.db = db
-    
+
+    async def cog_unload(self):
+        try:
+            from main import instant_gaming
+            await instant_gaming.close()
+        except ImportError:
+            pass
+        await close_http_session()
+
     async def get_twitch_profile_image(self, username: str) -> Optional[str]:
         """Get Twitch profile image URL via API - dedicated method to avoid circular imports"""
         if not Config.TWITCH_CLIENT_ID or not Config.TWITCH_CLIENT_SECRET:
@@ -87,45 +141,46 @@ class EventCommands(commands.Cog):
                 'grant_type': 'client_credentials'
             }
             
-            timeout = aiohttp.ClientTimeout(total=5)
-            async with aiohttp.ClientSession(timeout=timeout) as session:
-                # Get access token
-                async with session.post(token_url, data=token_data) as token_response:
-                    if token_response.status != 200:
-                        logger.error(f"Failed to get Twitch token for profile image: {token_response.status}")
-                        return None
+            # Bounded connect + total timeout so a hung upstream can't stall the interaction
+            timeout = aiohttp.ClientTimeout(total=4, connect=1)
+            session = get_http_session()
+            # Get access token
+            async with session.post(token_url, data=token_data, timeout=timeout) as token_response:
+                if token_response.status != 200:
+                    logger.error(f"Failed to get Twitch token for profile image: {token_response.status}")
+                    return None
                     
-                    token_json = await token_response.json()
-                    access_token = token_json.get('access_token')
+                token_json = await token_response.json()
+                access_token = token_json.get('access_token')
                     
-                    if not access_token:
-                        logger.error("No access token received from Twitch API")
-                        return None
+                if not access_token:
+                    logger.error("No access token received from Twitch API")
+                    return None
                 
-                # Get user profile
-                headers = {
-                    'Client-ID': Config.TWITCH_CLIENT_ID,
-                    'Authorization': f'Bearer {access_token}'
-                }
+            # Get user profile
+            headers = {
+                'Client-ID': Config.TWITCH_CLIENT_ID,
+                'Authorization': f'Bearer {access_token}'
+            }
                 
-                user_url = f'https://api.twitch.tv/helix/users?login={username}'
-                async with session.get(user_url, headers=headers) as user_response:
-                    if user_response.status != 200:
-                        logger.error(f"Failed to get Twitch user profile for {username}: {user_response.status}")
-                        return None
+            user_url = f'https://api.twitch.tv/helix/users?login={username}'
+            async with session.get(user_url, headers=headers, timeout=timeout) as user_response:
+                if user_response.status != 200:
+                    logger.error(f"Failed to get Twitch user profile for {username}: {user_response.status}")
+                    return None
                     
-                    user_data = await user_response.json()
-                    if not user_data.get('data'):
-                        logger.warning(f"No Twitch user data found for username: {username}")
-                        return None
+                user_data = await user_response.json()
+                if not user_data.get('data'):
+                    logger.warning(f"No Twitch user data found for username: {username}")
+                    return None
                     
-                    profile_image_url = user_data['data'][0].get('profile_image_url')
-                    if profile_image_url:
-                        logger.info(f"✅ Successfully fetched Twitch profile image for {username}")
-                        return profile_image_url
-                    else:
-                        logger.warning(f"No profile image URL in Twitch response for {username}")
-                        return None
+                profile_image_url = user_data['data'][0].get('profile_image_url')
+                if profile_image_url:
+                    logger.info("✅ Successfully fetched Twitch profile image for %s", username)
+                    return profile_image_url
+                else:
+                    logger.warning(f"No profile image URL in Twitch response for {username}")
+                    return None
                         
         except Exception as e:
             logger.error(f"Error fetching Twitch profile image for {username}: {e}")
@@ -138,62 +193,63 @@ class EventCommands(commands.Cog):
             return None
         
         try:
-            timeout = aiohttp.ClientTimeout(total=5)
-            async with aiohttp.ClientSession(timeout=timeout) as session:
-                # Search for channel by username
-                search_url = 'https://www.googleapis.com/youtube/v3/search'
-                params = {
-                    'part': 'snippet',
-                    'q': f'@{username}',
-                    'type': 'channel',
-                    'key': Config.YOUTUBE_API_KEY,
-                    'maxResults': 1
-                }
+            # Bounded connect + total timeout so a hung upstream can't stall the interaction
+            timeout = aiohttp.ClientTimeout(total=4, connect=1)
+            session = get_http_session()
+            # Search for channel by username
+            search_url = 'https://www.googleapis.com/youtube/v3/search'
+            params = {
+                'part': 'snippet',
+                'q': f'@{username}',
+                'type': 'channel',
+                'key': Config.YOUTUBE_API_KEY,
+                'maxResults': 1
+            }
                 
-                async with session.get(search_url, params=params) as search_response:
-                    if search_response.status == 403:
-                        logger.warning(f"YouTube API quota exceeded for profile image request: {username}")
-                        return None
-                    elif search_response.status != 200:
-                        logger.error(f"YouTube search API error for {username}: {search_response.status}")
-                        return None
+            async with session.get(search_url, params=params, timeout=timeout) as search_response:
+                if search_response.status == 403:
+                    logger.warning(f"YouTube API quota exceeded for profile image request: {username}")
+                    return None
+                elif search_response.status != 200:
+                    logger.error(f"YouTube search API error for {username}: {search_response.status}")
+                    return None
                     
-                    search_data = await search_response.json()
-                    if not search_data.get('items'):
-                        logger.warning(f"No YouTube channel found for username: {username}")
-                        return None
+                search_data = await search_response.json()
+                if not search_data.get('items'):
+                    logger.warning(f"No YouTube channel found for username: {username}")
+                    return None
                     
-                    # Fix: Use correct channel ID extraction for search results
-                    channel_id = search_data['items'][0]['id']['channelId']
+                # Fix: Use correct channel ID extraction for search results
+                channel_id = search_data['items'][0]['id']['channelId']
                 
-                # Get channel details for profile image
-                channels_url = 'https://www.googleapis.com/youtube/v3/channels'
-                params = {
-                    'part': 'snippet',
-                    'id': channel_id,
-                    'key': Config.YOUTUBE_API_KEY
-                }
+            # Get channel details for profile image
+            channels_url = 'https://www.googleapis.com/youtube/v3/channels'
+            params = {
+                'part': 'snippet',
+                'id': channel_id,
+                'key': Config.YOUTUBE_API_KEY
+            }
                 
-                async with session.get(channels_url, params=params) as channel_response:
-                    if channel_response.status != 200:
-                        logger.error(f"YouTube channels API error for {username}: {channel_response.status}")
-                        return None
+            async with session.get(channels_url, params=params, timeout=timeout) as channel_response:
+                if channel_response.status != 200:
+                    logger.error(f"YouTube channels API error for {username}: {channel_response.status}")
+                    return None
                     
-                    channel_data = await channel_response.json()
-                    if not channel_data.get('items'):
-                        logger.warning(f"No YouTube channel details found for {username}")
-                        return None
+                channel_data = await channel_response.json()
+                if not channel_data.get('items'):
+                    logger.warning(f"No YouTube channel details found for {username}")
+                    return None
                     
-                    thumbnails = channel_data['items'][0]['snippet'].get('thumbnails', {})
-                    # Try different thumbnail sizes, prioritizing higher quality
-                    for size in ['high', 'medium', 'default']:
-                        if size in thumbnails:
-                            profile_url = thumbnails[size]['url']
-                            logger.info(f"✅ Successfully fetched YouTube profile image for {username} (size: {size})")
-                            return profile_url
+                thumbnails = channel_data['items'][0]['snippet'].get('thumbnails', {})
+                # Try different thumbnail sizes, prioritizing higher quality
+                for size in ['high', 'medium', 'default']:
+                    if size in thumbnails:
+                        profile_url = thumbnails[size]['url']
+                        logger.info("✅ Successfully fetched YouTube profile image for %s (size: %s)", username, size)
+                        return profile_url
                     
-                    logger.warning(f"No thumbnail URLs found in YouTube response for {username}")
-                    return None
+                logger.warning(f"No thumbnail URLs found in YouTube response for {username}")
+                return None
                     
         except Exception as e:
             logger.error(f"Error fetching YouTube profile image for {username}: {e}")
@@ -576,6 +632,109 @@ class UtilityCommands(commands.Cog):
             except:
                 pass
 
+@dataclass(frozen=True)
+class PlatformDemo:
+    """Static configuration for one platform in the Instant Gaming live-demo"""
+    platform: str
+    platform_label: str
+    display_name: str
+    game: str
+    color_key: str
+    profile_usernames: tuple
+    thumbnail_fallback: str
+    image_url: str
+    viewers: str
+    followers_label: str
+    followers_value: str
+    streak: str
+    channel_url: str
+    follow_label: str
+    buy_label: str
+    footer: str
+    button_rows: tuple  # (standard buttons row, buy button row) in the combined view
+
+
+TWITCH_DEMO_CFG = PlatformDemo(
+    platform='twitch',
+    platform_label='Twitch',
+    display_name='TikZ aka. Zay',
+    game='Cyberpunk 2077',
+    color_key='twitch',
+    profile_usernames=('tikzzay',),
+    thumbnail_fallback='https://static-cdn.jtvnw.net/user-default-pictures-uv/13e5fa74-defa-11e9-8543-784f43822e80-profile_image-300x300.png',
+    image_url='https://static-cdn.jtvnw.net/ttv-boxart/1091500-440x552.jpg',  # Cyberpunk 2077 game art
+    viewers='1,347',
+    followers_label='💖 Follower',
+    followers_value='3,256',
+    streak='7 Tage',
+    channel_url='https://twitch.tv/tikzzay',
+    follow_label='Folgen',
+    buy_label='🎮 Cyberpunk 2077 kaufen (-65%)',
+    footer='🟣 Twitch • LIVE-DEMO mit Instant Gaming',
+    button_rows=(0, 1)
+)
+
+YOUTUBE_DEMO_CFG = PlatformDemo(
+    platform='youtube',
+    platform_label='YouTube',
+    display_name='Sturmpelz',
+    game='Call of Duty Black Ops 6',
+    color_key='youtube',
+    profile_usernames=('@sturmpelz', 'sturmpelz', 'sturmpelz2206'),
+    thumbnail_fallback='https://yt3.ggpht.com/a/default-user=s240-c-k-c0x00ffffff-no-rj',
+    image_url='https://static-cdn.jtvnw.net/ttv-boxart/21779-440x552.jpg',  # Call of Duty game art
+    viewers='892',
+    followers_label='📺 Abonnenten',
+    followers_value='2,184',
+    streak='4 Tage',
+    channel_url='https://youtube.com/@sturmpelz',
+    follow_label='Abonnieren',
+    buy_label='🎮 COD Black Ops 6 kaufen (-50%)',
+    footer='🔴 YouTube • LIVE-DEMO mit Instant Gaming',
+    button_rows=(2, 3)
+)
+
+
+# Static pieces of the Instant-Gaming-Test final status embed (built once, reused per run)
+FINAL_STATUS_HEADER = "**Zwei Live-Demos gesendet!**"
+LINK_FOUND = "✅ Direkter Link gefunden"
+LINK_MISSING = "❌ Nicht gefunden/Fehler"
+TROUBLESHOOTING_HINT = (
+    "Keine direkten Produktlinks gefunden. Mögliche Ursachen:\n"
+    "• Temporäre Netzwerkprobleme\n"
+    "• Instant Gaming Website-Änderungen\n"
+    "• Spiel momentan nicht verfügbar\n"
+    "➜ Demo-Embeds funktionieren trotzdem!"
+)
+
+
+class CombinedInstantGamingView(discord.ui.View):
+    """Buttons for all demo platforms in one view (Twitch rows 0-1, YouTube rows 2-3)"""
+    __slots__ = ()
+
+    def __init__(self, demos):
+        super().__init__(timeout=None)
+        for cfg, buy_link in demos:
+            standard_row, buy_row = cfg.button_rows
+            self.add_item(discord.ui.Button(
+                label="Anschauen", emoji="📺",
+                url=cfg.channel_url,
+                style=discord.ButtonStyle.link, row=standard_row
+            ))
+            self.add_item(discord.ui.Button(
+                label=cfg.follow_label, emoji="❤️",
+                url=cfg.channel_url,
+                style=discord.ButtonStyle.link, row=standard_row
+            ))
+            # Instant Gaming Button mit direktem Produktlink
+            if buy_link:
+                self.add_item(discord.ui.Button(
+                    label=cfg.buy_label, emoji="💰",
+                    url=buy_link,
+                    style=discord.ButtonStyle.link, row=buy_row
+                ))
+
+
 class ServerInfoView(discord.ui.View):
     def __init__(self, db, bot):
         super().__init__(timeout=300)
@@ -597,45 +756,46 @@ class ServerInfoView(discord.ui.View):
                 'grant_type': 'client_credentials'
             }
             
-            timeout = aiohttp.ClientTimeout(total=5)
-            async with aiohttp.ClientSession(timeout=timeout) as session:
-                # Get access token
-                async with session.post(token_url, data=token_data) as token_response:
-                    if token_response.status != 200:
-                        logger.error(f"Failed to get Twitch token for profile image: {token_response.status}")
-                        return None
+            # Bounded connect + total timeout so a hung upstream can't stall the interaction
+            timeout = aiohttp.ClientTimeout(total=4, connect=1)
+            session = get_http_session()
+            # Get access token
+            async with session.post(token_url, data=token_data, timeout=timeout) as token_response:
+                if token_response.status != 200:
+                    logger.error(f"Failed to get Twitch token for profile image: {token_response.status}")
+                    return None
                     
-                    token_json = await token_response.json()
-                    access_token = token_json.get('access_token')
+                token_json = await token_response.json()
+                access_token = token_json.get('access_token')
                     
-                    if not access_token:
-                        logger.error("No access token received from Twitch API")
-                        return None
+                if not access_token:
+                    logger.error("No access token received from Twitch API")
+                    return None
                 
-                # Get user profile
-                headers = {
-                    'Client-ID': Config.TWITCH_CLIENT_ID,
-                    'Authorization': f'Bearer {access_token}'
-                }
+            # Get user profile
+            headers = {
+                'Client-ID': Config.TWITCH_CLIENT_ID,
+                'Authorization': f'Bearer {access_token}'
+            }
                 
-                user_url = f'https://api.twitch.tv/helix/users?login={username}'
-                async with session.get(user_url, headers=headers) as user_response:
-                    if user_response.status != 200:
-                        logger.error(f"Failed to get Twitch user profile for {username}: {user_response.status}")
-                        return None
+            user_url = f'https://api.twitch.tv/helix/users?login={username}'
+            async with session.get(user_url, headers=headers, timeout=timeout) as user_response:
+                if user_response.status != 200:
+                    logger.error(f"Failed to get Twitch user profile for {username}: {user_response.status}")
+                    return None
                     
-                    user_data = await user_response.json()
-                    if not user_data.get('data'):
-                        logger.warning(f"No Twitch user data found for username: {username}")
-                        return None
+                user_data = await user_response.json()
+                if not user_data.get('data'):
+                    logger.warning(f"No Twitch user data found for username: {username}")
+                    return None
                     
-                    profile_image_url = user_data['data'][0].get('profile_image_url')
-                    if profile_image_url:
-                        logger.info(f"✅ Successfully fetched Twitch profile image for {username}")
-                        return profile_image_url
-                    else:
-                        logger.warning(f"No profile image URL in Twitch response for {username}")
-                        return None
+                profile_image_url = user_data['data'][0].get('profile_image_url')
+                if profile_image_url:
+                    logger.info("✅ Successfully fetched Twitch profile image for %s", username)
+                    return profile_image_url
+                else:
+                    logger.warning(f"No profile image URL in Twitch response for {username}")
+                    return None
                         
         except Exception as e:
             logger.error(f"Error fetching Twitch profile image for {username}: {e}")
@@ -648,62 +808,63 @@ class ServerInfoView(discord.ui.View):
             return None
         
         try:
-            timeout = aiohttp.ClientTimeout(total=5)
-            async with aiohttp.ClientSession(timeout=timeout) as session:
-                # Search for channel by username
-                search_url = 'https://www.googleapis.com/youtube/v3/search'
-                params = {
-                    'part': 'snippet',
-                    'q': f'@{username}',
-                    'type': 'channel',
-                    'key': Config.YOUTUBE_API_KEY,
-                    'maxResults': 1
-                }
+            # Bounded connect + total timeout so a hung upstream can't stall the interaction
+            timeout = aiohttp.ClientTimeout(total=4, connect=1)
+            session = get_http_session()
+            # Search for channel by username
+            search_url = 'https://www.googleapis.com/youtube/v3/search'
+            params = {
+                'part': 'snippet',
+                'q': f'@{username}',
+                'type': 'channel',
+                'key': Config.YOUTUBE_API_KEY,
+                'maxResults': 1
+            }
                 
-                async with session.get(search_url, params=params) as search_response:
-                    if search_response.status == 403:
-                        logger.warning(f"YouTube API quota exceeded for profile image request: {username}")
-                        return None
-                    elif search_response.status != 200:
-                        logger.error(f"YouTube search API error for {username}: {search_response.status}")
-                        return None
+            async with session.get(search_url, params=params, timeout=timeout) as search_response:
+                if search_response.status == 403:
+                    logger.warning(f"YouTube API quota exceeded for profile image request: {username}")
+                    return None
+                elif search_response.status != 200:
+                    logger.error(f"YouTube search API error for {username}: {search_response.status}")
+                    return None
                     
-                    search_data = await search_response.json()
-                    if not search_data.get('items'):
-                        logger.warning(f"No YouTube channel found for username: {username}")
-                        return None
+                search_data = await search_response.json()
+                if not search_data.get('items'):
+                    logger.warning(f"No YouTube channel found for username: {username}")
+                    return None
                     
-                    # Fix: Use correct channel ID extraction for search results
-                    channel_id = search_data['items'][0]['id']['channelId']
+                # Fix: Use correct channel ID extraction for search results
+                channel_id = search_data['items'][0]['id']['channelId']
                 
-                # Get channel details for profile image
-                channels_url = 'https://www.googleapis.com/youtube/v3/channels'
-                params = {
-                    'part': 'snippet',
-                    'id': channel_id,
-                    'key': Config.YOUTUBE_API_KEY
-                }
+            # Get channel details for profile image
+            channels_url = 'https://www.googleapis.com/youtube/v3/channels'
+            params = {
+                'part': 'snippet',
+                'id': channel_id,
+                'key': Config.YOUTUBE_API_KEY
+            }
                 
-                async with session.get(channels_url, params=params) as channel_response:
-                    if channel_response.status != 200:
-                        logger.error(f"YouTube channels API error for {username}: {channel_response.status}")
-                        return None
+            async with session.get(channels_url, params=params, timeout=timeout) as channel_response:
+                if channel_response.status != 200:
+                    logger.error(f"YouTube channels API error for {username}: {channel_response.status}")
+                    return None
                     
-                    channel_data = await channel_response.json()
-                    if not channel_data.get('items'):
-                        logger.warning(f"No YouTube channel details found for {username}")
-                        return None
+                channel_data = await channel_response.json()
+                if not channel_data.get('items'):
+                    logger.warning(f"No YouTube channel details found for {username}")
+                    return None
                     
-                    thumbnails = channel_data['items'][0]['snippet'].get('thumbnails', {})
-                    # Try different thumbnail sizes, prioritizing higher quality
-                    for size in ['high', 'medium', 'default']:
-                        if size in thumbnails:
-                            profile_url = thumbnails[size]['url']
-                            logger.info(f"✅ Successfully fetched YouTube profile image for {username} (size: {size})")
-                            return profile_url
+                thumbnails = channel_data['items'][0]['snippet'].get('thumbnails', {})
+                # Try different thumbnail sizes, prioritizing higher quality
+                for size in ['high', 'medium', 'default']:
+                    if size in thumbnails:
+                        profile_url = thumbnails[size]['url']
+                        logger.info("✅ Successfully fetched YouTube profile image for %s (size: %s)", username, size)
+                        return profile_url
                     
-                    logger.warning(f"No thumbnail URLs found in YouTube response for {username}")
-                    return None
+                logger.warning(f"No thumbnail URLs found in YouTube response for {username}")
+                return None
                     
         except Exception as e:
             logger.error(f"Error fetching YouTube profile image for {username}: {e}")
@@ -1346,6 +1507,40 @@ class ServerInfoView(discord.ui.View):
         
         await interaction.response.edit_message(embed=embed, view=None)
 
+    async def build_platform_demo(self, cfg: PlatformDemo) -> discord.Embed:
+        """Build one Live-Demo embed from its platform config (inkl. echtem Profilbild)"""
+        embed = discord.Embed(
+            description=f"🚨 Hey Cyber-Runner! 🚨\n**{cfg.display_name}** ist jetzt LIVE auf {cfg.platform_label}!\n**Spielt gerade: {cfg.game}** 🎮",
+            color=Config.COLORS[cfg.color_key]
+        )
+
+        # Get REAL profile image via dedicated API call (try all configured usernames)
+        profile_url = None
+        for username in cfg.profile_usernames:
+            if cfg.platform == 'twitch':
+                profile_url = await self.get_twitch_profile_image(username)
+            else:
+                profile_url = await self.get_youtube_profile_image(username)
+            if profile_url:
+                break
+
+        # Profilbild (thumbnail) + Stream-Vorschau (image)
+        embed.set_thumbnail(url=profile_url or cfg.thumbnail_fallback)
+        embed.set_image(url=cfg.image_url)
+
+        if not profile_url:
+            logger.warning("⚠️ Instant Gaming test using placeholder %s profile (API failed)", cfg.platform_label)
+
+        # Stream Details (ohne unwanted text)
+        embed.add_field(name="👀 Zuschauer", value=cfg.viewers, inline=True)
+        embed.add_field(name="🎮 Spiel", value=cfg.game, inline=True)
+        embed.add_field(name=cfg.followers_label, value=cfg.followers_value, inline=True)
+        embed.add_field(name="🔥 Daily Streak", value=cfg.streak, inline=True)
+
+        embed.set_footer(text=cfg.footer)
+        embed.timestamp = datetime.now()
+        return embed
+
     async def run_instant_gaming_test(self, interaction: discord.Interaction):
         """Test Instant Gaming integration mit Live-Demo Embeds für Twitch und YouTube"""
         # Import instant_gaming from main module
@@ -1360,6 +1555,9 @@ class ServerInfoView(discord.ui.View):
             await interaction.response.edit_message(embed=embed, view=None)
             return
 
+        # Let the integration reuse our pooled session instead of opening one per search
+        instant_gaming.session = get_http_session()
+
         # Status Embed
         status_embed = discord.Embed(
             title="🎮 Instant Gaming Integration Test",
@@ -1383,189 +1581,94 @@ class ServerInfoView(discord.ui.View):
         test_games = random.sample(all_test_games, 2)  # Wähle 2 zufällige Spiele
         
         try:
-            logger.info(f"🎮 Testing Instant Gaming search for: {test_games[0]}")
-            cyberpunk_result = await instant_gaming.search_game(test_games[0])
+            logger.info("🎮 Testing Instant Gaming search for: %s", test_games[0])
+            cyberpunk_result = await asyncio.wait_for(instant_gaming.search_game(test_games[0]), timeout=10.0)
             if cyberpunk_result:
-                logger.info(f"✅ Found {test_games[0]} on Instant Gaming")
+                logger.info("✅ Found %s on Instant Gaming", test_games[0])
             else:
-                logger.warning(f"❌ {test_games[0]} not found on Instant Gaming")
+                logger.warning("❌ %s not found on Instant Gaming", test_games[0])
         except Exception as e:
-            logger.error(f"❌ Error searching for {test_games[0]}: {e}")
+            logger.error("❌ Error searching for %s: %s", test_games[0], e)
             cyberpunk_result = None
         
         try:
-            logger.info(f"🎮 Testing Instant Gaming search for: {test_games[1]}")
-            cod_result = await instant_gaming.search_game(test_games[1])
+            logger.info("🎮 Testing Instant Gaming search for: %s", test_games[1])
+            cod_result = await asyncio.wait_for(instant_gaming.search_game(test_games[1]), timeout=10.0)
             if cod_result:
-                logger.info(f"✅ Found {test_games[1]} on Instant Gaming")
+                logger.info("✅ Found %s on Instant Gaming", test_games[1])
             else:
-                logger.warning(f"❌ {test_games[1]} not found on Instant Gaming")
+                logger.warning("❌ %s not found on Instant Gaming", test_games[1])
         except Exception as e:
-            logger.error(f"❌ Error searching for {test_games[1]}: {e}")
+            logger.error("❌ Error searching for %s: %s", test_games[1], e)
             cod_result = None
         
-        # Erstelle TWITCH Live-Demo Embed
-        twitch_demo = discord.Embed(
-            description="🚨 Hey Cyber-Runner! 🚨\n**TikZ aka. Zay** ist jetzt LIVE auf Twitch!\n**Spielt gerade: Cyberpunk 2077** 🎮",
-            color=Config.COLORS['twitch']
+        # Erstelle beide Live-Demo Embeds parallel aus der Plattform-Konfiguration
+        twitch_demo, youtube_demo = await asyncio.gather(
+            self.build_platform_demo(TWITCH_DEMO_CFG),
+            self.build_platform_demo(YOUTUBE_DEMO_CFG)
         )
-        
-        # Get REAL Twitch profile image via dedicated API call
-        tikz_profile_url = await self.get_twitch_profile_image("tikzzay")
-        
-        # Twitch Format: Profilbild (thumbnail) + Stream-Vorschau (image)
-        twitch_demo.set_thumbnail(url=tikz_profile_url or "https://static-cdn.jtvnw.net/user-default-pictures-uv/13e5fa74-defa-11e9-8543-784f43822e80-profile_image-300x300.png")
-        twitch_demo.set_image(url="https://static-cdn.jtvnw.net/ttv-boxart/1091500-440x552.jpg")  # Cyberpunk 2077 game art
-        
-        if not tikz_profile_url:
-            logger.warning("⚠️ Instant Gaming test using placeholder Twitch profile (API failed)")
-        
-        # Stream Details (ohne unwanted text)
-        twitch_demo.add_field(name="👀 Zuschauer", value="1,347", inline=True)
-        twitch_demo.add_field(name="🎮 Spiel", value="Cyberpunk 2077", inline=True)
-        twitch_demo.add_field(name="💖 Follower", value="3,256", inline=True)
-        twitch_demo.add_field(name="🔥 Daily Streak", value="7 Tage", inline=True)
-        
-        twitch_demo.set_footer(text="🟣 Twitch • LIVE-DEMO mit Instant Gaming")
-        twitch_demo.timestamp = datetime.now()
-        
-        # Erstelle YOUTUBE Live-Demo Embed
-        youtube_demo = discord.Embed(
-            description="🚨 Hey Cyber-Runner! 🚨\n**Sturmpelz** ist jetzt LIVE auf YouTube!\n**Spielt gerade: Call of Duty Black Ops 6** 🎮",
-            color=Config.COLORS['youtube']
-        )
-        
-        # Get REAL YouTube profile image via dedicated API call (try multiple usernames)
-        sturmpelz_profile_url = await self.get_youtube_profile_image("@sturmpelz") or await self.get_youtube_profile_image("sturmpelz") or await self.get_youtube_profile_image("sturmpelz2206")
-        
-        # YouTube Format: Profilbild (thumbnail) + Stream-Vorschau (image)
-        youtube_demo.set_thumbnail(url=sturmpelz_profile_url or "https://yt3.ggpht.com/a/default-user=s240-c-k-c0x00ffffff-no-rj")
-        youtube_demo.set_image(url="https://static-cdn.jtvnw.net/ttv-boxart/21779-440x552.jpg")  # Call of Duty game art
-        
-        if not sturmpelz_profile_url:
-            logger.warning("⚠️ Instant Gaming test using placeholder YouTube profile (API failed)")
-        
-        # Stream Details (ohne unwanted text)
-        youtube_demo.add_field(name="👀 Zuschauer", value="892", inline=True)
-        youtube_demo.add_field(name="🎮 Spiel", value="Call of Duty Black Ops 6", inline=True)
-        youtube_demo.add_field(name="📺 Abonnenten", value="2,184", inline=True)
-        youtube_demo.add_field(name="🔥 Daily Streak", value="4 Tage", inline=True)
-        
-        youtube_demo.set_footer(text="🔴 YouTube • LIVE-DEMO mit Instant Gaming")
-        youtube_demo.timestamp = datetime.now()
-        
-        # Twitch View mit direktem Produktlink
-        class TwitchInstantGamingView(discord.ui.View):
-            def __init__(self, cyberpunk_link):
-                super().__init__(timeout=None)
-                # Standard Twitch Buttons
-                self.add_item(discord.ui.Button(
-                    label="Anschauen", emoji="📺", 
-                    url="https://twitch.tv/tikzzay", 
-                    style=discord.ButtonStyle.link, row=0
-                ))
-                self.add_item(discord.ui.Button(
-                    label="Folgen", emoji="❤️", 
-                    url="https://twitch.tv/tikzzay", 
-                    style=discord.ButtonStyle.link, row=0
-                ))
-                # Instant Gaming Button mit direktem Produktlink
-                if cyberpunk_link:
-                    self.add_item(discord.ui.Button(
-                        label="🎮 Cyberpunk 2077 kaufen (-65%)", emoji="💰",
-                        url=cyberpunk_link,
-                        style=discord.ButtonStyle.link, row=1
-                    ))
-        
-        # YouTube View mit direktem Produktlink
-        class YouTubeInstantGamingView(discord.ui.View):
-            def __init__(self, cod_link):
-                super().__init__(timeout=None)
-                # Standard YouTube Buttons
-                self.add_item(discord.ui.Button(
-                    label="Anschauen", emoji="📺", 
-                    url="https://youtube.com/@sturmpelz", 
-                    style=discord.ButtonStyle.link, row=0
-                ))
-                self.add_item(discord.ui.Button(
-                    label="Abonnieren", emoji="❤️", 
-                    url="https://youtube.com/@sturmpelz", 
-                    style=discord.ButtonStyle.link, row=0
-                ))
-                # Instant Gaming Button mit direktem Produktlink
-                if cod_link:
-                    self.add_item(discord.ui.Button(
-                        label="🎮 COD Black Ops 6 kaufen (-50%)", emoji="💰",
-                        url=cod_link,
-                        style=discord.ButtonStyle.link, row=1
-                    ))
-        
-        # Erstelle Views mit direkten Links (Safe Access)
+
+        # Erstelle View mit direkten Links (Safe Access)
         cyberpunk_link = cyberpunk_result.get('affiliate_url') if cyberpunk_result and isinstance(cyberpunk_result, dict) else None
         cod_link = cod_result.get('affiliate_url') if cod_result and isinstance(cod_result, dict) else None
-        
-        twitch_view = TwitchInstantGamingView(cyberpunk_link)
-        youtube_view = YouTubeInstantGamingView(cod_link)
-        
+
+        combined_view = CombinedInstantGamingView([
+            (TWITCH_DEMO_CFG, cyberpunk_link),
+            (YOUTUBE_DEMO_CFG, cod_link)
+        ])
+
         # Sende die Live-Demos
         demo_header = (
             "**💰 LIVE-DEMO: Instant Gaming Integration**\n"
             "*So würden echte Live-Benachrichtigungen mit direkten Produktlinks aussehen:*\n"
             "━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━"
         )
-        
-        # Update Status und sende Demos
-        await interaction.edit_original_response(embed=status_embed, view=None)
-        
-        # Sende Twitch Demo
-        await interaction.followup.send(
-            content=f"{demo_header}\n\n**🟣 TWITCH LIVE-DEMO:**", 
-            embed=twitch_demo, 
-            view=twitch_view, 
-            ephemeral=True
-        )
-        
-        # Sende YouTube Demo
-        await interaction.followup.send(
-            content="**🔴 YOUTUBE LIVE-DEMO:**", 
-            embed=youtube_demo, 
-            view=youtube_view, 
+
+        # Sende beide Demos in EINER Nachricht (1 API-Call statt 2, weniger Rate-Limit-Druck)
+        # (Kein erneutes edit_original_response: status_embed wurde bereits oben gesetzt)
+        await send_with_retry(lambda: interaction.followup.send(
+            content=f"{demo_header}\n\n**🟣 TWITCH LIVE-DEMO / 🔴 YOUTUBE LIVE-DEMO:**",
+            embeds=[twitch_demo, youtube_demo],
+            view=combined_view,
             ephemeral=True
-        )
+        ))
         
         # Abschließender Status mit detaillierten Ergebnissen
-        success_count = sum([1 for link in [cyberpunk_link, cod_link] if link])
+        success_count = bool(cyberpunk_link) + bool(cod_link)
         total_count = 2
         
         status_color = discord.Color.green() if success_count > 0 else discord.Color.orange()
         status_title = "✅ Instant Gaming Test Abgeschlossen" if success_count > 0 else "⚠️ Instant Gaming Test mit Warnungen"
         
+        # Nur die dynamischen Zeilen werden formatiert, das Gerüst ist konstant
+        description_lines = [
+            FINAL_STATUS_HEADER,
+            "",
+            f"🔗 Cyberpunk 2077: {LINK_FOUND if cyberpunk_link else LINK_MISSING}",
+            f"🔗 Call of Duty: {LINK_FOUND if cod_link else LINK_MISSING}",
+            "",
+            f"📊 **Erfolgsrate:** {success_count}/{total_count} Spiele",
+            f"🏷️ **Affiliate Tag:** `{instant_gaming.affiliate_tag}`",
+            "",
+            f"💡 **Demo-Status:** Live-Embeds wurden gesendet {'mit Kaufbuttons' if success_count > 0 else 'ohne Kaufbuttons (Fallback)'}"
+        ]
         final_status = discord.Embed(
             title=status_title,
-            description="**Zwei Live-Demos gesendet!**\n\n"
-                       f"🔗 Cyberpunk 2077: {'✅ Direkter Link gefunden' if cyberpunk_link else '❌ Nicht gefunden/Fehler'}\n"
-                       f"🔗 Call of Duty: {'✅ Direkter Link gefunden' if cod_link else '❌ Nicht gefunden/Fehler'}\n\n"
-                       f"📊 **Erfolgsrate:** {success_count}/{total_count} Spiele\n"
-                       f"🏷️ **Affiliate Tag:** `{instant_gaming.affiliate_tag}`\n\n"
-                       f"💡 **Demo-Status:** Live-Embeds wurden gesendet {'mit Kaufbuttons' if success_count > 0 else 'ohne Kaufbuttons (Fallback)'}",
+            description="\n".join(description_lines),
             color=status_color
         )
-        
+
         if success_count == 0:
             final_status.add_field(
                 name="🔧 Troubleshooting",
-                value="Keine direkten Produktlinks gefunden. Mögliche Ursachen:\n"
-                      "• Temporäre Netzwerkprobleme\n"
-                      "• Instant Gaming Website-Änderungen\n"
-                      "• Spiel momentan nicht verfügbar\n"
-                      "➜ Demo-Embeds funktionieren trotzdem!",
+                value=TROUBLESHOOTING_HINT,
                 inline=False
             )
         
         final_status.set_footer(text="🎮 Integration getestet - Demo vollständig")
         final_status.timestamp = datetime.now()
         
-        await interaction.followup.send(embed=final_status, ephemeral=True)
+        await send_with_retry(lambda: interaction.followup.send(embed=final_status, ephemeral=True))
 
     async def run_custom_message_test(self, interaction: discord.Interaction):
         """Demo custom message functionality with live previews - showing standard vs custom notifications"""
@@ -2141,38 +2244,38 @@ class ServerUnbanModal(discord.ui.Modal):
             )
 
 
+# Platform-specific live URLs and emojis for LiveStreamView buttons.
+# The .format methods are bound once here so the hot loop below does a plain
+# call instead of re-parsing an f-string per button.
+PLATFORMS = {
+    'twitch': ("https://twitch.tv/{}".format, "🟣"),
+    'youtube': ("https://youtube.com/@{}/live".format, "🔴"),
+    'tiktok': ("https://tiktok.com/@{}/live".format, "🔵")
+}
+
+
 class LiveStreamView(discord.ui.View):
+    __slots__ = ('stream_data',)
+
     def __init__(self, stream_data):
         super().__init__(timeout=None)
         self.stream_data = stream_data
-        
+
         # Add watch buttons for each live stream (max 25 buttons)
         for i, stream in enumerate(stream_data[:25]):
-            platform = stream['platform']
-            username = stream['username']
-            display_name = stream['display_name']
-            
-            # Platform-specific URLs
-            if platform == 'twitch':
-                url = f"https://twitch.tv/{username}"
-                emoji = "🟣"
-            elif platform == 'youtube':
-                url = f"https://youtube.com/@{username}/live"
-                emoji = "🔴"
-            elif platform == 'tiktok':
-                url = f"https://tiktok.com/@{username}/live"
-                emoji = "🔵"
-            else:
+            # Table-driven dispatch: one dict lookup instead of an if/elif chain
+            entry = PLATFORMS.get(stream['platform'])
+            if not entry:
                 continue
-            
-            # Create button with emoji and short name
-            button_label = f"{display_name[:15]}"  # Truncate long names
+            url_fmt, emoji = entry
+
+            # Create button with emoji and short name (truncate long names)
             button = discord.ui.Button(
-                label=button_label,
+                label=stream['display_name'][:15],
                 emoji=emoji,
-                url=url,
+                url=url_fmt(stream['username']),
                 style=discord.ButtonStyle.link,
                 row=i // 5  # 5 buttons per row
             )
-            
+
             self.add_item(button)
\ No newline at end of file
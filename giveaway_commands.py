@@ -11,10 +11,81 @@ import logging
 from datetime import datetime, timedelta
 import random
 import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
 
+try:
+    import numpy
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
 logger = logging.getLogger('KARMA-LiveBOT.Giveaway')
 
+# Ab dieser Teilnehmerzahl lohnt sich das numpy-Ziehen ohne Zurücklegen;
+# darunter bleibt random.sample schneller (kein numpy-Overhead)
+_NUMPY_SAMPLE_THRESHOLD = 512
+
+
+def _sample_winners(participants, count):
+    """Zieht `count` Gewinner ohne Zurücklegen aus der Teilnehmerliste"""
+    if NUMPY_AVAILABLE and len(participants) > _NUMPY_SAMPLE_THRESHOLD:
+        rng = numpy.random.default_rng()
+        idx = rng.choice(len(participants), count, replace=False)
+        return [participants[i] for i in idx.tolist()]
+    return random.sample(participants, count)
+
+# Ein einzelner DB-Thread serialisiert alle sqlite-Zugriffe der Giveaways,
+# damit der Event-Loop bei Klick-Ansturm nicht blockiert wird
+_db_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='giveaway-db')
+
+
+def _run_db(func, *args):
+    """Führt eine blockierende DB-Funktion im dedizierten DB-Thread aus"""
+    return asyncio.get_running_loop().run_in_executor(_db_executor, func, *args)
+
+
+def _run_single_write(db, func, *args):
+    """Führt eine einzelne Schreiboperation mit eigener Verbindung und Commit aus"""
+    with db.pool.acquire() as conn:
+        try:
+            result = func(conn, *args)
+            conn.commit()
+            return result
+        except Exception:
+            conn.rollback()
+            raise
+
+
+def _draw_winners_db(db, giveaway_id, winner_count, check_active):
+    """Blockierender DB-Teil des Giveaway-Endes: Gewinner ziehen und deaktivieren"""
+    with db.pool.acquire() as conn:
+        cursor = conn.cursor()
+
+        if check_active:
+            cursor.execute('SELECT is_active FROM giveaways WHERE id = ?', (giveaway_id,))
+            result = cursor.fetchone()
+            if not result or not result[0]:
+                return None, []
+
+        cursor.execute('SELECT user_id FROM giveaway_participants WHERE giveaway_id = ?', (giveaway_id,))
+        participants = [row[0] for row in cursor.fetchall()]
+
+        winners = []
+        if participants:
+            actual_winner_count = min(winner_count, len(participants))
+            winners = _sample_winners(participants, actual_winner_count)
+
+        # Gewinner-Inserts und Deaktivierung in einer Transaktion:
+        # entweder beides wird wirksam oder nichts
+        with conn:
+            if winners:
+                cursor.executemany('INSERT OR IGNORE INTO past_winners (user_id, giveaway_id) VALUES (?, ?)',
+                                   [(winner_id, giveaway_id) for winner_id in winners])
+            cursor.execute('UPDATE giveaways SET is_active = FALSE WHERE id = ?', (giveaway_id,))
+
+    return participants, winners
+
 
 class GiveawayModal(discord.ui.Modal, title='Giveaway erstellen'):
     """Modal für Giveaway-Eingaben"""
@@ -90,32 +161,36 @@ class GiveawayModal(discord.ui.Modal, title='Giveaway erstellen'):
             view = GiveawayView(self.bot, self.db, None)
             message = await self.selected_channel.send(embed=embed, view=view)
             
-            conn = self.db.get_connection()
-            cursor = conn.cursor()
-            cursor.execute('''
-                INSERT INTO giveaways (guild_id, channel_id, message_id, description, keys, 
-                                      duration_minutes, winner_count, image_url, ends_at)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ''', (
-                str(interaction.guild.id),
-                str(self.selected_channel.id),
-                str(message.id),
-                self.description.value,
-                '',
-                duration_minutes,
-                winner_count,
-                self.image_url.value if self.image_url.value else None,
-                ends_at
-            ))
-            giveaway_id = cursor.lastrowid
-            conn.commit()
-            conn.close()
+            with self.db.pool.acquire() as conn:
+                cursor = conn.cursor()
+                cursor.execute('''
+                    INSERT INTO giveaways (guild_id, channel_id, message_id, description, keys,
+                                          duration_minutes, winner_count, image_url, ends_at)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ''', (
+                    str(interaction.guild.id),
+                    str(self.selected_channel.id),
+                    str(message.id),
+                    self.description.value,
+                    '',
+                    duration_minutes,
+                    winner_count,
+                    self.image_url.value if self.image_url.value else None,
+                    ends_at
+                ))
+                giveaway_id = cursor.lastrowid
+                conn.commit()
             
             view.giveaway_id = giveaway_id
             await message.edit(view=view)
+
+            cog = self.bot.get_cog('GiveawayCommands')
+            if cog is not None:
+                async with cog.state_lock:
+                    cog.active_giveaway_ids.add(giveaway_id)
             
-            asyncio.create_task(self._end_giveaway_after_timer(
-                giveaway_id, duration_minutes, message, self.selected_channel, winner_count
+            asyncio.create_task(_run_giveaway_timer(
+                self.bot, self.db, giveaway_id, duration_minutes, message, self.selected_channel, winner_count
             ))
             
             await interaction.followup.send(
@@ -136,83 +211,83 @@ class GiveawayModal(discord.ui.Modal, title='Giveaway erstellen'):
                 ephemeral=True
             )
     
-    async def _end_giveaway_after_timer(self, giveaway_id, duration_minutes, message, channel, winner_count):
-        """Timer-Funktion für automatisches Giveaway-Ende"""
+
+async def _run_giveaway_timer(bot, db, giveaway_id, duration_minutes, message, channel, winner_count):
+    """Timer-Funktion für automatisches Giveaway-Ende"""
+    cog = bot.get_cog('GiveawayCommands')
+    release_event = asyncio.Event()
+
+    if cog is not None:
+        if giveaway_id in cog.pending_timers:
+            logger.info(f'Timer für Giveaway {giveaway_id} läuft bereits, überspringe Duplikat')
+            return
+        cog.pending_timers[giveaway_id] = release_event
+
+    try:
         try:
-            await asyncio.sleep(duration_minutes * 60)
-            
-            conn = self.db.get_connection()
-            cursor = conn.cursor()
-            
-            cursor.execute('SELECT is_active FROM giveaways WHERE id = ?', (giveaway_id,))
-            result = cursor.fetchone()
-            
-            if not result or not result[0]:
-                conn.close()
-                return
-            
-            cursor.execute('SELECT user_id FROM giveaway_participants WHERE giveaway_id = ?', (giveaway_id,))
-            participants = [row[0] for row in cursor.fetchall()]
-            
-            if len(participants) == 0:
-                cursor.execute('UPDATE giveaways SET is_active = FALSE WHERE id = ?', (giveaway_id,))
-                conn.commit()
-                conn.close()
-                
-                await channel.send('😢 Das Giveaway endete ohne Teilnehmer!')
-                
-                try:
-                    embed = message.embeds[0]
-                    embed.color = discord.Color.red()
-                    
-                    # Ändere das "⏰ Endet" Feld zu "🏁 Giveaway Beendet"
-                    for i, field in enumerate(embed.fields):
-                        if field.name == '⏰ Endet':
-                            embed.set_field_at(i, name='🏁 Status', value='Giveaway Beendet', inline=True)
-                            break
-                    
-                    embed.set_footer(text='Giveaway beendet - Keine Teilnehmer')
-                    await message.edit(embed=embed, view=None)
-                except:
-                    pass
+            await asyncio.wait_for(release_event.wait(), timeout=duration_minutes * 60)
+            # Event gesetzt: Timer wurde vorzeitig freigegeben (z.B. Shutdown)
+            return
+        except asyncio.TimeoutError:
+            pass  # Regulärer Ablauf -> Gewinner ziehen
+
+        participants, winners = await _run_db(_draw_winners_db, db, giveaway_id, winner_count, True)
+
+        if participants is None:
+            return
+
+        if cog is not None:
+            async with cog.state_lock:
+                cog.active_giveaway_ids.discard(giveaway_id)
+                cog.past_winner_ids.update(winners)
+
+        if len(participants) == 0:
+            await channel.send('😢 Das Giveaway endete ohne Teilnehmer!')
                 
-                return
-            
-            actual_winner_count = min(winner_count, len(participants))
-            winners = random.sample(participants, actual_winner_count)
-            
-            for winner_id in winners:
-                cursor.execute('INSERT OR IGNORE INTO past_winners (user_id, giveaway_id) VALUES (?, ?)',
-                              (winner_id, giveaway_id))
-            
-            cursor.execute('UPDATE giveaways SET is_active = FALSE WHERE id = ?', (giveaway_id,))
-            conn.commit()
-            conn.close()
-            
-            winner_mentions = [f'<@{winner_id}>' for winner_id in winners]
-            winner_text = ', '.join(winner_mentions)
-            
-            await channel.send(f'🎉 **GEWINNER:** {winner_text}\n\nGlückwunsch! Die Keys werden vom Admin vergeben.')
-            
             try:
                 embed = message.embeds[0]
-                embed.color = discord.Color.green()
-                
+                embed.color = discord.Color.red()
+                    
                 # Ändere das "⏰ Endet" Feld zu "🏁 Giveaway Beendet"
                 for i, field in enumerate(embed.fields):
                     if field.name == '⏰ Endet':
                         embed.set_field_at(i, name='🏁 Status', value='Giveaway Beendet', inline=True)
                         break
-                
-                embed.set_footer(text=f'Giveaway beendet - Gewinner: {len(winners)}')
+                    
+                embed.set_footer(text='Giveaway beendet - Keine Teilnehmer')
                 await message.edit(embed=embed, view=None)
             except:
                 pass
+
+            return
+
+        winner_mentions = [f'<@{winner_id}>' for winner_id in winners]
+        winner_text = ', '.join(winner_mentions)
             
-            logger.info(f'Giveaway {giveaway_id} beendet - Gewinner: {winners}')
+        await channel.send(f'🎉 **GEWINNER:** {winner_text}\n\nGlückwunsch! Die Keys werden vom Admin vergeben.')
             
-        except Exception as e:
-            logger.error(f'Fehler beim Beenden des Giveaways {giveaway_id}: {e}')
+        try:
+            embed = message.embeds[0]
+            embed.color = discord.Color.green()
+                
+            # Ändere das "⏰ Endet" Feld zu "🏁 Giveaway Beendet"
+            for i, field in enumerate(embed.fields):
+                if field.name == '⏰ Endet':
+                    embed.set_field_at(i, name='🏁 Status', value='Giveaway Beendet', inline=True)
+                    break
+                
+            embed.set_footer(text=f'Giveaway beendet - Gewinner: {len(winners)}')
+            await message.edit(embed=embed, view=None)
+        except:
+            pass
+            
+        logger.info(f'Giveaway {giveaway_id} beendet - Gewinner: {winners}')
+            
+    except Exception as e:
+        logger.error(f'Fehler beim Beenden des Giveaways {giveaway_id}: {e}')
+    finally:
+        if cog is not None:
+            cog.pending_timers.pop(giveaway_id, None)
 
 
 class ChannelSelectView(discord.ui.View):
@@ -246,7 +321,53 @@ class GiveawayView(discord.ui.View):
         self.bot = bot
         self.db = db
         self.giveaway_id = giveaway_id
-    
+
+    def _try_join(self, conn, user_id, skip_winner_check=False):
+        """Blockierender DB-Teil der Teilnahme; läuft im DB-Thread.
+
+        Arbeitet auf einer übergebenen Verbindung, Commit macht der
+        Einzel-Schreiber für den ganzen Batch. Der Erfolgsfall (heißer
+        Pfad) kommt mit einem einzigen bedingten INSERT plus
+        Teilnehmer-COUNT aus; nur bei Ablehnung wird der genaue Grund
+        nachgeschlagen. Wurde die Gewinner-Sperre bereits über das
+        In-Memory-Abbild geprüft, entfällt die past_winners-Subquery.
+        """
+        cursor = conn.cursor()
+
+        if skip_winner_check:
+            cursor.execute('''
+                INSERT OR IGNORE INTO giveaway_participants (giveaway_id, user_id)
+                SELECT ?, ?
+                WHERE EXISTS(SELECT 1 FROM giveaways WHERE id = ? AND is_active)
+            ''', (self.giveaway_id, user_id, self.giveaway_id))
+        else:
+            cursor.execute('''
+                INSERT OR IGNORE INTO giveaway_participants (giveaway_id, user_id)
+                SELECT ?, ?
+                WHERE EXISTS(SELECT 1 FROM giveaways WHERE id = ? AND is_active)
+                  AND NOT EXISTS(SELECT 1 FROM past_winners WHERE user_id = ?)
+            ''', (self.giveaway_id, user_id, self.giveaway_id, user_id))
+        joined = cursor.rowcount > 0
+
+        if joined:
+            cursor.execute(
+                'SELECT COUNT(*) FROM giveaway_participants WHERE giveaway_id = ?',
+                (self.giveaway_id,)
+            )
+            return 'joined', cursor.fetchone()[0]
+
+        # Ablehnungsgrund für die ephemere Antwort ermitteln (seltener Pfad)
+        cursor.execute('SELECT is_active FROM giveaways WHERE id = ?', (self.giveaway_id,))
+        result = cursor.fetchone()
+        if not result or not result[0]:
+            return 'inactive', 0
+
+        cursor.execute('SELECT COUNT(*) FROM past_winners WHERE user_id = ?', (user_id,))
+        if cursor.fetchone()[0] > 0:
+            return 'has_won', 0
+
+        return 'already_joined', 0
+
     @discord.ui.button(label='🎟️ Teilnehmen', style=discord.ButtonStyle.primary, custom_id='giveaway_join')
     async def join_button(self, interaction: discord.Interaction, button: discord.ui.Button):
         try:
@@ -256,72 +377,76 @@ class GiveawayView(discord.ui.View):
                     ephemeral=True
                 )
                 return
-            
-            conn = self.db.get_connection()
-            cursor = conn.cursor()
-            
-            cursor.execute('SELECT is_active FROM giveaways WHERE id = ?', (self.giveaway_id,))
-            result = cursor.fetchone()
-            
-            if not result or not result[0]:
-                conn.close()
+
+            # Triviale Ablehnungen aus dem In-Memory-Abbild beantworten, ohne
+            # die Datenbank anzufassen; das INSERT bleibt die letzte Instanz
+            cog = self.bot.get_cog('GiveawayCommands')
+            if cog is not None and cog.state_loaded:
+                if self.giveaway_id not in cog.active_giveaway_ids:
+                    await interaction.response.send_message(
+                        '❌ Dieses Giveaway ist bereits beendet!',
+                        ephemeral=True
+                    )
+                    return
+
+                if str(interaction.user.id) in cog.past_winner_ids:
+                    await interaction.response.send_message(
+                        '💖 Oh nein… du kannst heute leider nicht erneut teilnehmen 😢 Pro Person ist nur ein Gewinn pro Tag möglich.🍀 Der Veranstalter wird sich privat bei dir melden, um dir deinen Gewinn zu übergeben. Danke für dein Verständnis und dass du ein Teil meiner Community bist! #EhrenMann / #EhrenFrau ✨💎',
+                        ephemeral=True
+                    )
+                    return
+
+            # Ist das Abbild geladen, wurde 'bereits gewonnen' oben schon
+            # ausgeschlossen und das INSERT kann auf die Subquery verzichten
+            state_verified = cog is not None and cog.state_loaded
+            if cog is not None:
+                status, total_participants = await cog.enqueue_write(
+                    self._try_join, str(interaction.user.id), state_verified
+                )
+            else:
+                status, total_participants = await _run_db(
+                    _run_single_write, self.db, self._try_join, str(interaction.user.id), state_verified
+                )
+
+            if status == 'inactive':
                 await interaction.response.send_message(
                     '❌ Dieses Giveaway ist bereits beendet!',
                     ephemeral=True
                 )
                 return
-            
-            cursor.execute('SELECT COUNT(*) FROM past_winners WHERE user_id = ?', (str(interaction.user.id),))
-            has_won = cursor.fetchone()[0] > 0
-            
-            if has_won:
-                conn.close()
+
+            if status == 'has_won':
                 await interaction.response.send_message(
                     '💖 Oh nein… du kannst heute leider nicht erneut teilnehmen 😢 Pro Person ist nur ein Gewinn pro Tag möglich.🍀 Der Veranstalter wird sich privat bei dir melden, um dir deinen Gewinn zu übergeben. Danke für dein Verständnis und dass du ein Teil meiner Community bist! #EhrenMann / #EhrenFrau ✨💎',
                     ephemeral=True
                 )
                 return
-            
-            cursor.execute(
-                'SELECT COUNT(*) FROM giveaway_participants WHERE giveaway_id = ? AND user_id = ?',
-                (self.giveaway_id, str(interaction.user.id))
-            )
-            already_joined = cursor.fetchone()[0] > 0
-            
-            if already_joined:
-                conn.close()
+
+            if status == 'already_joined':
                 await interaction.response.send_message(
                     '❌ Du nimmst bereits an diesem Giveaway teil!',
                     ephemeral=True
                 )
                 return
-            
-            cursor.execute(
-                'INSERT INTO giveaway_participants (giveaway_id, user_id) VALUES (?, ?)',
-                (self.giveaway_id, str(interaction.user.id))
-            )
-            conn.commit()
-            
-            cursor.execute(
-                'SELECT COUNT(*) FROM giveaway_participants WHERE giveaway_id = ?',
-                (self.giveaway_id,)
-            )
-            total_participants = cursor.fetchone()[0]
-            conn.close()
-            
-            try:
-                message = interaction.message
-                embed = message.embeds[0]
-                
-                for i, field in enumerate(embed.fields):
-                    if field.name == '👥 Teilnehmer':
-                        embed.set_field_at(i, name='👥 Teilnehmer', value=str(total_participants), inline=True)
-                        break
-                
-                await message.edit(embed=embed)
-            except:
-                pass
-            
+
+            # Embed-Update entprellen: bei Klick-Ansturm wird der Teilnehmerstand
+            # höchstens alle 3 Sekunden pro Giveaway an Discord geschickt
+            if cog is not None:
+                cog.dirty_counts[self.giveaway_id] = (interaction.message, total_participants)
+                if self.giveaway_id not in cog.flush_pending:
+                    cog.flush_pending.add(self.giveaway_id)
+                    asyncio.get_running_loop().call_later(
+                        3.0,
+                        lambda gid=self.giveaway_id: asyncio.create_task(cog._flush_participant_count(gid))
+                    )
+            else:
+                try:
+                    embed = interaction.message.embeds[0]
+                    embed.set_field_at(2, name='👥 Teilnehmer', value=str(total_participants), inline=True)
+                    await interaction.message.edit(embed=embed)
+                except:
+                    pass
+
             await interaction.response.send_message(
                 f'✅ Du nimmst jetzt am Giveaway teil! (Teilnehmer: {total_participants})',
                 ephemeral=True
@@ -342,92 +467,209 @@ class GiveawayCommands(commands.Cog):
     def __init__(self, bot, db):
         self.bot = bot
         self.db = db
+        # In-Memory-Abbild für den heißen Join-Pfad: Button-Klicks auf beendete
+        # Giveaways oder von Alt-Gewinnern kommen so ganz ohne DB-Zugriff aus
+        self.active_giveaway_ids = set()
+        self.past_winner_ids = set()
+        self.state_loaded = False
+        self.state_lock = asyncio.Lock()
+        # Laufende Giveaway-Timer: giveaway_id -> Freigabe-Event.
+        # Verhindert doppelte Timer nach Restore und erlaubt sauberes Beenden
+        self.pending_timers = {}
+        # Entprellte Embed-Updates: giveaway_id -> (Message, letzter Stand)
+        self.dirty_counts = {}
+        self.flush_pending = set()
+        # Einzel-Schreiber: gesammelte Schreiboperationen laufen über eine
+        # Queue und werden gebündelt mit einem Commit pro Batch ausgeführt
+        self._write_q = asyncio.Queue()
         self.restore_active_giveaways.start()
-    
+        self.wal_checkpoint_loop.start()
+        self.write_worker.start()
+
     def cog_unload(self):
         self.restore_active_giveaways.cancel()
-    
+        self.wal_checkpoint_loop.cancel()
+        self.write_worker.cancel()
+        # Wartende Timer sofort freigeben statt sie weiterschlafen zu lassen
+        for release_event in self.pending_timers.values():
+            release_event.set()
+
+    async def enqueue_write(self, func, *args):
+        """Reiht eine Schreiboperation beim Einzel-Schreiber ein und wartet auf ihr Ergebnis"""
+        fut = asyncio.get_running_loop().create_future()
+        await self._write_q.put((func, args, fut))
+        return await fut
+
+    def _run_write_batch(self, batch):
+        """Führt einen Batch Schreiboperationen mit einer Verbindung und einem Commit aus"""
+        results = []
+        with self.db.pool.acquire() as conn:
+            for func, args, _ in batch:
+                # SAVEPOINT pro Operation: ein Fehler verwirft nur diese eine
+                # Operation statt per rollback() auch alle bereits gelungenen
+                # Schreibvorgänge des Batches zu verwerfen
+                conn.execute('SAVEPOINT write_op')
+                try:
+                    results.append(func(conn, *args))
+                    conn.execute('RELEASE SAVEPOINT write_op')
+                except Exception as e:
+                    conn.execute('ROLLBACK TO SAVEPOINT write_op')
+                    conn.execute('RELEASE SAVEPOINT write_op')
+                    results.append(e)
+            conn.commit()
+        return results
+
     @tasks.loop(count=1)
-    async def restore_active_giveaways(self):
-        """Stelle aktive Giveaways nach Bot-Neustart wieder her"""
+    async def write_worker(self):
+        """Verbraucht die Schreib-Queue: N Joins -> ein Commit/fsync"""
+        while True:
+            item = await self._write_q.get()
+            batch = [item]
+
+            # Kurz hintereinander eingereihte Operationen mitnehmen
+            while len(batch) < 128:
+                try:
+                    batch.append(self._write_q.get_nowait())
+                except asyncio.QueueEmpty:
+                    break
+
+            try:
+                results = await _run_db(self._run_write_batch, batch)
+            except Exception as e:
+                results = [e] * len(batch)
+
+            for (_, _, fut), result in zip(batch, results):
+                if fut.done():
+                    continue
+                if isinstance(result, Exception):
+                    fut.set_exception(result)
+                else:
+                    fut.set_result(result)
+
+    def _wal_checkpoint(self):
+        """Blockierender WAL-Checkpoint; läuft im DB-Thread"""
+        with self.db.pool.acquire() as conn:
+            conn.execute('PRAGMA wal_checkpoint(TRUNCATE)')
+
+    @tasks.loop(minutes=15)
+    async def wal_checkpoint_loop(self):
+        """Hält die WAL-Datei klein, ohne Schreiber zu blockieren"""
+        try:
+            await _run_db(self._wal_checkpoint)
+        except Exception as e:
+            logger.error(f'Fehler beim WAL-Checkpoint: {e}')
+
+    @wal_checkpoint_loop.before_loop
+    async def before_wal_checkpoint(self):
         await self.bot.wait_until_ready()
-        
+
+    async def _flush_participant_count(self, giveaway_id):
+        """Schreibt den gesammelten Teilnehmerstand gebündelt ins Giveaway-Embed"""
+        self.flush_pending.discard(giveaway_id)
+        entry = self.dirty_counts.pop(giveaway_id, None)
+        if entry is None:
+            return
+
+        message, total_participants = entry
         try:
-            conn = self.db.get_connection()
+            embed = message.embeds[0]
+            # Feld 2 ist immer '👥 Teilnehmer' (siehe GiveawayModal.on_submit)
+            embed.set_field_at(2, name='👥 Teilnehmer', value=str(total_participants), inline=True)
+            await message.edit(embed=embed)
+        except Exception as e:
+            logger.debug(f'Embed-Update für Giveaway {giveaway_id} fehlgeschlagen: {e}')
+
+    def _load_past_winner_ids(self):
+        """Blockierendes Laden aller bisherigen Gewinner-IDs; läuft im DB-Thread"""
+        with self.db.pool.acquire() as conn:
+            cursor = conn.cursor()
+            cursor.execute('SELECT user_id FROM past_winners')
+            return {row[0] for row in cursor.fetchall()}
+
+    def _load_active_giveaways(self):
+        """Blockierendes Laden der aktiven Giveaways; läuft im DB-Thread"""
+        with self.db.pool.acquire() as conn:
             cursor = conn.cursor()
-            
             cursor.execute('''
                 SELECT id, channel_id, message_id, duration_minutes, winner_count, ends_at
                 FROM giveaways
                 WHERE is_active = TRUE
             ''')
-            active_giveaways = cursor.fetchall()
-            conn.close()
-            
-            for giveaway_id, channel_id, message_id, duration_minutes, winner_count, ends_at_str in active_giveaways:
-                try:
-                    channel = self.bot.get_channel(int(channel_id))
-                    if not channel:
-                        continue
-                    
-                    message = await channel.fetch_message(int(message_id))
-                    if not message:
-                        continue
-                    
-                    ends_at = datetime.fromisoformat(ends_at_str)
-                    remaining_seconds = (ends_at - datetime.now()).total_seconds()
-                    
-                    view = GiveawayView(self.bot, self.db, giveaway_id)
-                    await message.edit(view=view)
-                    
-                    if remaining_seconds <= 0:
-                        logger.info(f'Giveaway {giveaway_id} bereits abgelaufen, beende es jetzt')
-                        asyncio.create_task(self._end_giveaway_now(giveaway_id, message, channel, winner_count))
-                    else:
-                        remaining_minutes = remaining_seconds / 60
-                        logger.info(f'Stelle Giveaway {giveaway_id} wieder her, verbleibend: {remaining_minutes:.1f} Minuten')
-                        
-                        modal_instance = GiveawayModal(self.bot, self.db, channel)
-                        asyncio.create_task(modal_instance._end_giveaway_after_timer(
-                            giveaway_id, remaining_minutes, message, channel, winner_count
-                        ))
-                
-                except Exception as e:
-                    logger.error(f'Fehler beim Wiederherstellen von Giveaway {giveaway_id}: {e}')
-            
+            return cursor.fetchall()
+
+    @tasks.loop(count=1)
+    async def restore_active_giveaways(self):
+        """Stelle aktive Giveaways nach Bot-Neustart wieder her"""
+        await self.bot.wait_until_ready()
+
+        try:
+            active_giveaways = await _run_db(self._load_active_giveaways)
+            past_winner_ids = await _run_db(self._load_past_winner_ids)
+
+            async with self.state_lock:
+                self.active_giveaway_ids = {row[0] for row in active_giveaways}
+                self.past_winner_ids = past_winner_ids
+                self.state_loaded = True
+
+            # Nachrichten parallel holen statt nacheinander; die Semaphore
+            # hält die fetch_message-Rate unter dem Discord-Limit
+            semaphore = asyncio.Semaphore(10)
+            await asyncio.gather(
+                *(self._restore_one(row, semaphore) for row in active_giveaways),
+                return_exceptions=True
+            )
+
             logger.info(f'✅ {len(active_giveaways)} aktive Giveaways wiederhergestellt')
             
         except Exception as e:
             logger.error(f'Fehler beim Wiederherstellen der Giveaways: {e}')
     
+    async def _restore_one(self, row, semaphore):
+        """Stellt ein einzelnes aktives Giveaway wieder her"""
+        giveaway_id, channel_id, message_id, duration_minutes, winner_count, ends_at_str = row
+        try:
+            channel = self.bot.get_channel(int(channel_id))
+            if not channel:
+                return
+
+            async with semaphore:
+                message = await channel.fetch_message(int(message_id))
+            if not message:
+                return
+
+            ends_at = datetime.fromisoformat(ends_at_str)
+            remaining_seconds = (ends_at - datetime.now()).total_seconds()
+
+            view = GiveawayView(self.bot, self.db, giveaway_id)
+            await message.edit(view=view)
+
+            if remaining_seconds <= 0:
+                logger.info(f'Giveaway {giveaway_id} bereits abgelaufen, beende es jetzt')
+                asyncio.create_task(self._end_giveaway_now(giveaway_id, message, channel, winner_count))
+            else:
+                remaining_minutes = remaining_seconds / 60
+                logger.info(f'Stelle Giveaway {giveaway_id} wieder her, verbleibend: {remaining_minutes:.1f} Minuten')
+
+                asyncio.create_task(_run_giveaway_timer(
+                    self.bot, self.db, giveaway_id, remaining_minutes, message, channel, winner_count
+                ))
+
+        except Exception as e:
+            logger.error(f'Fehler beim Wiederherstellen von Giveaway {giveaway_id}: {e}')
+
     async def _end_giveaway_now(self, giveaway_id, message, channel, winner_count):
         """Beendet ein abgelaufenes Giveaway sofort"""
         try:
-            conn = self.db.get_connection()
-            cursor = conn.cursor()
-            
-            cursor.execute('SELECT user_id FROM giveaway_participants WHERE giveaway_id = ?', (giveaway_id,))
-            participants = [row[0] for row in cursor.fetchall()]
-            
+            participants, winners = await _run_db(_draw_winners_db, self.db, giveaway_id, winner_count, False)
+
+            async with self.state_lock:
+                self.active_giveaway_ids.discard(giveaway_id)
+                self.past_winner_ids.update(winners)
+
             if len(participants) == 0:
-                cursor.execute('UPDATE giveaways SET is_active = FALSE WHERE id = ?', (giveaway_id,))
-                conn.commit()
-                conn.close()
-                
                 await channel.send('😢 Das Giveaway endete ohne Teilnehmer!')
                 return
-            
-            actual_winner_count = min(winner_count, len(participants))
-            winners = random.sample(participants, actual_winner_count)
-            
-            for winner_id in winners:
-                cursor.execute('INSERT OR IGNORE INTO past_winners (user_id, giveaway_id) VALUES (?, ?)',
-                              (winner_id, giveaway_id))
-            
-            cursor.execute('UPDATE giveaways SET is_active = FALSE WHERE id = ?', (giveaway_id,))
-            conn.commit()
-            conn.close()
-            
+
             winner_mentions = [f'<@{winner_id}>' for winner_id in winners]
             winner_text = ', '.join(winner_mentions)
             
@@ -469,16 +711,18 @@ class GiveawayCommands(commands.Cog):
     async def reset_winners(self, interaction: discord.Interaction):
         """Löscht alle gespeicherten Gewinner aus der Datenbank"""
         try:
-            conn = self.db.get_connection()
-            cursor = conn.cursor()
-            
-            cursor.execute('SELECT COUNT(*) FROM past_winners')
-            count = cursor.fetchone()[0]
-            
-            cursor.execute('DELETE FROM past_winners')
-            conn.commit()
-            conn.close()
-            
+            with self.db.pool.acquire() as conn:
+                cursor = conn.cursor()
+
+                cursor.execute('SELECT COUNT(*) FROM past_winners')
+                count = cursor.fetchone()[0]
+
+                cursor.execute('DELETE FROM past_winners')
+                conn.commit()
+
+            async with self.state_lock:
+                self.past_winner_ids.clear()
+
             await interaction.response.send_message(
                 f'✅ Alle {count} Gewinner wurden zurückgesetzt! Sie können jetzt wieder an Giveaways teilnehmen.',
                 ephemeral=True
@@ -4,29 +4,179 @@ Instant Gaming Module for KARMA-LiveBOT
 Handles Instant Gaming affiliate link generation and game search
 """
 
+import asyncio
+import functools
+import json
 import logging
+import re
 import time
 import difflib
+from collections import OrderedDict
+from html import unescape
 from typing import Optional, Dict
 import aiohttp
 from bs4 import BeautifulSoup
 
+from database import run_db
+
+# Prefer the C-based lexbor parser when available (much faster than html.parser)
+try:
+    from selectolax.lexbor import LexborHTMLParser
+    SELECTOLAX_AVAILABLE = True
+except ImportError:
+    SELECTOLAX_AVAILABLE = False
+
+# Prefer RapidFuzz for title matching when available (C++, much faster than difflib)
+try:
+    from rapidfuzz import process as rf_process, fuzz as rf_fuzz
+    RAPIDFUZZ_AVAILABLE = True
+except ImportError:
+    RAPIDFUZZ_AVAILABLE = False
+
 logger = logging.getLogger('KARMA-LiveBOT.InstantGaming')
 
+# Fast path: the search page only needs href + img alt per product card,
+# which a single regex scan extracts without building a DOM tree
+PRODUCT_RE = re.compile(r'<a[^>]+class="[^"]*cover[^"]*"[^>]+href="([^"]+)"[^>]*>\s*<img[^>]+alt="([^"]+)"', re.I)
+
+
+# Special cases for better matching (direct O(1) lookup)
+SPECIAL_CASES = {
+    "call of duty": "call of duty black ops 6",
+    "cod": "call of duty black ops 6",
+    "warzone": "call of duty warzone",
+    "fortnite": "fortnite",
+    "minecraft": "minecraft java edition",
+    "gta": "grand theft auto v",
+    "gta 5": "grand theft auto v",
+    "gta v": "grand theft auto v"
+}
+
+# Edition keywords that can interfere with search, stripped in one regex pass
+BAD_RE = re.compile(r'\b(?:edition|deluxe|ultimate|season|beta|early access|definitive|complete|goty|remastered)\b')
+
+# Punctuation cleanup as a single translate pass
+PUNCT_TBL = str.maketrans({':': '', '-': ' ', '_': ' '})
+
+
+def _best_match(game_name: str, normalized_game: str, product_titles: list):
+    """Find the best matching product title, returning (index, confidence) or None"""
+    if RAPIDFUZZ_AVAILABLE:
+        match = (rf_process.extractOne(game_name, product_titles, scorer=rf_fuzz.WRatio, score_cutoff=40)
+                 or rf_process.extractOne(normalized_game, product_titles, scorer=rf_fuzz.WRatio, score_cutoff=30))
+        if match:
+            _, score, index = match
+            return index, score / 100
+        return None
+
+    # Fallback: pure-Python difflib matching
+    best_matches = difflib.get_close_matches(game_name, product_titles, n=1, cutoff=0.4)
+    if not best_matches:
+        # If no close match with original name, try with normalized name
+        best_matches = difflib.get_close_matches(normalized_game, product_titles, n=1, cutoff=0.3)
+
+    if best_matches:
+        best_title = best_matches[0]
+        index = product_titles.index(best_title)
+        confidence = difflib.SequenceMatcher(None, game_name.lower(), best_title.lower()).ratio()
+        return index, confidence
+
+    return None
+
+
+@functools.lru_cache(maxsize=4096)
+def _normalize_game_name_cached(game: str) -> str:
+    """Normalize an already-lowercased game name (cached: streamers repeat titles)"""
+    game = SPECIAL_CASES.get(game.strip(), game)
+    game = BAD_RE.sub('', game)
+    game = game.translate(PUNCT_TBL)
+    return " ".join(game.split())
+
+# Sentinel to distinguish "not cached" from a cached negative result
+_CACHE_MISS = object()
+
+
+class _TTLCache:
+    """Bounded LRU cache with per-entry TTL (keeps long uptimes from leaking memory)"""
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data = OrderedDict()  # key -> (value, timestamp)
+
+    def get(self, key, default=None):
+        entry = self._data.get(key)
+        if entry is None:
+            return default
+
+        value, timestamp = entry
+        if time.time() - timestamp >= self.ttl:
+            del self._data[key]
+            return default
+
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key, value, timestamp=None):
+        self._data[key] = (value, timestamp if timestamp is not None else time.time())
+        self._data.move_to_end(key)
+        if len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def clear(self):
+        self._data.clear()
+
+
 class InstantGamingAPI:
     """Integration for Instant Gaming game searches and affiliate links"""
-    
-    def __init__(self, db=None):
+
+    # Headers to appear like a real browser (built once, not per request)
+    DEFAULT_HEADERS = {
+        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+        'Accept-Language': 'de-DE,de;q=0.9,en;q=0.8',
+        'Accept-Encoding': 'gzip, deflate, br',
+        'Connection': 'keep-alive',
+        'Upgrade-Insecure-Requests': '1',
+        'Cache-Control': 'no-cache',
+        'Pragma': 'no-cache'
+    }
+
+    def __init__(self, db=None, session: Optional[aiohttp.ClientSession] = None):
         self.db = db
+        self.session = session  # Optional shared aiohttp session (avoids per-call TLS handshakes)
+        self._own_session: Optional[aiohttp.ClientSession] = None  # Lazily created fallback session
         self.search_base_url = "https://www.instant-gaming.com/en/search/"
-        self.cache = {}  # Cache search results to avoid repeated requests
         self.cache_duration = 1800  # 30 minutes cache
-    
+        self.cache = _TTLCache(maxsize=4096, ttl=self.cache_duration)  # Bounded search cache
+        self._inflight = {}  # Per-game in-flight Futures so concurrent searches hit the network only once
+        self._known_empty = set()  # Normalized names that yielded no products at all
+        self._known_empty_reset = time.time()  # Rotated daily so delistings are picked up
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Return a reusable HTTP session, preferring an injected shared one"""
+        if self.session is not None and not self.session.closed:
+            return self.session
+
+        if self._own_session is None or self._own_session.closed:
+            self._own_session = aiohttp.ClientSession(
+                timeout=aiohttp.ClientTimeout(total=15),
+                connector=aiohttp.TCPConnector(limit_per_host=8, ttl_dns_cache=300, keepalive_timeout=60),
+                headers=self.DEFAULT_HEADERS,
+                auto_decompress=True  # with brotli installed this covers 'br' responses too
+            )
+        return self._own_session
+
+    async def close(self):
+        """Close the lazily created session (injected sessions stay open)"""
+        if self._own_session is not None and not self._own_session.closed:
+            await self._own_session.close()
+
     def get_affiliate_tag(self) -> str:
         """Get the current affiliate tag from database"""
         if not self.db:
             return "tikzzay"  # Fallback to default
-        
+
         try:
             conn = self.db.get_connection()
             cursor = conn.cursor()
@@ -37,163 +187,251 @@ class InstantGamingAPI:
         except Exception as e:
             logger.error(f"Error reading affiliate tag from database: {e}")
             return "tikzzay"
-    
+
     def clear_cache(self):
-        """Clear the search cache to force fresh requests"""
+        """Clear the search cache (memory and sqlite) to force fresh requests"""
         self.cache.clear()
+
+        if self.db:
+            try:
+                with self.db.pool.acquire() as conn:
+                    conn.execute('DELETE FROM ig_cache')
+                    conn.commit()
+            except Exception as e:
+                logger.error(f"Error clearing ig_cache table: {e}")
+
         logger.info("Instant Gaming cache cleared")
-    
+
     def normalize_game_name(self, game: str) -> str:
         """Normalize game name for better matching on Instant Gaming"""
-        game = game.lower()
-        
-        # Handle special cases for better matching
-        special_cases = {
-            "call of duty": "call of duty black ops 6",
-            "cod": "call of duty black ops 6",
-            "warzone": "call of duty warzone",
-            "fortnite": "fortnite",
-            "minecraft": "minecraft java edition",
-            "gta": "grand theft auto v",
-            "gta 5": "grand theft auto v",
-            "gta v": "grand theft auto v"
-        }
-        
-        # Check for special cases first
-        for key, replacement in special_cases.items():
-            if game.strip() == key:
-                game = replacement
-                break
-        
-        # Remove edition keywords that can interfere with search
-        for bad in ["edition", "deluxe", "ultimate", "season", "beta", "early access", "definitive", "complete", "goty", "remastered"]:
-            game = game.replace(bad, "")
-        
-        # Clean up punctuation and extra spaces
-        game = game.replace(":", "").replace("-", " ").replace("_", " ")
-        return " ".join(game.split())
-    
+        return _normalize_game_name_cached(game.lower())
+
+    def _cache_get_db(self, cache_key: str) -> Optional[Dict]:
+        """Load a cached search payload from sqlite, or None if missing/expired
+
+        Blocking - call via run_db so the event loop isn't stalled."""
+        if not self.db:
+            return None
+
+        try:
+            with self.db.pool.acquire() as conn:
+                cursor = conn.cursor()
+                cursor.execute('SELECT payload, ts FROM ig_cache WHERE key = ?', (cache_key,))
+                row = cursor.fetchone()
+
+            if row and time.time() - row[1] < self.cache_duration:
+                payload = json.loads(row[0]) if row[0] is not None else None
+                return {'data': payload, 'timestamp': row[1]}
+        except Exception as e:
+            logger.error(f"Error reading ig_cache: {e}")
+
+        return None
+
+    def _cache_put_db(self, cache_key: str, data: Optional[Dict], timestamp: float):
+        """Persist a search result (or negative result) to the sqlite cache
+
+        Blocking - call via run_db so the event loop isn't stalled."""
+        if not self.db:
+            return
+
+        try:
+            with self.db.pool.acquire() as conn:
+                conn.execute('INSERT OR REPLACE INTO ig_cache (key, payload, ts) VALUES (?, ?, ?)',
+                             (cache_key, json.dumps(data) if data is not None else None, int(timestamp)))
+                conn.commit()
+        except Exception as e:
+            logger.error(f"Error writing ig_cache: {e}")
+
     async def search_game(self, game_name: str) -> Optional[Dict]:
         """Search for a game on Instant Gaming with smart matching and return direct product link"""
         if not game_name or not game_name.strip():
             return None
-        
+
         # Normalize game name for better search results
         normalized_game = self.normalize_game_name(game_name)
         cache_key = f"instant_gaming_{normalized_game}"
-        current_time = time.time()
-        
-        # Check cache first
-        if cache_key in self.cache:
-            cached_data = self.cache[cache_key]
-            if current_time - cached_data['timestamp'] < self.cache_duration:
-                logger.info(f"Using cached Instant Gaming data for {game_name}")
-                return cached_data['data']
-        
+
+        # Check cache first (expiry and eviction handled by the cache itself)
+        cached = self.cache.get(cache_key, _CACHE_MISS)
+        if cached is not _CACHE_MISS:
+            logger.info(f"Using cached Instant Gaming data for {game_name}")
+            return cached
+
+        # Known-empty titles ("Just Chatting", "IRL", ...) skip the network
+        # entirely; the set rotates daily so new listings are still found
+        if time.time() - self._known_empty_reset > 86400:
+            self._known_empty.clear()
+            self._known_empty_reset = time.time()
+
+        if normalized_game in self._known_empty:
+            logger.info(f"Skipping Instant Gaming search for known-empty game: {game_name}")
+            return None
+
+        # Coalesce concurrent lookups: the first caller fetches, everyone
+        # else awaits the same in-flight Future instead of hitting the network
+        inflight = self._inflight.get(cache_key)
+        if inflight is not None:
+            return await inflight
+
+        fut = asyncio.get_event_loop().create_future()
+        self._inflight[cache_key] = fut
+
+        result = None
         try:
-            # Use German URL with normalized game name
-            search_url = f"https://www.instant-gaming.com/de/suche/?q={normalized_game.replace(' ', '+')}"
-            
-            logger.info(f"Searching Instant Gaming for: {game_name} (normalized: {normalized_game})")
-            logger.info(f"Using URL: {search_url}")
-            
-            # Headers to appear like a real browser
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-                'Accept-Language': 'de-DE,de;q=0.9,en;q=0.8',
-                'Accept-Encoding': 'gzip, deflate, br',
-                'Connection': 'keep-alive',
-                'Upgrade-Insecure-Requests': '1',
-                'Cache-Control': 'no-cache',
-                'Pragma': 'no-cache'
-            }
-            
-            timeout = aiohttp.ClientTimeout(total=15)
-            
-            async with aiohttp.ClientSession() as session:
-                async with session.get(search_url, headers=headers, timeout=timeout) as response:
-                    if response.status == 200:
-                        html = await response.text()
-                        
-                        # Parse HTML with BeautifulSoup
-                        soup = BeautifulSoup(html, 'html.parser')
-                        
-                        # Find all products with their titles and links
-                        products = []
-                        
-                        # Try multiple selectors to find product links
-                        link_elements = soup.find_all("a", class_="cover") or soup.select('a[href*="/de/"]')
-                        
-                        for element in link_elements:
-                            href = element.get('href', '')
-                            if href and '/de/' in href:
-                                # Get product title from img alt or nearby text
-                                title = ""
-                                img = element.find('img')
-                                if img and img.get('alt'):
-                                    title = img.get('alt').strip()
-                                
-                                if title and href:
-                                    # Convert relative URLs to absolute
-                                    if href.startswith('/'):
-                                        href = f"https://www.instant-gaming.com{href}"
-                                    products.append({'title': title, 'url': href})
-                        
-                        logger.info(f"Found {len(products)} products for {normalized_game}")
-                        
-                        if products:
-                            # Use difflib to find the best match
-                            product_titles = [p['title'] for p in products]
-                            
-                            # Try to find close matches
-                            best_matches = difflib.get_close_matches(game_name, product_titles, n=1, cutoff=0.4)
-                            if not best_matches:
-                                # If no close match with original name, try with normalized name
-                                best_matches = difflib.get_close_matches(normalized_game, product_titles, n=1, cutoff=0.3)
-                            
-                            if best_matches:
-                                # Find the product with the best matching title
-                                best_title = best_matches[0]
-                                best_product = next(p for p in products if p['title'] == best_title)
-                                product_url = best_product['url']
-                                
-                                # Add affiliate tag to direct product link
-                                separator = '&' if '?' in product_url else '?'
-                                affiliate_url = f"{product_url}{separator}igr={self.get_affiliate_tag()}"
-                                
-                                result = {
-                                    'found': True,
-                                    'game_name': best_title,
-                                    'product_url': product_url,
-                                    'affiliate_url': affiliate_url,
-                                    'search_url': search_url,
-                                    'match_confidence': difflib.SequenceMatcher(None, game_name.lower(), best_title.lower()).ratio()
-                                }
-                                
-                                # Cache the result
-                                self.cache[cache_key] = {
-                                    'data': result,
-                                    'timestamp': current_time
-                                }
-                                
-                                logger.info(f"✅ Found matching product for '{game_name}': {best_title} (confidence: {result['match_confidence']:.2f})")
-                                return result
-                            else:
-                                logger.info(f"❌ No good matches found for '{game_name}' on Instant Gaming")
-                        else:
-                            logger.info(f"❌ No products found for '{game_name}' on Instant Gaming")
-                        
-                        # Cache negative result
-                        self.cache[cache_key] = {
-                            'data': None,
-                            'timestamp': current_time
-                        }
-                        return None
-                    else:
-                        logger.warning(f"Instant Gaming search failed with status {response.status} for {game_name}")
-                        return None
-        
+            result = await self._do_search(game_name, normalized_game, cache_key)
         except Exception as e:
             logger.error(f"Error searching Instant Gaming for {game_name}: {e}")
+        finally:
+            if not fut.done():
+                fut.set_result(result)
+            self._inflight.pop(cache_key, None)
+
+        return result
+
+    async def _do_search(self, game_name: str, normalized_game: str, cache_key: str) -> Optional[Dict]:
+        """Perform the actual lookup: persistent cache first, then HTTP"""
+        current_time = time.time()
+
+        # Persistent cache survives bot restarts: check sqlite before HTTP
+        db_cached = await run_db(self._cache_get_db, cache_key)
+        if db_cached is not None:
+            # Keep the original timestamp so the entry doesn't outlive its window
+            self.cache.set(cache_key, db_cached['data'], timestamp=db_cached['timestamp'])
+            logger.info(f"Using persistent Instant Gaming cache for {game_name}")
+            return db_cached['data']
+
+        # Use German URL with normalized game name
+        search_url = f"https://www.instant-gaming.com/de/suche/?q={normalized_game.replace(' ', '+')}"
+
+        logger.info(f"Searching Instant Gaming for: {game_name} (normalized: {normalized_game})")
+        logger.info(f"Using URL: {search_url}")
+
+        timeout = aiohttp.ClientTimeout(total=15)
+
+        session = await self._get_session()
+        async with session.get(search_url, headers=self.DEFAULT_HEADERS, timeout=timeout) as response:
+            return await self._handle_search_response(response, game_name, normalized_game, search_url, cache_key, current_time)
+
+    def _extract_products(self, html: str) -> list:
+        """Extract product titles and links from Instant Gaming search HTML"""
+        products = []
+
+        # Try the regex scan first; fall back to a real parser only if the
+        # markup changed and the pattern no longer matches
+        for href, alt in PRODUCT_RE.findall(html):
+            if '/de/' not in href:
+                continue
+
+            title = unescape(alt).strip()
+            if title:
+                # Convert relative URLs to absolute
+                if href.startswith('/'):
+                    href = f"https://www.instant-gaming.com{href}"
+                products.append({'title': title, 'url': href})
+
+        if products:
+            return products
+
+        if SELECTOLAX_AVAILABLE:
+            tree = LexborHTMLParser(html)
+            nodes = tree.css('a.cover') or tree.css('a[href*="/de/"]')
+
+            for node in nodes:
+                href = node.attributes.get('href') or ''
+                if not href or '/de/' not in href:
+                    continue
+
+                # Get product title from img alt
+                title = ""
+                img = node.css_first('img')
+                if img and img.attributes.get('alt'):
+                    title = img.attributes.get('alt').strip()
+
+                if title:
+                    # Convert relative URLs to absolute
+                    if href.startswith('/'):
+                        href = f"https://www.instant-gaming.com{href}"
+                    products.append({'title': title, 'url': href})
+
+            return products
+
+        # Fallback: BeautifulSoup with the pure-Python parser
+        soup = BeautifulSoup(html, 'html.parser')
+
+        # Try multiple selectors to find product links
+        link_elements = soup.find_all("a", class_="cover") or soup.select('a[href*="/de/"]')
+
+        for element in link_elements:
+            href = element.get('href', '')
+            if href and '/de/' in href:
+                # Get product title from img alt or nearby text
+                title = ""
+                img = element.find('img')
+                if img and img.get('alt'):
+                    title = img.get('alt').strip()
+
+                if title and href:
+                    # Convert relative URLs to absolute
+                    if href.startswith('/'):
+                        href = f"https://www.instant-gaming.com{href}"
+                    products.append({'title': title, 'url': href})
+
+        return products
+
+    async def _handle_search_response(self, response, game_name: str, normalized_game: str, search_url: str, cache_key: str, current_time: float) -> Optional[Dict]:
+        """Parse an Instant Gaming search response and return the best matching product"""
+        if response.status != 200:
+            logger.warning(f"Instant Gaming search failed with status {response.status} for {game_name}")
             return None
+
+        html = await response.text()
+
+        # Compressed transfer is the main bandwidth lever on this hot path;
+        # expect 'br' here once brotli is installed
+        logger.debug(f"Instant Gaming response: content-encoding={response.headers.get('Content-Encoding')}, {len(html)} chars decoded")
+
+        products = self._extract_products(html)
+
+        logger.info(f"Found {len(products)} products for {normalized_game}")
+
+        if products:
+            product_titles = [p['title'] for p in products]
+
+            match = _best_match(game_name, normalized_game, product_titles)
+
+            if match:
+                # Index straight into the product list, no second scan needed
+                best_index, match_confidence = match
+                best_product = products[best_index]
+                best_title = best_product['title']
+                product_url = best_product['url']
+
+                # Add affiliate tag to direct product link
+                separator = '&' if '?' in product_url else '?'
+                affiliate_url = f"{product_url}{separator}igr={self.get_affiliate_tag()}"
+
+                result = {
+                    'found': True,
+                    'game_name': best_title,
+                    'product_url': product_url,
+                    'affiliate_url': affiliate_url,
+                    'search_url': search_url,
+                    'match_confidence': match_confidence
+                }
+
+                # Cache the result (memory + sqlite)
+                self.cache.set(cache_key, result, timestamp=current_time)
+                await run_db(self._cache_put_db, cache_key, result, current_time)
+
+                logger.info(f"✅ Found matching product for '{game_name}': {best_title} (confidence: {result['match_confidence']:.2f})")
+                return result
+            else:
+                logger.info(f"❌ No good matches found for '{game_name}' on Instant Gaming")
+        else:
+            logger.info(f"❌ No products found for '{game_name}' on Instant Gaming")
+            self._known_empty.add(normalized_game)
+
+        # Cache negative result (memory + sqlite)
+        self.cache.set(cache_key, None, timestamp=current_time)
+        await run_db(self._cache_put_db, cache_key, None, current_time)
+        return None
@@ -10,9 +10,13 @@ import sqlite3
 import logging
 import threading
 import time
+from bisect import bisect_left
+from collections import OrderedDict
 from datetime import datetime, timedelta
+from types import MappingProxyType
 from typing import Dict, List, Optional, Tuple
 import random
+import re
 import difflib
 
 import discord
@@ -25,6 +29,13 @@ import json
 import zipfile
 import io
 
+# orjson parses the large YouTube API payloads noticeably faster (optional)
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 # Import platform modules
 from twitch import twitch_api, twitch_platform_task
 from youtube import youtube_api, youtube_platform_task
@@ -33,7 +44,7 @@ from social import stats_platform_task, social_media_stats_platform_task, social
 
 # Import core modules
 from config import Config
-from database import DatabaseManager
+from database import DatabaseManager, run_db
 from autorepair import OpenAIAutoRepair
 from instantgaming import InstantGamingAPI
 from event import EventManager
@@ -119,6 +130,70 @@ event_manager = EventManager(db=db)
 # Auto-Repair System (initialized later in on_ready with bot reference)
 auto_repair_system = None
 
+# Bot-wide shared HTTP session: one keep-alive connection pool for all
+# Twitch/YouTube API calls instead of a TCP+TLS handshake per request
+_http_session: Optional[aiohttp.ClientSession] = None
+
+def get_http_session() -> aiohttp.ClientSession:
+    """Return the shared ClientSession (created lazily on the running loop)"""
+    global _http_session
+    if _http_session is None or _http_session.closed:
+        _http_session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit_per_host=20, ttl_dns_cache=300)
+        )
+    return _http_session
+
+# Persistent Twitch user cache: the login -> user_id mapping is effectively
+# immutable, so it survives restarts and is refreshed weekly at most
+_TWITCH_USER_CACHE_TTL = 7 * 24 * 3600
+
+def _db_load_twitch_users():
+    """Blocking: load all still-fresh twitch_user_cache rows"""
+    conn = db.get_connection()
+    try:
+        cursor = conn.cursor()
+        cursor.execute(
+            'SELECT username, user_id, profile_image_url FROM twitch_user_cache WHERE ts >= ?',
+            (int(time.time()) - _TWITCH_USER_CACHE_TTL,)
+        )
+        return cursor.fetchall()
+    finally:
+        conn.close()
+
+def _db_store_twitch_user(username, user_id, profile_image_url):
+    """Blocking: persist one resolved Twitch user"""
+    conn = db.get_connection()
+    try:
+        conn.execute(
+            'INSERT OR REPLACE INTO twitch_user_cache (username, user_id, profile_image_url, ts) VALUES (?, ?, ?, ?)',
+            (username, user_id, profile_image_url, int(time.time()))
+        )
+        conn.commit()
+    finally:
+        conn.close()
+
+def _db_load_twitch_token():
+    """Blocking: load the persisted app access token and its expiry"""
+    conn = db.get_connection()
+    try:
+        cursor = conn.cursor()
+        cursor.execute('SELECT access_token, expires_at FROM twitch_token WHERE id = 1')
+        return cursor.fetchone()
+    finally:
+        conn.close()
+
+def _db_store_twitch_token(access_token, expires_at):
+    """Blocking: persist the app access token so restarts skip re-auth"""
+    conn = db.get_connection()
+    try:
+        conn.execute(
+            'INSERT OR REPLACE INTO twitch_token (id, access_token, expires_at) VALUES (1, ?, ?)',
+            (access_token, expires_at.isoformat())
+        )
+        conn.commit()
+    finally:
+        conn.close()
+
 # Platform API Managers
 class TwitchAPI:
     def __init__(self):
@@ -126,12 +201,42 @@ class TwitchAPI:
         self.client_secret = Config.TWITCH_CLIENT_SECRET
         self.access_token = None
         self.token_expires_at = None
+        self._token_loaded = False  # persisted token fetched from DB yet?
+        self.user_cache = {}  # login (lower) -> (user_id, profile_image_url)
+        self._user_cache_loaded = False
+        self.follower_cache = {}  # login (lower) -> last known follower count
+        self._was_live = set()  # logins live in the previous bulk poll
+
+    async def _ensure_user_cache_loaded(self):
+        """Warm the login -> user_id cache from the database once per process"""
+        if self._user_cache_loaded:
+            return
+        self._user_cache_loaded = True
+        try:
+            for username, user_id, profile_image_url in await run_db(_db_load_twitch_users):
+                self.user_cache.setdefault(username, (user_id, profile_image_url))
+        except Exception as e:
+            logger.warning(f"Could not load persisted Twitch user cache: {e}")
     
     async def get_access_token(self):
         """Get or refresh Twitch access token"""
+        if not self._token_loaded:
+            # Reuse the token from the last run instead of burning a fresh
+            # client_credentials round-trip on every restart
+            self._token_loaded = True
+            try:
+                row = await run_db(_db_load_twitch_token)
+                if row:
+                    expires_at = datetime.fromisoformat(row[1])
+                    if datetime.now() < expires_at:
+                        self.access_token = row[0]
+                        self.token_expires_at = expires_at
+            except Exception as e:
+                logger.warning(f"Could not load persisted Twitch token: {e}")
+
         if self.access_token and self.token_expires_at and datetime.now() < self.token_expires_at:
             return self.access_token
-        
+
         url = 'https://id.twitch.tv/oauth2/token'
         data = {
             'client_id': self.client_id,
@@ -139,17 +244,21 @@ class TwitchAPI:
             'grant_type': 'client_credentials'
         }
         
-        async with aiohttp.ClientSession() as session:
-            async with session.post(url, data=data) as response:
-                if response.status == 200:
-                    token_data = await response.json()
-                    self.access_token = token_data['access_token']
-                    expires_in = token_data['expires_in']
-                    self.token_expires_at = datetime.now() + timedelta(seconds=expires_in - 300)
-                    return self.access_token
-                else:
-                    logger.error(f"Failed to get Twitch token: {response.status}")
-                    return None
+        session = get_http_session()
+        async with session.post(url, data=data) as response:
+            if response.status == 200:
+                token_data = await response.json()
+                self.access_token = token_data['access_token']
+                expires_in = token_data['expires_in']
+                self.token_expires_at = datetime.now() + timedelta(seconds=expires_in - 300)
+                try:
+                    await run_db(_db_store_twitch_token, self.access_token, self.token_expires_at)
+                except Exception as e:
+                    logger.warning(f"Could not persist Twitch token: {e}")
+                return self.access_token
+            else:
+                logger.error(f"Failed to get Twitch token: {response.status}")
+                return None
     
     async def get_stream_info(self, username: str) -> Optional[Dict]:
         """Get stream information for a Twitch user"""
@@ -162,80 +271,236 @@ class TwitchAPI:
             'Authorization': f'Bearer {token}'
         }
         
-        # Get user info first
-        user_url = f'https://api.twitch.tv/helix/users?login={username}'
-        async with aiohttp.ClientSession() as session:
+        # Get user info first (cached: the login -> id mapping never changes)
+        session = get_http_session()
+        await self._ensure_user_cache_loaded()
+        cached_user = self.user_cache.get(username.lower())
+        if cached_user:
+            user_id, profile_image = cached_user
+        else:
+            user_url = f'https://api.twitch.tv/helix/users?login={username}'
             async with session.get(user_url, headers=headers) as response:
                 if response.status != 200:
                     logger.error(f"Failed to get Twitch user info for {username}")
                     return None
-                
+
                 user_data = await response.json()
                 if not user_data['data']:
                     return None
-                
+
                 user_id = user_data['data'][0]['id']
                 profile_image = user_data['data'][0]['profile_image_url']
+                self.user_cache[username.lower()] = (user_id, profile_image)
+                await run_db(_db_store_twitch_user, username.lower(), user_id, profile_image)
         
         # Get stream info
         stream_url = f'https://api.twitch.tv/helix/streams?user_id={user_id}'
-        async with aiohttp.ClientSession() as session:
-            async with session.get(stream_url, headers=headers) as response:
-                if response.status == 200:
-                    stream_data = await response.json()
-                    if stream_data['data']:
-                        stream = stream_data['data'][0]
+        async with session.get(stream_url, headers=headers) as response:
+            if response.status == 200:
+                stream_data = await response.json()
+                if stream_data['data']:
+                    stream = stream_data['data'][0]
                         
-                        # Get follower count
-                        follower_count = 0
-                        try:
-                            follower_url = f'https://api.twitch.tv/helix/channels/followers?broadcaster_id={user_id}'
-                            async with session.get(follower_url, headers=headers) as follower_response:
-                                if follower_response.status == 200:
-                                    follower_data = await follower_response.json()
-                                    follower_count = follower_data.get('total', 0)
-                        except Exception as e:
-                            logger.error(f"Failed to get Twitch follower count for {username}: {e}")
+                    # Get follower count
+                    follower_count = 0
+                    try:
+                        follower_url = f'https://api.twitch.tv/helix/channels/followers?broadcaster_id={user_id}'
+                        async with session.get(follower_url, headers=headers) as follower_response:
+                            if follower_response.status == 200:
+                                follower_data = await follower_response.json()
+                                follower_count = follower_data.get('total', 0)
+                    except Exception as e:
+                        logger.error(f"Failed to get Twitch follower count for {username}: {e}")
                         
-                        return {
-                            'is_live': True,
-                            'viewer_count': stream['viewer_count'],
-                            'game_name': stream['game_name'],
-                            'title': stream['title'],
-                            'thumbnail_url': stream['thumbnail_url'].replace('{width}', '1920').replace('{height}', '1080'),
-                            'profile_image_url': profile_image,
-                            'platform_url': f'https://twitch.tv/{username}',
-                            'follower_count': follower_count
-                        }
-                    else:
-                        return {'is_live': False}
-                return None
+                    return {
+                        'is_live': True,
+                        'viewer_count': stream['viewer_count'],
+                        'game_name': stream['game_name'],
+                        'title': stream['title'],
+                        'thumbnail_url': stream['thumbnail_url'].replace('{width}', '1920').replace('{height}', '1080'),
+                        'profile_image_url': profile_image,
+                        'platform_url': f'https://twitch.tv/{username}',
+                        'follower_count': follower_count
+                    }
+                else:
+                    return {'is_live': False}
+            return None
+
+    async def _resolve_users_bulk(self, usernames, headers, session):
+        """Resolve missing login -> (user_id, profile_image) entries in one call"""
+        missing = [u for u in usernames if u.lower() not in self.user_cache]
+        for i in range(0, len(missing), 100):  # Helix accepts up to 100 logins
+            params = [('login', u) for u in missing[i:i + 100]]
+            async with session.get('https://api.twitch.tv/helix/users', headers=headers, params=params) as response:
+                if response.status != 200:
+                    logger.error(f"Failed to bulk-resolve Twitch users: {response.status}")
+                    continue
+                for user in (await response.json())['data']:
+                    self.user_cache[user['login'].lower()] = (user['id'], user['profile_image_url'])
+                    await run_db(_db_store_twitch_user, user['login'].lower(), user['id'], user['profile_image_url'])
+
+    async def get_streams_bulk(self, usernames) -> Dict[str, Dict]:
+        """Check many Twitch users with one helix/streams call per 100 logins
+
+        Returns a dict login -> stream info in the get_stream_info format.
+        Follower counts are only fetched for users that just transitioned
+        offline -> live; everyone else reuses the last known value.
+        """
+        result = {}
+        if not usernames:
+            return result
+
+        token = await self.get_access_token()
+        if not token:
+            return result
+
+        headers = {
+            'Client-ID': self.client_id,
+            'Authorization': f'Bearer {token}'
+        }
+        session = get_http_session()
+        await self._ensure_user_cache_loaded()
+        await self._resolve_users_bulk(usernames, headers, session)
+
+        live_streams = {}
+        checked = set()  # logins the API actually answered for this cycle
+        for i in range(0, len(usernames), 100):  # Helix accepts up to 100 logins
+            chunk = usernames[i:i + 100]
+            params = [('user_login', u) for u in chunk]
+            async with session.get('https://api.twitch.tv/helix/streams', headers=headers, params=params) as response:
+                if response.status != 200:
+                    # These logins were NOT checked - leaving them out of the
+                    # result keeps callers from treating them as offline
+                    logger.error(f"Failed to bulk-check Twitch streams: {response.status}")
+                    continue
+                checked.update(u.lower() for u in chunk)
+                for stream in (await response.json())['data']:
+                    live_streams[stream['user_login'].lower()] = stream
+
+        now_live = set()
+        for username in usernames:
+            login = username.lower()
+            if login not in checked:
+                continue
+            stream = live_streams.get(login)
+            if stream is None:
+                result[username] = {'is_live': False}
+                continue
+
+            now_live.add(login)
+            user_id, profile_image = self.user_cache.get(login, (stream['user_id'], ''))
+
+            # Follower count only on the offline -> live transition
+            if login not in self._was_live:
+                try:
+                    follower_url = f'https://api.twitch.tv/helix/channels/followers?broadcaster_id={user_id}'
+                    async with session.get(follower_url, headers=headers) as follower_response:
+                        if follower_response.status == 200:
+                            follower_data = await follower_response.json()
+                            self.follower_cache[login] = follower_data.get('total', 0)
+                except Exception as e:
+                    logger.error(f"Failed to get Twitch follower count for {username}: {e}")
+
+            result[username] = {
+                'is_live': True,
+                'viewer_count': stream['viewer_count'],
+                'game_name': stream['game_name'],
+                'title': stream['title'],
+                'thumbnail_url': stream['thumbnail_url'].replace('{width}', '1920').replace('{height}', '1080'),
+                'profile_image_url': profile_image,
+                'platform_url': f'https://twitch.tv/{username}',
+                'follower_count': self.follower_cache.get(login, 0)
+            }
+
+        # Only update transition tracking for logins that were checked -
+        # unchecked ones keep their previous state
+        self._was_live = (self._was_live - checked) | now_live
+        return result
+
+class _BoundedCache(OrderedDict):
+    """Dict mit LRU-Begrenzung - verhindert unbegrenztes Wachstum bei 24/7-Uptime"""
+
+    def __init__(self, maxsize=1024):
+        super().__init__()
+        self.maxsize = maxsize
+
+    def __getitem__(self, key):
+        value = super().__getitem__(key)
+        self.move_to_end(key)
+        return value
+
+    def get(self, key, default=None):
+        try:
+            value = super().__getitem__(key)
+        except KeyError:
+            return default
+        self.move_to_end(key)
+        return value
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self.move_to_end(key)
+        if len(self) > self.maxsize:
+            self.popitem(last=False)
 
 class YouTubeAPI:
     def __init__(self):
         self.api_key = Config.YOUTUBE_API_KEY
-        self.cache = {}  # Cache für API-Responses
+        self.cache = _BoundedCache(maxsize=1024)  # Cache für API-Responses
         self.cache_duration = 300  # 5 Minuten Cache
-        self.scrape_cache = {}  # Cache für Scraping-Results
+        self.scrape_cache = _BoundedCache(maxsize=512)  # Cache für Scraping-Results
         self.scrape_cache_duration = 60  # 1 Minute Cache für Scraping
-        self.quota_backoff = {}  # Backoff für Quota-exceeded per user
+        self.quota_backoff = _BoundedCache(maxsize=512)  # Backoff für Quota-exceeded per user
         self.quota_backoff_duration = 1800  # 30 Minuten Backoff
-    
+        self._inflight_scrape = {}  # Laufende Scrapes pro Username (Single-Flight)
+        self._inflight_info = {}  # Laufende API-Abfragen pro Username (Single-Flight)
+    
+    # Byte-level live indicators: checked directly on the raw response body,
+    # no unicode decode and no JSON round-trip over the multi-MB page
+    _YT_STRONG_INDICATORS = (b'"isLive":true', b'"liveBroadcastContent":"live"')
+    _YT_WEAK_INDICATORS = (
+        b'watching now',  # More specific than just "watching"
+        b'viewers watching',  # Specific viewer count text
+        b'"isLiveContent":true',  # JSON data
+    )
+    # Precompiled alternation so the page is scanned once, not per indicator
+    _YT_INDICATOR_RE = re.compile(
+        b'|'.join(re.escape(indicator) for indicator in _YT_STRONG_INDICATORS + _YT_WEAK_INDICATORS)
+    )
+
+    async def _coalesce(self, inflight: dict, username: str, probe):
+        """Single-flight: parallel callers for the same user share one in-flight
+        request instead of each hitting YouTube on a cache miss"""
+        fut = inflight.get(username)
+        if fut is not None:
+            return await fut
+
+        fut = asyncio.get_event_loop().create_future()
+        inflight[username] = fut
+
+        result = None
+        try:
+            result = await probe(username)
+        finally:
+            if not fut.done():
+                fut.set_result(result)
+            inflight.pop(username, None)
+
+        return result
+
     async def quick_live_check(self, username: str) -> bool:
         """Quick live check via web scraping - saves API quota"""
-        import time
-        import re
-        import json
-        
+        return await self._coalesce(self._inflight_scrape, username, self._do_quick_live_check)
+
+    async def _do_quick_live_check(self, username: str) -> bool:
         # Check scraping cache first
         scrape_key = f"youtube_scrape_{username}"
         current_time = time.time()
         
-        if scrape_key in self.scrape_cache:
-            cached_data = self.scrape_cache[scrape_key]
-            if current_time - cached_data['timestamp'] < self.scrape_cache_duration:
-                logger.info(f"Using cached scraping data for {username}")
-                return cached_data['is_live']
+        cached_data = self.scrape_cache.get(scrape_key)
+        if cached_data and current_time - cached_data['timestamp'] < self.scrape_cache_duration:
+            logger.info("Using cached scraping data for %s", username)
+            return cached_data['is_live']
         
         try:
             # Try primary URL format first
@@ -249,61 +514,101 @@ class YouTubeAPI:
                 'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
                 'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
                 'Accept-Language': 'en-US,en;q=0.5',
+                'Accept-Encoding': 'gzip, deflate, br',
                 'Connection': 'keep-alive',
             }
-            
+
             timeout = aiohttp.ClientTimeout(total=5)  # Reduced timeout
             
             # Use single session for all URL attempts
-            async with aiohttp.ClientSession() as session:
-                for url in urls_to_check:
+            session = get_http_session()
+
+            # Cheapest probe first: /live redirects to the watch URL while a
+            # stream runs - a HEAD without redirects answers from the Location
+            # header alone, no body download or HTML scan needed. Anything
+            # inconclusive (other redirect targets, consent pages, errors)
+            # falls through to the full scrape below.
+            try:
+                live_url = f'https://www.youtube.com/@{username}/live'
+                async with session.head(live_url, headers=headers, timeout=timeout,
+                                        allow_redirects=False) as response:
+                    if response.status in (301, 302, 303, 307, 308):
+                        if '/watch?v=' in response.headers.get('Location', ''):
+                            self.scrape_cache[scrape_key] = {
+                                'is_live': True,
+                                'timestamp': current_time,
+                            }
+                            logger.info("YouTube HEAD check for %s: LIVE (redirect to watch URL)", username)
+                            return True
+            except Exception:
+                pass  # HEAD not supported or blocked - use the scrape path
+
+            async def probe(url):
+                request_headers = headers
+                if cached_data and cached_data.get('etag') and cached_data.get('url') == url:
+                    # Revalidate instead of re-downloading the full page
+                    request_headers = dict(headers)
+                    request_headers['If-None-Match'] = cached_data['etag']
+                    if cached_data.get('last_modified'):
+                        request_headers['If-Modified-Since'] = cached_data['last_modified']
+                async with session.get(url, headers=request_headers, timeout=timeout) as response:
+                    if response.status == 304:
+                        # Page unchanged since last scrape - reuse verdict, empty body
+                        cached_data['timestamp'] = current_time
+                        logger.info("YouTube scraping for %s: 304 Not Modified, reusing cached result", username)
+                        return cached_data['is_live']
+                    if response.status != 200:
+                        return None
+
+                    body = await response.read()
+
+                    # One linear pass over the page for all indicators
+                    hits = {match.group(0) for match in self._YT_INDICATOR_RE.finditer(body)}
+
+                    live_indicators_found = 0
+                    if hits.intersection(self._YT_STRONG_INDICATORS):
+                        live_indicators_found += 2  # Strong indicator
+
+                    # Additional live indicators (require multiple signals)
+                    live_indicators_found += sum(
+                        1 for indicator in self._YT_WEAK_INDICATORS if indicator in hits
+                    )
+
+                    # Require at least 2 indicators to reduce false positives
+                    is_live = live_indicators_found >= 2
+
+                    # Cache the result together with validators for conditional GETs
+                    self.scrape_cache[scrape_key] = {
+                        'is_live': is_live,
+                        'timestamp': current_time,
+                        'url': url,
+                        'etag': response.headers.get('ETag'),
+                        'last_modified': response.headers.get('Last-Modified'),
+                    }
+
+                    logger.info(
+                        "YouTube scraping for %s: %s (indicators: %d)",
+                        username, 'LIVE' if is_live else 'OFFLINE', live_indicators_found
+                    )
+                    return is_live
+
+            # All three URL formats race concurrently: a wrong format that
+            # hangs into its 5s timeout no longer delays the working one
+            # (sequential worst case was 15s per check)
+            tasks = [asyncio.create_task(probe(url)) for url in urls_to_check]
+            try:
+                for finished in asyncio.as_completed(tasks):
                     try:
-                        async with session.get(url, headers=headers, timeout=timeout) as response:
-                            if response.status == 200:
-                                html = await response.text()
-                                
-                                # Look for ytInitialData first (most reliable)
-                                ytdata_pattern = r'ytInitialData"]\s*=\s*({.+?});'
-                                ytdata_match = re.search(ytdata_pattern, html)
-                                
-                                live_indicators_found = 0
-                                
-                                if ytdata_match:
-                                    try:
-                                        data = json.loads(ytdata_match.group(1))
-                                        # Look for live indicators in JSON
-                                        data_str = json.dumps(data)
-                                        if '"isLive":true' in data_str or '"liveBroadcastContent":"live"' in data_str:
-                                            live_indicators_found += 2  # Strong indicator
-                                    except:
-                                        pass
-                                
-                                # Look for additional live indicators (require multiple signals)
-                                additional_indicators = [
-                                    'watching now',  # More specific than just "watching"
-                                    'viewers watching',  # Specific viewer count text
-                                    '"isLiveContent":true',  # JSON data
-                                    '"liveBroadcastContent":"live"',  # JSON data
-                                ]
-                                
-                                for indicator in additional_indicators:
-                                    if indicator in html:
-                                        live_indicators_found += 1
-                                
-                                # Require at least 2 indicators to reduce false positives
-                                is_live = live_indicators_found >= 2
-                                
-                                # Cache the result
-                                self.scrape_cache[scrape_key] = {
-                                    'is_live': is_live,
-                                    'timestamp': current_time
-                                }
-                                
-                                logger.info(f"YouTube scraping for {username}: {'LIVE' if is_live else 'OFFLINE'} (indicators: {live_indicators_found})")
-                                return is_live
-                    except Exception as e:
-                        continue  # Try next URL format
-                    
+                        verdict = await finished
+                    except Exception:
+                        continue  # This URL format failed - another may still answer
+                    if verdict is not None:
+                        return verdict
+            finally:
+                for task in tasks:
+                    task.cancel()
+
+
             # If all URLs failed, cache as offline
             self.scrape_cache[scrape_key] = {
                 'is_live': False,
@@ -317,8 +622,9 @@ class YouTubeAPI:
 
     async def get_stream_info(self, username: str) -> Optional[Dict]:
         """Smart Polling: Scraping first, API only for details"""
-        import time
-        
+        return await self._coalesce(self._inflight_info, username, self._do_get_stream_info)
+
+    async def _do_get_stream_info(self, username: str) -> Optional[Dict]:
         # PHASE 1: Quick live check via scraping (FREE)
         is_live_basic = await self.quick_live_check(username)
         
@@ -360,34 +666,34 @@ class YouTubeAPI:
                 'maxResults': 1
             }
             
-            async with aiohttp.ClientSession() as session:
-                async with session.get(search_url, params=params) as response:
-                    if response.status == 403:
-                        # Quota exceeded - set backoff and return cached data or scraping result
-                        self.quota_backoff[backoff_key] = {'timestamp': current_time}
-                        logger.info(f"YouTube quota exceeded for {username}, setting 30min backoff")
+            session = get_http_session()
+            async with session.get(search_url, params=params) as response:
+                if response.status == 403:
+                    # Quota exceeded - set backoff and return cached data or scraping result
+                    self.quota_backoff[backoff_key] = {'timestamp': current_time}
+                    logger.info(f"YouTube quota exceeded for {username}, setting 30min backoff")
                         
-                        if cache_key in self.cache:
-                            logger.info(f"YouTube quota exceeded, using cached data for {username}")
-                            return self.cache[cache_key]['data']
-                        else:
-                            # Return basic live info based on scraping
-                            return {'is_live': True, 'method': 'quota_exceeded_fallback', 'title': 'Live Stream', 'viewer_count': 0}
-                    elif response.status != 200:
-                        error_data = await response.text()
-                        logger.error(f"Failed to search YouTube channel for {username} - Status: {response.status} - Error: {error_data}")
-                        return {'is_live': False, 'method': 'api_error'}
+                    if cache_key in self.cache:
+                        logger.info(f"YouTube quota exceeded, using cached data for {username}")
+                        return self.cache[cache_key]['data']
                     else:
-                        # Fix: Parse JSON inside response context
-                        search_data = await response.json()
-                        if not search_data.get('items'):
-                            result = {'is_live': False, 'method': 'api_no_channel'}
-                            self.cache[cache_key] = {'data': result, 'timestamp': current_time}
-                            return result
+                        # Return basic live info based on scraping
+                        return {'is_live': True, 'method': 'quota_exceeded_fallback', 'title': 'Live Stream', 'viewer_count': 0}
+                elif response.status != 200:
+                    error_data = await response.text()
+                    logger.error(f"Failed to search YouTube channel for {username} - Status: {response.status} - Error: {error_data}")
+                    return {'is_live': False, 'method': 'api_error'}
+                else:
+                    # Fix: Parse JSON inside response context
+                    search_data = await response.json(loads=_json_loads)
+                    if not search_data.get('items'):
+                        result = {'is_live': False, 'method': 'api_no_channel'}
+                        self.cache[cache_key] = {'data': result, 'timestamp': current_time}
+                        return result
                         
-                        # Extract channel ID and profile image
-                        channel_id = search_data['items'][0]['id']['channelId']
-                        profile_image = search_data['items'][0]['snippet']['thumbnails']['high']['url']
+                    # Extract channel ID and profile image
+                    channel_id = search_data['items'][0]['id']['channelId']
+                    profile_image = search_data['items'][0]['snippet']['thumbnails']['high']['url']
             
             # Check for live streams
             live_url = f'https://www.googleapis.com/youtube/v3/search'
@@ -399,68 +705,67 @@ class YouTubeAPI:
                 'key': self.api_key
             }
             
-            async with aiohttp.ClientSession() as session:
-                async with session.get(live_url, params=live_params) as response:
-                    if response.status == 200:
-                        live_data = await response.json()
-                        if live_data.get('items'):
-                            video = live_data['items'][0]
-                            video_id = video['id']['videoId']
+            async with session.get(live_url, params=live_params) as response:
+                if response.status == 200:
+                    live_data = await response.json(loads=_json_loads)
+                    if live_data.get('items'):
+                        video = live_data['items'][0]
+                        video_id = video['id']['videoId']
                             
-                            # Get detailed video info
-                            video_url = f'https://www.googleapis.com/youtube/v3/videos'
-                            video_params = {
-                                'part': 'snippet,statistics,liveStreamingDetails',
-                                'id': video_id,
-                                'key': self.api_key
-                            }
+                        # Get detailed video info
+                        video_url = f'https://www.googleapis.com/youtube/v3/videos'
+                        video_params = {
+                            'part': 'snippet,statistics,liveStreamingDetails',
+                            'id': video_id,
+                            'key': self.api_key
+                        }
                             
-                            async with session.get(video_url, params=video_params) as response2:
-                                if response2.status == 200:
-                                    video_data = await response2.json()
-                                    if video_data.get('items'):
-                                        video_info = video_data['items'][0]
-                                        # Get subscriber count
-                                        subscriber_count = 0
-                                        try:
-                                            # Get channel statistics for subscriber count
-                                            channel_url = 'https://www.googleapis.com/youtube/v3/channels'
-                                            channel_params = {
-                                                'part': 'statistics',
-                                                'id': channel_id,
-                                                'key': self.api_key
-                                            }
+                        async with session.get(video_url, params=video_params) as response2:
+                            if response2.status == 200:
+                                video_data = await response2.json()
+                                if video_data.get('items'):
+                                    video_info = video_data['items'][0]
+                                    # Get subscriber count
+                                    subscriber_count = 0
+                                    try:
+                                        # Get channel statistics for subscriber count
+                                        channel_url = 'https://www.googleapis.com/youtube/v3/channels'
+                                        channel_params = {
+                                            'part': 'statistics',
+                                            'id': channel_id,
+                                            'key': self.api_key
+                                        }
                                             
-                                            async with session.get(channel_url, params=channel_params) as stats_response:
-                                                if stats_response.status == 200:
-                                                    stats_data = await stats_response.json()
-                                                    if stats_data.get('items'):
-                                                        subscriber_count = int(stats_data['items'][0]['statistics'].get('subscriberCount', 0))
-                                        except Exception as e:
-                                            logger.error(f"Failed to get YouTube subscriber count for {username}: {e}")
+                                        async with session.get(channel_url, params=channel_params) as stats_response:
+                                            if stats_response.status == 200:
+                                                stats_data = await stats_response.json(loads=_json_loads)
+                                                if stats_data.get('items'):
+                                                    subscriber_count = int(stats_data['items'][0]['statistics'].get('subscriberCount', 0))
+                                    except Exception as e:
+                                        logger.error(f"Failed to get YouTube subscriber count for {username}: {e}")
                                         
-                                        result = {
-                                            'is_live': True,
-                                            'viewer_count': int(video_info['liveStreamingDetails'].get('concurrentViewers', 0)),
-                                            'game_name': 'YouTube Live',
-                                            'title': video_info['snippet']['title'],
-                                            'thumbnail_url': video_info['snippet']['thumbnails']['maxres']['url'] if 'maxres' in video_info['snippet']['thumbnails'] else video_info['snippet']['thumbnails']['high']['url'],
-                                            'profile_image_url': profile_image,
-                                            'platform_url': f'https://youtube.com/watch?v={video_id}',
-                                            'method': 'api_full',
-                                            'follower_count': subscriber_count
-                                        }
-                                        # Cache the result
-                                        self.cache[cache_key] = {'data': result, 'timestamp': current_time}
-                                        return result
+                                    result = {
+                                        'is_live': True,
+                                        'viewer_count': int(video_info['liveStreamingDetails'].get('concurrentViewers', 0)),
+                                        'game_name': 'YouTube Live',
+                                        'title': video_info['snippet']['title'],
+                                        'thumbnail_url': video_info['snippet']['thumbnails']['maxres']['url'] if 'maxres' in video_info['snippet']['thumbnails'] else video_info['snippet']['thumbnails']['high']['url'],
+                                        'profile_image_url': profile_image,
+                                        'platform_url': f'https://youtube.com/watch?v={video_id}',
+                                        'method': 'api_full',
+                                        'follower_count': subscriber_count
+                                    }
+                                    # Cache the result
+                                    self.cache[cache_key] = {'data': result, 'timestamp': current_time}
+                                    return result
                         
-                        result = {'is_live': False, 'method': 'api_not_live'}
-                        self.cache[cache_key] = {'data': result, 'timestamp': current_time}
-                        return result
-                    else:
-                        result = {'is_live': False, 'method': 'api_live_check_failed'}
-                        self.cache[cache_key] = {'data': result, 'timestamp': current_time}
-                        return result
+                    result = {'is_live': False, 'method': 'api_not_live'}
+                    self.cache[cache_key] = {'data': result, 'timestamp': current_time}
+                    return result
+                else:
+                    result = {'is_live': False, 'method': 'api_live_check_failed'}
+                    self.cache[cache_key] = {'data': result, 'timestamp': current_time}
+                    return result
                         
         except Exception as e:
             logger.error(f"YouTube API error for {username}: {e}")
@@ -470,19 +775,186 @@ class YouTubeAPI:
             # Fallback to scraping result
             return {'is_live': False, 'method': 'api_exception', 'error': str(e)}
 
+# Shared HTTP/2 client for the TikTok WAF-bypass paths: one long-lived
+# multiplexed session per process so tiktok.com, m.tiktok.com and
+# webcast.tiktok.com each keep a warm connection instead of paying the
+# TCP+TLS handshake whenever the small per-instance pool recycled
+_tiktok_httpx_session = None
+_tiktok_httpx_lock = asyncio.Lock()
+
+async def get_tiktok_httpx_session():
+    """Lazily create the shared httpx HTTP/2 client (once per process)"""
+    global _tiktok_httpx_session
+    if _tiktok_httpx_session is None:
+        async with _tiktok_httpx_lock:
+            if _tiktok_httpx_session is None:
+                import httpx
+                _tiktok_httpx_session = httpx.AsyncClient(
+                    http2=True,
+                    timeout=30.0,
+                    limits=httpx.Limits(
+                        max_keepalive_connections=100,
+                        max_connections=100,
+                        keepalive_expiry=300.0
+                    ),
+                    follow_redirects=True
+                )
+    return _tiktok_httpx_session
+
+# Caps concurrent requests against tiktok.com while detection strategies
+# race each other - bursting every endpoint at once is itself a WAF signal
+_tiktok_host_sem = asyncio.Semaphore(3)
+
+# Static TikTok request headers, built once and frozen: the checker fires
+# these on every poll cycle and the dict literals were re-created per call.
+# MappingProxyType keeps them immutable; copy with dict() where a request
+# needs per-call fields (e.g. a user-specific Referer)
+_TIKTOK_HOMEPAGE_HEADERS = MappingProxyType({
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8,application/signed-exchange;v=b3;q=0.7',
+    'Accept-Language': 'en-US,en;q=0.9,de;q=0.8',
+    'Accept-Encoding': 'gzip, deflate, br, zstd',
+    'DNT': '1',
+    'Connection': 'keep-alive',
+    'Upgrade-Insecure-Requests': '1',
+    'Sec-Fetch-Dest': 'document',
+    'Sec-Fetch-Mode': 'navigate',
+    'Sec-Fetch-Site': 'none',
+    'Sec-Fetch-User': '?1',
+    'sec-ch-ua': '"Google Chrome";v="131", "Chromium";v="131", "Not_A Brand";v="24"',
+    'sec-ch-ua-mobile': '?0',
+    'sec-ch-ua-platform': '"Windows"',
+    'Cache-Control': 'max-age=0'
+})
+
+# Same browser profile as the homepage bootstrap, but as a same-origin
+# navigation with Referer for the /live page
+_TIKTOK_DESKTOP_HEADERS = MappingProxyType({
+    **_TIKTOK_HOMEPAGE_HEADERS,
+    'Sec-Fetch-Site': 'same-origin',
+    'Referer': 'https://www.tiktok.com/'
+})
+
+_TIKTOK_MOBILE_API_HEADERS = MappingProxyType({
+    'User-Agent': 'Mozilla/5.0 (iPhone; CPU iPhone OS 17_1 like Mac OS X) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.1 Mobile/15E148 Safari/604.1',
+    'Accept': 'application/json, text/plain, */*',
+    'Accept-Language': 'en-US,en;q=0.9',
+    'Accept-Encoding': 'gzip, deflate, br',
+    'Referer': 'https://www.tiktok.com/',
+    'Origin': 'https://www.tiktok.com',
+    'DNT': '1',
+    'Connection': 'keep-alive',
+    'Sec-Fetch-Dest': 'empty',
+    'Sec-Fetch-Mode': 'cors',
+    'Sec-Fetch-Site': 'same-origin'
+})
+
+_TIKTOK_MOBILE_WEB_HEADERS = MappingProxyType({
+    'User-Agent': 'Mozilla/5.0 (iPhone; CPU iPhone OS 17_1 like Mac OS X) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.1 Mobile/15E148 Safari/604.1',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.9',
+    'Accept-Encoding': 'gzip, deflate, br',
+    'DNT': '1',
+    'Connection': 'keep-alive',
+    'Upgrade-Insecure-Requests': '1',
+    'Sec-Fetch-Dest': 'document',
+    'Sec-Fetch-Mode': 'navigate',
+    'Sec-Fetch-Site': 'none',
+    'Sec-Fetch-User': '?1'
+})
+
+_TIKTOK_PROFILE_HEADERS = MappingProxyType({
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.9,de;q=0.8',
+    'Accept-Encoding': 'gzip, deflate, br',
+    'Connection': 'keep-alive',
+    'Upgrade-Insecure-Requests': '1',
+    'Cache-Control': 'no-cache'
+})
+
+# SIGI_STATE extraction patterns, compiled once: the DOTALL '.*?' scans are
+# expensive on the multi-hundred-KB TikTok pages and were recompiled per call
+_SIGI_PATTERNS = tuple(re.compile(p, re.DOTALL) for p in (
+    r'window\.__SIGI_STATE__\s*=\s*({.*?});',
+    r'window\.__SIGI_STATE__=({.*?});',
+    r'__SIGI_STATE__\s*=\s*({.*?})',
+))
+# Upper bound for the regex window sliced around the SIGI anchor - the
+# blob itself stays well under this, the CSS/JS tail behind it doesn't
+_SIGI_MAX_LEN = 1_000_000
+
 class TikTokLiveChecker:
+    # Matches the live poll cadence: duplicate polls inside this window reuse
+    # the last verdict instead of paying a full WAF-bypass session
+    RESULT_CACHE_TTL = 45.0
+
+    # Compiled alternations: one linear pass over the ~500KB page instead of
+    # one scan per term plus a fresh html.lower() copy each time
+    _BLOCK_RE = re.compile('slardar|guru meditation|404 not found|tlb', re.IGNORECASE)
+    _MOBILE_BLOCK_RE = re.compile('404 not found|guru meditation|slardar|blocked', re.IGNORECASE)
+    _LIVE_INDICATORS = (
+        '"live_status":1',
+        'isLiving":true',
+        '"liveRoomId":"',
+        '"roomStatus":2',
+        'data-e2e="live-avatar"',
+        'live-indicator',
+        '"status":"live"',
+        'is LIVE - TikTok LIVE',  # Title indicator
+    )
+    _LIVE_IND_RE = re.compile('|'.join(map(re.escape, _LIVE_INDICATORS)))
+    _LIVE_WORD_RE = re.compile('live', re.IGNORECASE)
+
+    # Profile extraction patterns, compiled once; order encodes preference
+    # (larger avatars and exact follower fields first)
+    _AVATAR_PATTERNS = tuple(re.compile(p) for p in (
+        r'"avatarLarger":"([^"]+)"',
+        r'"avatarMedium":"([^"]+)"',
+        r'"avatarThumb":"([^"]+)"',
+        r'"avatar_300x300":\{"uri":"([^"]+)"',
+        r'"avatar_168x168":\{"uri":"([^"]+)"',
+        r'"avatar_larger":\{"uri":"([^"]+)"',
+        r'"avatar_medium":\{"uri":"([^"]+)"',
+        r'avatarLarger.*?"([^"]*\\.jpg[^"]*)"',
+        r'avatarMedium.*?"([^"]*\\.jpg[^"]*)"',
+        r'profile_pic_url_hd":"([^"]+)"',
+    ))
+    _FOLLOWER_PATTERNS = tuple(re.compile(p) for p in (
+        r'"followerCount":(\d+)',
+        r'"followingCount":(\d+)',
+        r'data-e2e="followers-count">([^<]+)',
+        r'"stats":\{"followerCount":(\d+)',
+        r'"userInfo":\{[^}]*"stats":\{[^}]*"followerCount":(\d+)',
+        r'followersCount.*?(\d+)',
+        r'"follower_count":(\d+)',
+    ))
+    _NON_DIGIT_RE = re.compile(r'[^\d]')
+
+    # Detection score tables: indicator count caps at 2 (0/1/3 points),
+    # live mentions bin at >500 and >1000 (0/1/2 points)
+    _IND_SCORES = (0, 1, 3)
+    _LM_BOUNDS = (500, 1000)
+    _LM_SCORES = (0, 1, 2)
+
     def __init__(self):
-        self.clients = {}  # Store clients per username
+        # LRU-bounded: a 24/7 bot otherwise accumulates entries for every
+        # username it has ever polled
+        self.clients = _BoundedCache(maxsize=64)  # Store clients per username
         self.httpx_session = None  # HTTP/2 session for advanced WAF bypass
-        self.session_cookies = {}  # Store session cookies per domain
-        self.waf_backoff = {}  # Track WAF blocks per username {username: {'blocks': count, 'next_check': timestamp}}
+        self.session_cookies = _BoundedCache(maxsize=32)  # Store session cookies per domain
+        self.waf_backoff = _BoundedCache(maxsize=512)  # Track WAF blocks per username {username: {'blocks': count, 'next_check': timestamp}}
+        self._inflight = {}  # Running checks per username (single-flight)
+        self._result_cache = _BoundedCache(maxsize=1024)  # username -> (monotonic ts, result)
     
     async def cleanup(self):
         """Cleanup HTTP sessions to prevent resource leaks"""
+        global _tiktok_httpx_session
         if self.httpx_session:
             try:
                 await self.httpx_session.aclose()
                 self.httpx_session = None
+                _tiktok_httpx_session = None
                 logger.info("TikTok: HTTP session cleaned up successfully")
             except Exception as e:
                 logger.warning(f"TikTok: Session cleanup error: {e}")
@@ -493,8 +965,9 @@ class TikTokLiveChecker:
         current_time = time.time()
         
         if username not in self.waf_backoff:
-            # First block: 5 minute backoff
-            self.waf_backoff[username] = {'blocks': 1, 'next_check': current_time + 300}
+            # First block: 5 minute backoff (jittered so blocked users do not
+            # all come back in the same poll cycle)
+            self.waf_backoff[username] = {'blocks': 1, 'next_check': current_time + int(300 * random.uniform(0.8, 1.2))}
             logger.info(f"TikTok {username}: First WAF block - 5 minute backoff implemented")
         else:
             # Exponential backoff: 5, 15, 30, 60 minutes max
@@ -506,19 +979,13 @@ class TikTokLiveChecker:
             else:
                 backoff_seconds = 3600  # 60 minutes max
                 
-            self.waf_backoff[username] = {'blocks': blocks, 'next_check': current_time + backoff_seconds}
+            self.waf_backoff[username] = {'blocks': blocks, 'next_check': current_time + int(backoff_seconds * random.uniform(0.8, 1.2))}
             logger.warning(f"TikTok {username}: WAF block #{blocks} - {backoff_seconds//60} minute backoff implemented")
         
     async def _init_session(self):
-        """Initialize HTTP/2 session with advanced WAF bypass capabilities"""
+        """Bind the shared HTTP/2 session with advanced WAF bypass capabilities"""
         if self.httpx_session is None:
-            import httpx
-            self.httpx_session = httpx.AsyncClient(
-                http2=True,
-                timeout=30.0,
-                limits=httpx.Limits(max_keepalive_connections=10, max_connections=20),
-                follow_redirects=True
-            )
+            self.httpx_session = await get_tiktok_httpx_session()
             
     async def _get_session_cookies(self) -> Dict[str, str]:
         """Bootstrap session cookies from TikTok homepage for WAF bypass"""
@@ -531,47 +998,16 @@ class TikTokLiveChecker:
             await self._init_session()
             
             # Step 1: Visit homepage to get initial cookies
-            homepage_headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36',
-                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8,application/signed-exchange;v=b3;q=0.7',
-                'Accept-Language': 'en-US,en;q=0.9,de;q=0.8',
-                'Accept-Encoding': 'gzip, deflate, br, zstd',
-                'DNT': '1',
-                'Connection': 'keep-alive',
-                'Upgrade-Insecure-Requests': '1',
-                'Sec-Fetch-Dest': 'document',
-                'Sec-Fetch-Mode': 'navigate',
-                'Sec-Fetch-Site': 'none',
-                'Sec-Fetch-User': '?1',
-                'sec-ch-ua': '"Google Chrome";v="131", "Chromium";v="131", "Not_A Brand";v="24"',
-                'sec-ch-ua-mobile': '?0',
-                'sec-ch-ua-platform': '"Windows"',
-                'Cache-Control': 'max-age=0'
-            }
-            
-            response = await self.httpx_session.get('https://www.tiktok.com/', headers=homepage_headers, timeout=15.0)
-            
-            # Extract and store cookies with robust error handling
-            cookies = {}
-            try:
-                for cookie in response.cookies:
-                    if hasattr(cookie, 'name') and hasattr(cookie, 'value'):
-                        cookies[cookie.name] = cookie.value
-                    elif isinstance(cookie, dict):
-                        # Handle dict-style cookies
-                        cookies[cookie.get('name', '')] = cookie.get('value', '')
-                    else:
-                        logger.debug(f"TikTok: Skipping malformed cookie: {type(cookie)}")
-                        
-                logger.info(f"TikTok: Collected {len(cookies)} cookies from homepage")
-                self.session_cookies['tiktok.com'] = cookies
-                return cookies
-                
-            except Exception as cookie_error:
-                logger.warning(f"TikTok: Cookie extraction failed: {cookie_error}")
-                # Return empty dict but don't crash
-                self.session_cookies['tiktok.com'] = {}
-                return {}
+            response = await self.httpx_session.get('https://www.tiktok.com/', headers=_TIKTOK_HOMEPAGE_HEADERS, timeout=15.0)
+            # Should report HTTP/2 - anything else means multiplexing is off
+            logger.debug("TikTok: homepage bootstrap negotiated %s", response.http_version)
+
+            # httpx cookie jars are plain name/value mappings; frozen so
+            # callers can't mutate the shared cached copy
+            cookies = MappingProxyType({k: v for k, v in response.cookies.items()})
+            logger.info(f"TikTok: Collected {len(cookies)} cookies from homepage")
+            self.session_cookies['tiktok.com'] = cookies
+            return cookies
             
         except Exception as e:
             logger.warning(f"TikTok: Failed to bootstrap cookies: {e}")
@@ -580,34 +1016,64 @@ class TikTokLiveChecker:
     async def _advanced_tiktok_request(self, username: str) -> tuple[str, str, int]:
         """Make advanced HTTP/2 request with full WAF bypass"""
         cookies = await self._get_session_cookies()
-        
-        # Advanced headers with session context
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36',
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8,application/signed-exchange;v=b3;q=0.7',
-            'Accept-Language': 'en-US,en;q=0.9,de;q=0.8',
-            'Accept-Encoding': 'gzip, deflate, br, zstd',
-            'DNT': '1',
-            'Connection': 'keep-alive',
-            'Upgrade-Insecure-Requests': '1',
-            'Sec-Fetch-Dest': 'document',
-            'Sec-Fetch-Mode': 'navigate',
-            'Sec-Fetch-Site': 'same-origin',
-            'Sec-Fetch-User': '?1',
-            'sec-ch-ua': '"Google Chrome";v="131", "Chromium";v="131", "Not_A Brand";v="24"',
-            'sec-ch-ua-mobile': '?0',
-            'sec-ch-ua-platform': '"Windows"',
-            'Cache-Control': 'max-age=0',
-            'Referer': 'https://www.tiktok.com/'
-        }
-        
+
         url = f'https://www.tiktok.com/@{username}/live'
-        
-        # Main request with cookies
-        response = await self.httpx_session.get(url, headers=headers, cookies=cookies, timeout=15.0)
-        html = response.text
-        
-        return html, str(response.url), len(html)
+
+        # Stream the page instead of awaiting the full body: once the
+        # SIGI_STATE JSON blob is complete the rest is CSS/JS we never
+        # look at authoritatively, so the download is aborted early.
+        # Pages without the blob are still read to the end (the pattern
+        # scoring fallback wants the whole page)
+        marker = b'window.__SIGI_STATE__'
+        buf = bytearray()
+        scan_from = 0
+        parse_pos = -1  # -1 until the marker has been seen
+        json_started = False
+        depth = 0
+        in_string = False
+        escape = False
+
+        # httpx wants a real dict for cookies, not the frozen proxy
+        async with self.httpx_session.stream('GET', url, headers=_TIKTOK_DESKTOP_HEADERS, cookies=dict(cookies), timeout=15.0) as response:
+            final_url = str(response.url)
+            async for chunk in response.aiter_bytes():
+                buf += chunk
+                if parse_pos < 0:
+                    found = buf.find(marker, scan_from)
+                    if found < 0:
+                        # Re-scan only the boundary region next time
+                        scan_from = max(0, len(buf) - len(marker) + 1)
+                        continue
+                    parse_pos = found + len(marker)
+                # Walk the JSON literal tracking brace depth; string-aware
+                # so a '}' inside a JSON string doesn't end the blob early
+                while parse_pos < len(buf):
+                    c = buf[parse_pos]
+                    parse_pos += 1
+                    if not json_started:
+                        if c == 0x7B:  # '{'
+                            json_started = True
+                            depth = 1
+                        continue
+                    if escape:
+                        escape = False
+                    elif c == 0x5C:  # '\\'
+                        escape = in_string
+                    elif c == 0x22:  # '"'
+                        in_string = not in_string
+                    elif not in_string:
+                        if c == 0x7B:
+                            depth += 1
+                        elif c == 0x7D:  # '}'
+                            depth -= 1
+                            if depth == 0:
+                                break
+                if json_started and depth == 0:
+                    logger.debug("TikTok %s: SIGI_STATE complete after %d bytes - aborting download", username, len(buf))
+                    break
+
+        html = buf.decode('utf-8', errors='replace')
+        return html, final_url, len(html)
     
     async def _mobile_api_request(self, username: str) -> tuple[str, str, int]:
         """Advanced TikTok Webcast API with proper JSON endpoints and sec_user_id"""
@@ -615,20 +1081,6 @@ class TikTokLiveChecker:
         
         try:
             # Step 1: Get user profile JSON to extract sec_user_id
-            profile_headers = {
-                'User-Agent': 'Mozilla/5.0 (iPhone; CPU iPhone OS 17_1 like Mac OS X) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.1 Mobile/15E148 Safari/604.1',
-                'Accept': 'application/json, text/plain, */*',
-                'Accept-Language': 'en-US,en;q=0.9',
-                'Accept-Encoding': 'gzip, deflate, br',
-                'Referer': 'https://www.tiktok.com/',
-                'Origin': 'https://www.tiktok.com',
-                'DNT': '1',
-                'Connection': 'keep-alive',
-                'Sec-Fetch-Dest': 'empty',
-                'Sec-Fetch-Mode': 'cors',
-                'Sec-Fetch-Site': 'same-origin'
-            }
-            
             # Try multiple API endpoints for user data
             api_endpoints = [
                 f'https://www.tiktok.com/api/user/detail/?uniqueId={username}',
@@ -636,41 +1088,60 @@ class TikTokLiveChecker:
                 f'https://m.tiktok.com/api/user/detail/?uniqueId={username}'
             ]
             
+            async def probe_user_api(endpoint):
+                response = await self.httpx_session.get(endpoint, headers=_TIKTOK_MOBILE_API_HEADERS, timeout=10.0)
+                if response.status_code == 200 and 'application/json' in response.headers.get('content-type', ''):
+                    # orjson on the raw bytes also skips httpx's charset detection
+                    data = _json_loads(response.content)
+
+                    # Extract user detail from various response structures
+                    user_detail = None
+                    if 'userInfo' in data:
+                        user_detail = data['userInfo'].get('user', {})
+                    elif 'user' in data:
+                        user_detail = data['user']
+                    elif 'userDetail' in data:
+                        user_detail = data['userDetail']
+
+                    if user_detail and 'secUid' in user_detail:
+                        return response, user_detail
+                return None
+
+            # Race the endpoints: the common case (first two 404) no longer
+            # costs their round-trips before the working one answers
             sec_user_id = None
-            for endpoint in api_endpoints:
-                try:
-                    response = await self.httpx_session.get(endpoint, headers=profile_headers, timeout=10.0)
-                    
-                    if response.status_code == 200 and 'application/json' in response.headers.get('content-type', ''):
-                        data = response.json()
-                        
-                        # Extract sec_user_id from various response structures
-                        user_detail = None
-                        if 'userInfo' in data:
-                            user_detail = data['userInfo'].get('user', {})
-                        elif 'user' in data:
-                            user_detail = data['user']
-                        elif 'userDetail' in data:
-                            user_detail = data['userDetail']
-                            
-                        if user_detail and 'secUid' in user_detail:
-                            sec_user_id = user_detail['secUid']
-                            logger.info(f"TikTok {username}: Got sec_user_id: {sec_user_id[:20]}...")
-                            
-                            # Check for roomId in user detail
-                            room_id = user_detail.get('roomId', '')
-                            if room_id and room_id != '0' and room_id != '':
-                                logger.info(f"TikTok {username}: ✅ LIVE detected via user API! Room: {room_id}")
-                                return 'LIVE_DETECTED_API', str(response.url), len(response.text)
-                            break
-                            
-                except Exception as api_error:
-                    logger.debug(f"TikTok {username}: API endpoint {endpoint} failed: {api_error}")
-                    continue
+            live_result = None
+            tasks = [asyncio.create_task(probe_user_api(endpoint)) for endpoint in api_endpoints]
+            try:
+                for finished in asyncio.as_completed(tasks):
+                    try:
+                        probe = await finished
+                    except Exception as api_error:
+                        logger.debug(f"TikTok {username}: API endpoint failed: {api_error}")
+                        continue
+                    if probe is None:
+                        continue
+                    response, user_detail = probe
+                    sec_user_id = user_detail['secUid']
+                    logger.info(f"TikTok {username}: Got sec_user_id: {sec_user_id[:20]}...")
+
+                    # Check for roomId in user detail
+                    room_id = user_detail.get('roomId', '')
+                    if room_id and room_id != '0':
+                        logger.info(f"TikTok {username}: ✅ LIVE detected via user API! Room: {room_id}")
+                        live_result = ('LIVE_DETECTED_API', str(response.url), len(response.text))
+                    break
+            finally:
+                for task in tasks:
+                    task.cancel()
+
+            if live_result:
+                return live_result
             
             # Step 2: If we have sec_user_id, try Webcast room/info endpoint  
             if sec_user_id:
-                webcast_headers = profile_headers.copy()
+                # Per-call copy: Referer carries the username
+                webcast_headers = dict(_TIKTOK_MOBILE_API_HEADERS)
                 webcast_headers.update({
                     'Referer': f'https://www.tiktok.com/@{username}/live',
                     'X-Requested-With': 'XMLHttpRequest'
@@ -683,53 +1154,51 @@ class TikTokLiveChecker:
                     f'https://m.tiktok.com/api/live/detail/?roomId={sec_user_id}'
                 ]
                 
-                for webcast_url in webcast_endpoints:
-                    try:
-                        response = await self.httpx_session.get(webcast_url, headers=webcast_headers, timeout=10.0)
-                        
-                        if response.status_code == 200 and response.text.strip().startswith('{'):
-                            data = response.json()
-                            
-                            # Check various live status indicators
-                            if 'data' in data and data['data']:
-                                room_data = data['data']
-                                status = room_data.get('status', 0)
-                                live_room = room_data.get('liveRoom')
-                                
-                                if status == 2 or (live_room and live_room.get('liveRoomStats')):
-                                    logger.info(f"TikTok {username}: ✅ LIVE detected via Webcast API!")
-                                    return 'LIVE_DETECTED_WEBCAST', str(response.url), len(response.text)
-                                elif status == 4 or status == 0:
-                                    logger.info(f"TikTok {username}: Webcast API confirms OFFLINE")
-                                    return 'OFFLINE_CONFIRMED_WEBCAST', str(response.url), len(response.text)
-                                    
-                    except Exception as webcast_error:
-                        logger.debug(f"TikTok {username}: Webcast endpoint failed: {webcast_error}")
-                        continue
+                async def probe_webcast(webcast_url):
+                    response = await self.httpx_session.get(webcast_url, headers=webcast_headers, timeout=10.0)
+                    if response.status_code == 200 and response.content.lstrip().startswith(b'{'):
+                        data = _json_loads(response.content)
+
+                        # Check various live status indicators
+                        if 'data' in data and data['data']:
+                            room_data = data['data']
+                            status = room_data.get('status', 0)
+                            live_room = room_data.get('liveRoom')
+
+                            if status == 2 or (live_room and live_room.get('liveRoomStats')):
+                                return 'LIVE_DETECTED_WEBCAST', str(response.url), len(response.text)
+                            elif status == 4 or status == 0:
+                                return 'OFFLINE_CONFIRMED_WEBCAST', str(response.url), len(response.text)
+                    return None
+
+                # Same race as above: first definitive webcast answer wins
+                tasks = [asyncio.create_task(probe_webcast(url)) for url in webcast_endpoints]
+                try:
+                    for finished in asyncio.as_completed(tasks):
+                        try:
+                            verdict = await finished
+                        except Exception as webcast_error:
+                            logger.debug(f"TikTok {username}: Webcast endpoint failed: {webcast_error}")
+                            continue
+                        if verdict is not None:
+                            if verdict[0] == 'LIVE_DETECTED_WEBCAST':
+                                logger.info(f"TikTok {username}: ✅ LIVE detected via Webcast API!")
+                            else:
+                                logger.info(f"TikTok {username}: Webcast API confirms OFFLINE")
+                            return verdict
+                finally:
+                    for task in tasks:
+                        task.cancel()
             
             # Step 3: Final fallback to mobile scraping (but classify WAF properly)
             logger.info(f"TikTok {username}: Falling back to mobile web scraping...")
             mobile_url = f'https://m.tiktok.com/@{username}/live'
-            
-            mobile_web_headers = {
-                'User-Agent': 'Mozilla/5.0 (iPhone; CPU iPhone OS 17_1 like Mac OS X) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.1 Mobile/15E148 Safari/604.1',
-                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
-                'Accept-Language': 'en-US,en;q=0.9',
-                'Accept-Encoding': 'gzip, deflate, br',
-                'DNT': '1',
-                'Connection': 'keep-alive',
-                'Upgrade-Insecure-Requests': '1',
-                'Sec-Fetch-Dest': 'document',
-                'Sec-Fetch-Mode': 'navigate',
-                'Sec-Fetch-Site': 'none',
-                'Sec-Fetch-User': '?1'
-            }
-            
-            response = await self.httpx_session.get(mobile_url, headers=mobile_web_headers, timeout=10.0)
+
+            response = await self.httpx_session.get(mobile_url, headers=_TIKTOK_MOBILE_WEB_HEADERS, timeout=10.0)
             html = response.text
             
             # Detect WAF/blocks and return appropriate status
-            if len(html) < 5000 and any(block_term in html.lower() for block_term in ['404 not found', 'guru meditation', 'slardar', 'blocked']):
+            if len(html) < 5000 and self._MOBILE_BLOCK_RE.search(html):
                 logger.warning(f"TikTok {username}: Mobile endpoint also blocked - returning UNKNOWN status")
                 return 'BLOCKED_UNKNOWN', str(response.url), len(html)
                 
@@ -742,96 +1211,62 @@ class TikTokLiveChecker:
     async def _get_tiktok_profile_data(self, username: str) -> Optional[Dict]:
         """Get TikTok profile data including profile image and follower count - works for offline users too"""
         try:
-            import aiohttp
-            import re
-            
             # Try both regular profile page and live page for better data extraction
             urls_to_try = [
                 f'https://www.tiktok.com/@{username}',  # Regular profile page
                 f'https://www.tiktok.com/@{username}/live'  # Live page (if available)
             ]
-            
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-                'Accept-Language': 'en-US,en;q=0.9,de;q=0.8',
-                'Accept-Encoding': 'gzip, deflate, br',
-                'Connection': 'keep-alive',
-                'Upgrade-Insecure-Requests': '1',
-                'Cache-Control': 'no-cache'
-            }
-            
-            timeout = aiohttp.ClientTimeout(total=15)
-            
-            if not hasattr(self, 'session') or not self.session:
-                self.session = aiohttp.ClientSession(timeout=timeout)
-            
+
+            # Reuse the shared HTTP/2 session instead of spinning up a
+            # separate aiohttp client just for profile scraping
+            await self._init_session()
+            cookies = await self._get_session_cookies()
+
             for url in urls_to_try:
                 try:
-                    async with self.session.get(url, headers=headers, timeout=timeout) as response:
-                        if response.status == 200:
-                            html = await response.text()
-                            
-                            # Extract profile image with improved patterns
-                            profile_image_url = ''
-                            avatar_patterns = [
-                                r'"avatarLarger":"([^"]+)"',
-                                r'"avatarMedium":"([^"]+)"', 
-                                r'"avatarThumb":"([^"]+)"',
-                                r'"avatar_300x300":\{"uri":"([^"]+)"',
-                                r'"avatar_168x168":\{"uri":"([^"]+)"',
-                                r'"avatar_larger":\{"uri":"([^"]+)"',
-                                r'"avatar_medium":\{"uri":"([^"]+)"',
-                                r'avatarLarger.*?"([^"]*\\.jpg[^"]*)"',
-                                r'avatarMedium.*?"([^"]*\\.jpg[^"]*)"',
-                                r'profile_pic_url_hd":"([^"]+)"'
-                            ]
-                            
-                            for pattern in avatar_patterns:
-                                matches = re.findall(pattern, html)
-                                if matches:
-                                    profile_image_url = matches[0]
-                                    # Clean up URL format
-                                    if profile_image_url.startswith('//'):
-                                        profile_image_url = f"https:{profile_image_url}"
-                                    elif not profile_image_url.startswith('http'):
-                                        profile_image_url = f"https:{profile_image_url}"
-                                    
-                                    # Validate URL format
-                                    if '.jpg' in profile_image_url or '.png' in profile_image_url or '.webp' in profile_image_url:
+                    response = await self.httpx_session.get(url, headers=_TIKTOK_PROFILE_HEADERS, cookies=dict(cookies), timeout=15.0)
+                    if response.status_code == 200:
+                        html = response.text
+
+                        # Extract profile image with precompiled patterns;
+                        # search() stops at the first hit instead of
+                        # findall() collecting every occurrence
+                        profile_image_url = ''
+                        for pattern in self._AVATAR_PATTERNS:
+                            match = pattern.search(html)
+                            if match:
+                                profile_image_url = match.group(1)
+                                # Clean up URL format
+                                if profile_image_url.startswith('//'):
+                                    profile_image_url = f"https:{profile_image_url}"
+                                elif not profile_image_url.startswith('http'):
+                                    profile_image_url = f"https:{profile_image_url}"
+
+                                # Validate URL format
+                                if '.jpg' in profile_image_url or '.png' in profile_image_url or '.webp' in profile_image_url:
+                                    break
+
+                        # Extract follower count with precompiled patterns
+                        follower_count = 0
+                        for pattern in self._FOLLOWER_PATTERNS:
+                            match = pattern.search(html)
+                            if match:
+                                try:
+                                    # Get first numeric value
+                                    follower_str = self._NON_DIGIT_RE.sub('', match.group(1))
+                                    if follower_str:
+                                        follower_count = int(follower_str)
                                         break
-                            
-                            # Extract follower count with improved patterns
-                            follower_count = 0
-                            follower_patterns = [
-                                r'"followerCount":(\d+)',
-                                r'"followingCount":(\d+)',
-                                r'data-e2e="followers-count">([^<]+)',
-                                r'"stats":\{"followerCount":(\d+)',
-                                r'"userInfo":\{[^}]*"stats":\{[^}]*"followerCount":(\d+)',
-                                r'followersCount.*?(\d+)',
-                                r'"follower_count":(\d+)'
-                            ]
-                            
-                            for pattern in follower_patterns:
-                                matches = re.findall(pattern, html)
-                                if matches:
-                                    try:
-                                        # Get first numeric value
-                                        follower_str = re.sub(r'[^\d]', '', str(matches[0]))
-                                        if follower_str:
-                                            follower_count = int(follower_str)
-                                            break
-                                    except (ValueError, IndexError):
-                                        continue
-                            
-                            if profile_image_url or follower_count > 0:
-                                logger.info(f"TikTok {username}: Profile data extracted from {url} - Image: {'Yes' if profile_image_url else 'No'}, Followers: {follower_count}")
-                                return {
-                                    'profile_image_url': profile_image_url,
-                                    'follower_count': follower_count
-                                }
-                
+                                except (ValueError, IndexError):
+                                    continue
+
+                        if profile_image_url or follower_count > 0:
+                            logger.info(f"TikTok {username}: Profile data extracted from {url} - Image: {'Yes' if profile_image_url else 'No'}, Followers: {follower_count}")
+                            return {
+                                'profile_image_url': profile_image_url,
+                                'follower_count': follower_count
+                            }
+
                 except Exception as url_error:
                     logger.warning(f"TikTok {username}: Failed to fetch {url}: {url_error}")
                     continue
@@ -846,21 +1281,24 @@ class TikTokLiveChecker:
 
     async def _extract_sigi_state(self, html: str, username: str) -> Optional[Dict]:
         """Extract and parse SIGI_STATE JSON for robust live detection"""
-        import re
-        import json
-        
-        # Look for SIGI_STATE script
-        sigi_patterns = [
-            r'window\.__SIGI_STATE__\s*=\s*({.*?});',
-            r'window\.__SIGI_STATE__=({.*?});',
-            r'__SIGI_STATE__\s*=\s*({.*?})',
-        ]
-        
-        for pattern in sigi_patterns:
-            matches = re.findall(pattern, html, re.DOTALL)
-            if matches:
+        # Cheap anchor scan first: str.find rejects pages without the blob
+        # in microseconds, and the DOTALL regexes below then only see a
+        # bounded window starting at the anchor instead of the whole page
+        for anchor in ('window.__SIGI_STATE__', '__SIGI_STATE__'):
+            idx = html.find(anchor)
+            if idx >= 0:
+                break
+        else:
+            return None
+        window = html[idx:idx + _SIGI_MAX_LEN]
+
+        # Precompiled patterns; search() stops at the first hit instead of
+        # findall() materializing every megabyte-sized match
+        for pattern in _SIGI_PATTERNS:
+            match = pattern.search(window)
+            if match:
                 try:
-                    sigi_data = json.loads(matches[0])
+                    sigi_data = _json_loads(match.group(1))
                     logger.info(f"TikTok {username}: SIGI_STATE extracted successfully")
                     
                     # Navigate SIGI structure for live room data
@@ -911,12 +1349,158 @@ class TikTokLiveChecker:
                     
                 except Exception as parse_error:
                     logger.warning(f"TikTok {username}: SIGI_STATE parse error: {parse_error}")
-        
+
+        return None
+
+    async def _api_probe(self, username: str) -> Optional[Dict]:
+        """API strategy: user-detail/webcast JSON endpoints, one round-trip.
+
+        Returns an authoritative verdict dict, a weak 'blocked' verdict
+        when every endpoint is WAF-blocked, or None when inconclusive."""
+        async with _tiktok_host_sem:
+            verdict, _, _ = await self._mobile_api_request(username)
+
+        if verdict in ('LIVE_DETECTED_API', 'LIVE_DETECTED_WEBCAST'):
+            method = 'webcast_api' if 'WEBCAST' in verdict else 'user_api'
+            self.waf_backoff.pop(username, None)  # API answered - no longer blocked
+            logger.info(f"TikTok {username}: ✅ LIVE confirmed via API probe ({method})")
+            return {
+                'is_live': True,
+                'viewer_count': 0,
+                'game_name': 'TikTok Live',
+                'title': f'{username} Live Stream',
+                'thumbnail_url': '',
+                'profile_image_url': '',
+                'platform_url': f'https://www.tiktok.com/@{username}/live',
+                'follower_count': 0,
+                'method': method
+            }
+        if verdict in ('OFFLINE_CONFIRMED_API', 'OFFLINE_CONFIRMED_WEBCAST'):
+            method = 'webcast_api' if 'WEBCAST' in verdict else 'user_api'
+            self.waf_backoff.pop(username, None)  # API answered - no longer blocked
+            logger.info(f"TikTok {username}: API probe confirms OFFLINE ({method})")
+            return {'is_live': False, 'method': method}
+        if verdict == 'BLOCKED_UNKNOWN':
+            logger.warning(f"TikTok {username}: All API endpoints blocked - status UNKNOWN")
+            return {'is_live': False, 'method': 'blocked_unknown', 'blocked': True}
+        # API_ERROR or scraped mobile HTML - inconclusive
         return None
 
+    async def _html_probe(self, username: str) -> Optional[Dict]:
+        """HTML strategy: desktop /live page, SIGI_STATE plus pattern scoring.
+
+        Returns a verdict dict, or None when the WAF served a block page."""
+        async with _tiktok_host_sem:
+            html, final_url, html_size = await self._advanced_tiktok_request(username)
+
+        logger.info(f"TikTok {username}: Advanced request - URL: {'/live' in final_url}, Size: {html_size} chars")
+
+        # Check for SlardarWAF block or 404 errors
+        if html_size < 5000 and self._BLOCK_RE.search(html):
+            logger.warning(f"TikTok {username}: WAF/Block detected (size: {html_size}) - HTML strategy inconclusive")
+            return None
+        self.waf_backoff.pop(username, None)  # Real page came through - reset the counter
+
+        # SIGI_STATE parsing (most reliable)
+        sigi_result = await self._extract_sigi_state(html, username)
+        if sigi_result:
+            logger.info(f"TikTok {username}: ✅ LIVE detected via SIGI_STATE!")
+            return {
+                'is_live': True,
+                'viewer_count': 0,
+                'game_name': 'TikTok Live',
+                'title': f'{username} Live Stream',
+                'thumbnail_url': '',
+                'profile_image_url': '',
+                'platform_url': f'https://www.tiktok.com/@{username}/live',
+                'follower_count': 0,
+                'method': 'advanced_sigi_state'
+            }
+
+        # Enhanced pattern matching - all indicators found in a single pass
+        found_indicators = {match.group(0) for match in self._LIVE_IND_RE.finditer(html)}
+        indicator_count = len(found_indicators)
+        url_has_live = '/live' in final_url
+        # finditer, not findall: counting should not materialize a
+        # list with thousands of tiny match strings
+        live_mentions = sum(1 for _ in self._LIVE_WORD_RE.finditer(html))
+
+        logger.info(f"TikTok {username}: Enhanced detection - URL: {url_has_live}, Indicators: {indicator_count}/8, Live mentions: {live_mentions}")
+
+        # Scoring system as table lookups: indicators 0/1/3, live
+        # mentions binned at >500/>1000 (many mentions suggests a
+        # full page), plus /live URL and >50KB page (not blocked)
+        detection_score = (
+            self._IND_SCORES[min(indicator_count, 2)]
+            + self._LM_SCORES[bisect_left(self._LM_BOUNDS, live_mentions)]
+            + url_has_live
+            + (html_size > 50000)
+        )
+
+        is_likely_live = detection_score >= 6  # Raised threshold to reduce false positives
+
+        logger.info(f"TikTok {username}: Detection score: {detection_score}/8, Live: {is_likely_live}")
+
+        if is_likely_live:
+            logger.info(f"TikTok {username}: ✅ LIVE detected via enhanced patterns!")
+            return {
+                'is_live': True,
+                'viewer_count': 0,
+                'game_name': 'TikTok Live',
+                'title': f'{username} Live Stream',
+                'thumbnail_url': '',
+                'profile_image_url': '',
+                'platform_url': f'https://www.tiktok.com/@{username}/live',
+                'follower_count': 0,
+                'method': 'advanced_patterns'
+            }
+
+        # Log sample for debugging
+        html_sample = html[:500] if len(html) > 500 else html
+        logger.info(f"TikTok {username}: HTML sample: {html_sample[:200]}...")
+        logger.info(f"TikTok {username}: Page size: {html_size} characters")
+
+        # Return offline if no live detection
+        return {'is_live': False, 'method': 'advanced_bypass_offline'}
+
     async def get_stream_info(self, username: str) -> Optional[Dict]:
         """Get stream information for a TikTok user with improved double verification"""
-        
+        # Fresh verdict still cached? monotonic clock is immune to NTP steps
+        cached = self._result_cache.get(username)
+        if cached and time.monotonic() - cached[0] < self.RESULT_CACHE_TTL:
+            return dict(cached[1])
+
+        # Single-flight: a second poll for the same user while the first is
+        # still fighting the WAF awaits that result instead of firing its
+        # own request cascade
+        fut = self._inflight.get(username)
+        if fut is not None:
+            return await asyncio.shield(fut)
+
+        fut = asyncio.get_event_loop().create_future()
+        self._inflight[username] = fut
+
+        result = None
+        try:
+            result = await self._do_get_stream_info(username)
+            if result is not None:
+                self._result_cache[username] = (time.monotonic(), result)
+        finally:
+            if not fut.done():
+                fut.set_result(result)
+            self._inflight.pop(username, None)
+
+        return result
+
+    async def _do_get_stream_info(self, username: str) -> Optional[Dict]:
+        # Respect the recorded WAF cooldown before any network I/O - polling
+        # a known-blocked user just extends the block
+        backoff_entry = self.waf_backoff.get(username)
+        if backoff_entry and time.time() < backoff_entry['next_check']:
+            remaining = int(backoff_entry['next_check'] - time.time())
+            logger.info("TikTok %s: WAF backoff active, skipping check (%ds remaining)", username, remaining)
+            return {'is_live': False, 'method': 'waf_backoff_active'}
+
         # 🚀 PRIORITÄT 1: Neue doppelte Verifikation (TikTokLive + HTML-Parsing)
         if IMPROVED_TIKTOK_CHECKER_AVAILABLE:
             try:
@@ -942,8 +1526,37 @@ class TikTokLiveChecker:
         try:
             # Initialize session if needed
             await self._init_session()
-            
-            # Try TikTokLive library first, but fallback to advanced detection if it fails
+
+            # Race the two independent strategies instead of walking them
+            # as a chain: latency becomes the fastest round-trip instead
+            # of the sum, and the host semaphore keeps the burst bounded.
+            # First authoritative verdict wins; a weak 'blocked' verdict
+            # is remembered but the other strategy may still overrule it
+            weak_verdict = None
+            tasks = [
+                asyncio.create_task(self._api_probe(username)),
+                asyncio.create_task(self._html_probe(username)),
+            ]
+            try:
+                for finished in asyncio.as_completed(tasks):
+                    try:
+                        verdict = await finished
+                    except Exception as strategy_error:
+                        logger.debug(f"TikTok {username}: Detection strategy failed: {strategy_error}")
+                        continue
+                    if verdict is None:
+                        continue
+                    if verdict.get('blocked'):
+                        weak_verdict = verdict
+                        continue
+                    return verdict
+            finally:
+                for task in tasks:
+                    task.cancel()
+
+            # Both strategies blocked or inconclusive - the heavyweight
+            # TikTokLive client (WebSocket + room download + signer) is
+            # the last resort before declaring the status unknown
             try:
                 logger.info(f"TikTok {username}: Attempting TikTokLive library import...")
                 from TikTokLive.client.client import TikTokLiveClient
@@ -1022,146 +1635,16 @@ class TikTokLiveChecker:
             except Exception as offline_error:
                 if "UserOfflineError" in str(offline_error):
                     logger.info(f"TikTok {username}: TikTokLive library confirmed - user offline")
-                else:
-                    logger.error(f"TikTok {username}: TikTokLive library error: {offline_error}")
-                    raise Exception("TikTokLive failed")
-                return {'is_live': False}
-            except Exception as e:
-                # TikTokLive failed, fall back to URL-based detection
-                logger.error(f"TikTok {username}: TikTokLive library failed: {e}")
-                raise Exception("TikTokLive failed")
-        
-        except Exception:
-            # Advanced WAF bypass fallback with HTTP/2 and session management
-            logger.info(f"TikTok {username}: Starting advanced WAF bypass detection...")
-            
-            try:
-                # Method 1: Advanced HTTP/2 request with session cookies
-                html, final_url, html_size = await self._advanced_tiktok_request(username)
-                
-                logger.info(f"TikTok {username}: Advanced request - URL: {'/live' in final_url}, Size: {html_size} chars")
-                
-                # Check for SlardarWAF block or 404 errors  
-                is_blocked = (html_size < 5000 and any(block_indicator in html.lower() for block_indicator in ['slardar', 'guru meditation', '404 not found', 'tlb']))
-                
-                if is_blocked:
-                    logger.warning(f"TikTok {username}: WAF/Block detected (size: {html_size}), trying mobile API...")
-                    # Method 2: Advanced mobile API
-                    html, final_url, html_size = await self._mobile_api_request(username)
-                    logger.info(f"TikTok {username}: Mobile API result - Size: {html_size} chars")
-                    
-                    # Handle API responses with proper classification
-                    if html in ['LIVE_DETECTED_API', 'LIVE_DETECTED_WEBCAST']:
-                        method = 'webcast_api' if 'WEBCAST' in html else 'user_api'
-                        return {
-                            'is_live': True,
-                            'viewer_count': 0,
-                            'game_name': 'TikTok Live',
-                            'title': f'{username} Live Stream',
-                            'thumbnail_url': '',
-                            'profile_image_url': '',
-                            'platform_url': f'https://www.tiktok.com/@{username}/live',
-                            'follower_count': 0,
-                            'method': method
-                        }
-                    elif html in ['OFFLINE_CONFIRMED_API', 'OFFLINE_CONFIRMED_WEBCAST']:
-                        method = 'webcast_api' if 'WEBCAST' in html else 'user_api'
-                        return {'is_live': False, 'method': method}
-                    elif html == 'BLOCKED_UNKNOWN':
-                        logger.warning(f"TikTok {username}: All endpoints blocked - status UNKNOWN")
-                        return {'is_live': False, 'method': 'blocked_unknown', 'blocked': True}
-                    elif html == 'API_ERROR':
-                        logger.error(f"TikTok {username}: All API endpoints failed")
-                        return {'is_live': False, 'method': 'api_error'}
-                    # Continue with HTML analysis if API inconclusive
-                
-                # Method 3: SIGI_STATE parsing (most reliable)
-                sigi_result = await self._extract_sigi_state(html, username)
-                if sigi_result:
-                    logger.info(f"TikTok {username}: ✅ LIVE detected via SIGI_STATE!")
-                    return {
-                        'is_live': True,
-                        'viewer_count': 0,
-                        'game_name': 'TikTok Live',
-                        'title': f'{username} Live Stream',
-                        'thumbnail_url': '',
-                        'profile_image_url': '',
-                        'platform_url': f'https://www.tiktok.com/@{username}/live',
-                        'follower_count': 0,
-                        'method': 'advanced_sigi_state'
-                    }
-                
-                # Method 4: Enhanced pattern matching
-                live_indicators = [
-                    '"live_status":1',
-                    'isLiving":true', 
-                    '"liveRoomId":"',
-                    '"roomStatus":2',
-                    'data-e2e="live-avatar"',
-                    'live-indicator',
-                    '"status":"live"',
-                    'is LIVE - TikTok LIVE'  # Title indicator
-                ]
-                
-                indicator_count = sum(1 for indicator in live_indicators if indicator in html)
-                url_has_live = '/live' in final_url
-                live_mentions = html.lower().count('live')
-                
-                # Debug info
-                found_indicators = [indicator for indicator in live_indicators if indicator in html]
-                logger.info(f"TikTok {username}: Enhanced detection - URL: {url_has_live}, Indicators: {indicator_count}/8, Live mentions: {live_mentions}")
-                
-                # Enhanced detection logic
-                is_likely_live = False
-                detection_score = 0
-                
-                # Scoring system
-                if indicator_count >= 2:
-                    detection_score += 3
-                elif indicator_count >= 1:
-                    detection_score += 1
-                    
-                if live_mentions > 1000:  # Many live mentions suggests full page (higher threshold)
-                    detection_score += 2
-                elif live_mentions > 500:
-                    detection_score += 1
-                    
-                if url_has_live:
-                    detection_score += 1
-                    
-                if html_size > 50000:  # Large page suggests not blocked
-                    detection_score += 1
-                
-                is_likely_live = detection_score >= 6  # Raised threshold to reduce false positives
-                
-                logger.info(f"TikTok {username}: Detection score: {detection_score}/8, Live: {is_likely_live}")
-                
-                if is_likely_live:
-                    logger.info(f"TikTok {username}: ✅ LIVE detected via enhanced patterns!")
-                    return {
-                        'is_live': True,
-                        'viewer_count': 0,
-                        'game_name': 'TikTok Live',
-                        'title': f'{username} Live Stream',
-                        'thumbnail_url': '',
-                        'profile_image_url': '',
-                        'platform_url': f'https://www.tiktok.com/@{username}/live',
-                        'follower_count': 0,
-                        'method': 'advanced_patterns'
-                    }
-                
-                # Log sample for debugging
-                html_sample = html[:500] if len(html) > 500 else html
-                logger.info(f"TikTok {username}: HTML sample: {html_sample[:200]}...")
-                logger.info(f"TikTok {username}: Page size: {html_size} characters")
-                
-                # Return offline if no live detection
-                return {'is_live': False, 'method': 'advanced_bypass_offline'}
-                
-            except Exception as e:
-                logger.error(f"TikTok {username}: Advanced WAF bypass failed: {e}")
+                    return {'is_live': False}
+                logger.error(f"TikTok {username}: TikTokLive library error: {offline_error}")
+                if weak_verdict is not None:
+                    # Every endpoint blocked and the last resort failed too -
+                    # now the block verdict stands, so record the backoff
+                    logger.warning(f"TikTok {username}: All endpoints blocked - status UNKNOWN")
+                    self._implement_waf_backoff(username)
+                    return weak_verdict
                 return {'is_live': False, 'method': 'advanced_bypass_error'}
-        
+
         except Exception as e:
             logger.error(f"TikTok {username}: Complete detection failed: {e}")
             return {'is_live': False, 'method': 'complete_error'}
@@ -1169,7 +1652,7 @@ class TikTokLiveChecker:
 # Initialize platform APIs
 twitch_api = TwitchAPI()
 youtube_api = YouTubeAPI()
-# Old TikTokLiveChecker removed - using improved_tiktok_checker from live_checker.py
+# Old TikTokLiveChecker removed - using improved_tiktok_checker from tiktok.py
 
 # Username Validation Functions
 async def validate_username(platform: str, username: str) -> bool:
@@ -1311,6 +1794,45 @@ creator_data_cache = {}  # Keep for backward compatibility
 
 # ========== NEW PLATFORM COORDINATION SYSTEM ==========
 
+# Per-creator hint of which platform is currently live (creator_id -> (platform, timestamp)).
+# While the hint is fresh, the other platform tasks skip their polls - creators
+# rarely broadcast on more than one platform at the same time.
+live_hint: Dict[int, Tuple[str, float]] = {}
+LIVE_HINT_TTL = 300  # 5 minutes
+
+def set_live_hint(creator_id, platform):
+    """Remember which platform this creator is actively live on"""
+    live_hint[creator_id] = (platform, time.time())
+
+def clear_live_hint(creator_id, platform):
+    """Drop the hint when its platform goes offline so other polls resume"""
+    hint = live_hint.get(creator_id)
+    if hint and hint[0] == platform:
+        live_hint.pop(creator_id, None)
+
+def get_live_hint(creator_id):
+    """Return the hinted live platform, or None if there is no fresh hint"""
+    hint = live_hint.get(creator_id)
+    if not hint:
+        return None
+    platform, timestamp = hint
+    if time.time() - timestamp > LIVE_HINT_TTL:
+        live_hint.pop(creator_id, None)
+        return None
+    return platform
+
+def _db_load_live_hints():
+    """Blocking: load currently live platforms to seed hints after a restart"""
+    conn = db.get_connection()
+    try:
+        cursor = conn.cursor()
+        cursor.execute(
+            'SELECT creator_id, primary_platform FROM live_status WHERE is_live = TRUE AND primary_platform IS NOT NULL'
+        )
+        return cursor.fetchall()
+    finally:
+        conn.close()
+
 async def refresh_creators_cache():
     """Refresh the creators cache for platform tasks"""
     global creators_cache
@@ -1331,6 +1853,12 @@ async def platform_notification_coordinator(creator_id, discord_user_id, usernam
     try:
         # This is the bridge between new platform tasks and existing notification system
         await handle_stream_status(creator_id, discord_user_id, username, streamer_type, channel_id, platform, platform_username, stream_info)
+
+        # Keep the primary-platform hint in sync so the other tasks can skip polls
+        if stream_info.get('is_live'):
+            set_live_hint(creator_id, platform)
+        else:
+            clear_live_hint(creator_id, platform)
     except Exception as e:
         logger.error(f"❌ Error in platform notification coordinator for {username} on {platform}: {e}")
 
@@ -1343,7 +1871,11 @@ async def start_new_platform_tasks():
         
         # Refresh creators cache
         creators = await refresh_creators_cache()
-        
+
+        # Seed live hints from the DB so a restart keeps skipping cross-platform polls
+        for hint_creator_id, hint_platform in await run_db(_db_load_live_hints):
+            live_hint[hint_creator_id] = (hint_platform, time.time())
+
         # Start Twitch platform task
         logger.info("🎮 Starting Twitch platform task...")
         platform_tasks['twitch'] = asyncio.create_task(
@@ -1396,16 +1928,32 @@ async def enhanced_twitch_platform_task(db, bot, creators):
                 continue
             
             platform_task_heartbeats['twitch'] = datetime.now()
+
+            # Skip creators whose fresh hint says they are live elsewhere
+            twitch_creators = [c for c in twitch_creators if get_live_hint(c[0]) in (None, 'twitch')]
             logger.debug(f"🎮 Checking {len(twitch_creators)} Twitch creators")
-            
+
+            # One batched Helix call for all creators instead of 3 calls each
+            try:
+                stream_infos = await twitch_api.get_streams_bulk([c[5] for c in twitch_creators])
+            except Exception as e:
+                # Skip the whole cycle: substituting empty results would mark
+                # every creator offline and strip live roles on a transient error
+                logger.error(f"🎮 Bulk Twitch check failed: {e}")
+                await asyncio.sleep(30)
+                continue
+
             for creator in twitch_creators:
                 creator_id, discord_user_id, username, streamer_type, channel_id, twitch_user, youtube_user, tiktok_user = creator
-                
+
                 try:
-                    # Check if user is live using the imported twitch_api
-                    stream_info = await twitch_api.get_stream_info(twitch_user)
-                    
-                    if stream_info and stream_info.get('is_live'):
+                    stream_info = stream_infos.get(twitch_user)
+                    if stream_info is None:
+                        # This login wasn't checked this cycle (partial API
+                        # failure) - leave its live status untouched
+                        continue
+
+                    if stream_info.get('is_live'):
                         logger.info(f"🎮 {twitch_user} is LIVE on Twitch!")
                         # Trigger notification through coordinator
                         await platform_notification_coordinator(
@@ -1422,10 +1970,10 @@ async def enhanced_twitch_platform_task(db, bot, creators):
                     
                 except Exception as e:
                     logger.error(f"🎮 Error checking Twitch user {twitch_user}: {e}")
-                
-                # Small delay between checks to avoid rate limits
-                await asyncio.sleep(2)
-            
+
+                # No per-creator delay needed anymore - the API work is batched
+                await asyncio.sleep(0)
+
             # Determine wait time based on streamer types
             karma_creators = [c for c in twitch_creators if c[3] == 'karma']
             if karma_creators:
@@ -1458,7 +2006,12 @@ async def enhanced_youtube_platform_task(db, bot, creators):
             
             for creator in youtube_creators:
                 creator_id, discord_user_id, username, streamer_type, channel_id, twitch_user, youtube_user, tiktok_user = creator
-                
+
+                # Creator is actively live on another platform - skip the scrape
+                hinted = get_live_hint(creator_id)
+                if hinted and hinted != 'youtube':
+                    continue
+
                 try:
                     # Check if user is live using the imported youtube_api
                     stream_info = await youtube_api.get_stream_info(youtube_user)
@@ -1512,7 +2065,12 @@ async def enhanced_tiktok_platform_task(db, bot, creators):
             
             for creator in tiktok_creators:
                 creator_id, discord_user_id, username, streamer_type, channel_id, twitch_user, youtube_user, tiktok_user = creator
-                
+
+                # Creator is actively live on another platform - skip the check
+                hinted = get_live_hint(creator_id)
+                if hinted and hinted != 'tiktok':
+                    continue
+
                 try:
                     # Check if user is live using the imported improved_tiktok_checker
                     stream_info = await improved_tiktok_checker.is_user_live(tiktok_user)
@@ -1779,24 +2337,76 @@ async def check_creator_platforms(creator_id, discord_user_id, username, streame
         except Exception as e:
             logger.error(f"Error checking {platform} for {username}: {e}")
 
+# SQL for the per-tick polling helpers as module constants: the pooled
+# connections keep their sqlite3 statement cache keyed by SQL text, so
+# reusing the identical string skips the parse+plan step on every check
+_SQL_GET_LIVE_STATUS = 'SELECT is_live, last_notification_date FROM live_status WHERE creator_id = ? AND platform = ?'
+_SQL_GET_NOTIFICATION_MESSAGE = 'SELECT message_id, notification_channel_id FROM live_status WHERE creator_id = ? AND platform = ?'
+_SQL_MARK_LIVE = '''
+    INSERT OR REPLACE INTO live_status
+    (creator_id, platform, is_live, last_notification_date, stream_start_time, primary_platform)
+    VALUES (?, ?, TRUE, ?, ?, ?)
+'''
+_SQL_MARK_OFFLINE_CLEAR = 'UPDATE live_status SET is_live = FALSE, primary_platform = NULL, message_id = NULL, notification_channel_id = NULL, last_notification_date = NULL WHERE creator_id = ? AND platform = ?'
+_SQL_MARK_OFFLINE_KEEP = 'UPDATE live_status SET is_live = FALSE, primary_platform = NULL WHERE creator_id = ? AND platform = ?'
+_SQL_COUNT_LIVE = 'SELECT COUNT(*) FROM live_status WHERE creator_id = ? AND is_live = TRUE'
+
+def _db_get_live_status(creator_id, platform):
+    """Blocking: read current live status for one creator/platform pair"""
+    conn = db.get_connection()
+    try:
+        cursor = conn.cursor()
+        cursor.execute(_SQL_GET_LIVE_STATUS, (creator_id, platform))
+        return cursor.fetchone()
+    finally:
+        conn.close()
+
+def _db_get_notification_message(creator_id, platform):
+    """Blocking: read the stored notification message reference"""
+    conn = db.get_connection()
+    try:
+        cursor = conn.cursor()
+        cursor.execute(_SQL_GET_NOTIFICATION_MESSAGE, (creator_id, platform))
+        return cursor.fetchone()
+    finally:
+        conn.close()
+
+def _db_mark_live(creator_id, platform, notif_date, start_time):
+    """Blocking: persist the live transition (committed immediately)"""
+    conn = db.get_connection()
+    try:
+        conn.execute(_SQL_MARK_LIVE, (creator_id, platform, notif_date, start_time, platform))
+        conn.commit()
+    finally:
+        conn.close()
+
+def _db_mark_offline(creator_id, platform, clear_message):
+    """Blocking: persist the offline transition, return remaining live platform count"""
+    conn = db.get_connection()
+    try:
+        cursor = conn.cursor()
+        if clear_message:
+            cursor.execute(_SQL_MARK_OFFLINE_CLEAR, (creator_id, platform))
+        else:
+            # Only set offline but keep message IDs for retry
+            cursor.execute(_SQL_MARK_OFFLINE_KEEP, (creator_id, platform))
+        cursor.execute(_SQL_COUNT_LIVE, (creator_id,))
+        live_count = cursor.fetchone()[0]
+        conn.commit()
+        return live_count
+    finally:
+        conn.close()
+
 async def handle_stream_status(creator_id, discord_user_id, username, streamer_type, channel_id, platform, platform_username, stream_info):
     """Handle stream status and send notifications if needed"""
-    conn = None
     try:
-        conn = db.get_connection()
-        cursor = conn.cursor()
-        
         is_live = stream_info.get('is_live', False)
         today = datetime.now().date()
-        
+
         logger.info(f"Handling stream status for {username} on {platform}: is_live={is_live}")
-        
-        # Get current live status from database
-        cursor.execute(
-            'SELECT is_live, last_notification_date FROM live_status WHERE creator_id = ? AND platform = ?',
-            (creator_id, platform)
-        )
-        current_status = cursor.fetchone()
+
+        # Get current live status from database (off the event loop)
+        current_status = await run_db(_db_get_live_status, creator_id, platform)
         
         if is_live:
             # Update or insert live status
@@ -1808,12 +2418,8 @@ async def handle_stream_status(creator_id, discord_user_id, username, streamer_t
                 message_still_exists = False
                 if was_live and last_notif_date == today:
                     # Get message_id to check if it still exists
-                    cursor.execute(
-                        'SELECT message_id, notification_channel_id FROM live_status WHERE creator_id = ? AND platform = ?',
-                        (creator_id, platform)
-                    )
-                    message_data = cursor.fetchone()
-                    
+                    message_data = await run_db(_db_get_notification_message, creator_id, platform)
+
                     if message_data and message_data[0] and message_data[1]:
                         message_id, notification_channel_id = message_data
                         try:
@@ -1850,13 +2456,8 @@ async def handle_stream_status(creator_id, discord_user_id, username, streamer_t
             
             if should_notify:
                 # Update live status FIRST to prevent repeated notifications
-                cursor.execute('''
-                    INSERT OR REPLACE INTO live_status 
-                    (creator_id, platform, is_live, last_notification_date, stream_start_time)
-                    VALUES (?, ?, TRUE, ?, ?)
-                ''', (creator_id, platform, today.isoformat(), datetime.now().isoformat()))
-                
-                conn.commit()  # Commit immediately to prevent repeated notifications
+                # (helper commits immediately)
+                await run_db(_db_mark_live, creator_id, platform, today.isoformat(), datetime.now().isoformat())
                 logger.info(f"Updated live status for {username} on {platform}")
                 
                 # Send live notification AFTER status is saved (CRASH-RESISTANT)
@@ -1916,12 +2517,8 @@ async def handle_stream_status(creator_id, discord_user_id, username, streamer_t
             # Update live status to offline
             if current_status and current_status[0]:  # Was live before
                 # Get message_id and notification_channel_id for deletion
-                cursor.execute(
-                    'SELECT message_id, notification_channel_id FROM live_status WHERE creator_id = ? AND platform = ?',
-                    (creator_id, platform)
-                )
-                message_data = cursor.fetchone()
-                
+                message_data = await run_db(_db_get_notification_message, creator_id, platform)
+
                 # Delete live notification message if it exists
                 message_deleted = False
                 if message_data and message_data[0] and message_data[1]:
@@ -1963,27 +2560,10 @@ async def handle_stream_status(creator_id, discord_user_id, username, streamer_t
                 
                 # Update database: set offline and clear message IDs AND last_notification_date only if deletion succeeded or message not found
                 # This ensures a new notification will be sent if the user goes live again
-                if message_deleted:
-                    cursor.execute(
-                        'UPDATE live_status SET is_live = FALSE, message_id = NULL, notification_channel_id = NULL, last_notification_date = NULL WHERE creator_id = ? AND platform = ?',
-                        (creator_id, platform)
-                    )
-                else:
-                    # Only set offline but keep message IDs for retry
-                    cursor.execute(
-                        'UPDATE live_status SET is_live = FALSE WHERE creator_id = ? AND platform = ?',
-                        (creator_id, platform)
-                    )
-                
+                # (helper commits and returns how many platforms are still live)
+                live_count = await run_db(_db_mark_offline, creator_id, platform, message_deleted)
+
                 logger.info(f"Updated {username} on {platform} to offline")
-                
-                # Check if offline on all platforms to remove live role
-                cursor.execute(
-                    'SELECT COUNT(*) FROM live_status WHERE creator_id = ? AND is_live = TRUE',
-                    (creator_id,)
-                )
-                
-                live_count = cursor.fetchone()[0]
                 logger.info(f"🔍 {username} is live on {live_count} platform(s)")
                 
                 if live_count == 0:  # Not live on any platform
@@ -2009,17 +2589,9 @@ async def handle_stream_status(creator_id, discord_user_id, username, streamer_t
                             logger.warning(f"⚠️ Could not find guild member for {username} (Discord ID: {discord_user_id})")
                     except Exception as e:
                         logger.error(f"❌ Error removing live role from {username}: {e}")
-        
-        conn.commit()
-    
+
     except Exception as e:
         logger.error(f"Error handling stream status for {username} on {platform}: {e}")
-    finally:
-        if conn:
-            try:
-                conn.close()
-            except:
-                pass
 
 async def send_live_notification(creator_id, discord_user_id, username, streamer_type, platform, platform_username, stream_info):
     """Send live notification to platform-specific channel and subscribers"""
@@ -3477,6 +4049,14 @@ async def main():
         # Clean up TikTok session to prevent resource leaks
         # Cleanup removed - improved_tiktok_checker handles its own session management
         await bot.close()
+        # Close the shared HTTP session and drain the connection pool -
+        # close_all() also runs PRAGMA optimize for the next start
+        if _http_session is not None and not _http_session.closed:
+            await _http_session.close()
+        try:
+            await run_db(db.pool.close_all)
+        except Exception as e:
+            logger.warning(f"Failed to close database pool cleanly: {e}")
 
 if __name__ == '__main__':
     # Run the async main function
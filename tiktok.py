@@ -5,14 +5,19 @@ Handles all TikTok live stream checking with dual verification
 """
 
 import asyncio
+import io
 import logging
-import requests
 import re
 import json
+import random
 import time
+from collections import OrderedDict
 from datetime import datetime
+from types import MappingProxyType
 from typing import Optional, Dict, Any
 
+import aiohttp
+
 # Import the existing improved TikTok checker
 try:
     from TikTokLive import TikTokLiveClient
@@ -20,247 +25,554 @@ try:
 except ImportError:
     TIKTOKLIVE_AVAILABLE = False
 
+# orjson dekodiert den großen SIGI_STATE-Blob deutlich schneller (optional)
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# ijson erlaubt es, nur die benötigten Module aus dem Blob zu ziehen (optional)
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
 logger = logging.getLogger('KARMA-LiveBOT.TikTok')
 
+def _extract_sigi_blob(buf: bytes) -> Optional[bytes]:
+    """Lokalisiert den SIGI_STATE-JSON-Blob per C-Substring-Suche (schneller als Regex)"""
+    start = buf.find(b"window['SIGI_STATE']")
+    if start < 0:
+        return None
+
+    eq = buf.find(b"=", start)
+    if eq < 0:
+        return None
+
+    end = buf.find(b";</script>", eq)
+    if end < 0:
+        return None
+
+    return buf[eq + 1:end]
+
+# Nur diese Top-Level-Module des SIGI_STATE werden tatsächlich ausgewertet;
+# der Rest (Feed-Daten, Empfehlungen, ...) macht den Großteil des Blobs aus
+_SIGI_MODULES = frozenset({'Live', 'LiveModule', 'UserModule', 'LiveRoom'})
+
+
+def _extract_sigi_modules(blob: bytes) -> Optional[Dict[str, Any]]:
+    """Baut per Streaming-Parser nur die benötigten SIGI_STATE-Module auf.
+
+    Gibt None zurück, wenn ijson fehlt oder das Streaming scheitert;
+    der Aufrufer fällt dann auf den vollständigen Parse zurück.
+    """
+    if not IJSON_AVAILABLE:
+        return None
+
+    result = {}
+    builder = None
+    current_key = None
+    depth = 0
+
+    try:
+        for prefix, event, value in ijson.parse(io.BytesIO(blob)):
+            if builder is None:
+                if event == 'map_key' and prefix == '' and value in _SIGI_MODULES:
+                    current_key = value
+                    builder = ijson.ObjectBuilder()
+                    depth = 0
+                continue
+
+            if depth == 0 and event not in ('start_map', 'start_array'):
+                # Skalarer Wert direkt unter dem Modul-Key
+                result[current_key] = value
+                builder = None
+                current_key = None
+                continue
+
+            builder.event(event, value)
+            if event in ('start_map', 'start_array'):
+                depth += 1
+            elif event in ('end_map', 'end_array'):
+                depth -= 1
+                if depth == 0:
+                    result[current_key] = builder.value
+                    builder = None
+                    current_key = None
+                    # Früh aussteigen, sobald alles Benötigte beisammen ist
+                    if len(result) == len(_SIGI_MODULES):
+                        break
+    except Exception:
+        return None
+
+    return result
+
+def _dig(d, *keys, default=0):
+    """Verschachtelter Lookup im EAFP-Stil: ein Zugriff pro Ebene statt
+    'in'-Check plus isinstance plus erneutem Lookup"""
+    try:
+        for k in keys:
+            d = d[k]
+        return d
+    except (KeyError, TypeError, IndexError):
+        return default
+
+def _find_user_entry(user_module, username: str) -> Optional[Dict[str, Any]]:
+    """Sucht den User-Eintrag im UserModule - uniqueId ist dort meist der Key
+
+    Versucht zuerst den O(1)-Zugriff über users[username]; nur wenn TikTok
+    doch unter User-IDs schlüsselt, fällt die Suche auf einen Scan zurück.
+    """
+    if not isinstance(user_module, dict):
+        return None
+    users = user_module.get("users")
+    if not isinstance(users, dict):
+        return None
+
+    user_data = users.get(username)
+    if isinstance(user_data, dict) and user_data.get("uniqueId", username) == username:
+        return user_data
+
+    for user_data in users.values():
+        if isinstance(user_data, dict) and user_data.get("uniqueId") == username:
+            return user_data
+    return None
+
+def _extract_live_info(username: str, data: Dict[str, Any]) -> Dict[str, Any]:
+    """Reine CPU-Traversierung des dekodierten SIGI_STATE (kein I/O, kein Logging)
+
+    Bewusst als voll annotierte Modul-Funktion gehalten, damit sie sich bei
+    Bedarf mit mypyc/Cython kompilieren lässt, ohne die Klasse anzufassen.
+    """
+    thumbnail_url: str = ""
+    profile_image_url: str = ""
+    follower_count: int = 0
+
+    # Pfad 1: Live -> liveStatus
+    # Pfad 2: LiveModule -> data -> liveStatus
+    live_status = (_dig(data, "Live", "liveStatus")
+                   or _dig(data, "LiveModule", "data", "liveStatus")
+                   or 0)
+
+    # User-Eintrag einmalig aus dem UserModule holen
+    # (Pfad 3 und Profildaten teilen sich denselben Eintrag)
+    user_data = _find_user_entry(data.get("UserModule"), username)
+
+    # Pfad 3: Suche in UserModule nach Live-Informationen
+    if live_status == 0 and user_data is not None:
+        # Prüfe auf Live-Indikatoren
+        if user_data.get("roomId"):  # Hat aktuelle Live-Room
+            live_status = 1
+        if user_data.get("liveStatus"):
+            live_status = user_data.get("liveStatus", 0)
+
+    # Extrahiere Profilbild und Follower-Anzahl aus UserModule
+    if user_data is not None:
+        # Profilbild extrahieren
+        if "avatarLarger" in user_data:
+            profile_image_url = user_data["avatarLarger"]
+        elif "avatarMedium" in user_data:
+            profile_image_url = user_data["avatarMedium"]
+        elif "avatarThumb" in user_data:
+            profile_image_url = user_data["avatarThumb"]
+
+        # Follower-Anzahl extrahieren
+        follower_count = user_data.get("followerCount", 0)
+
+    # Extrahiere Thumbnail, Zuschauerzahl und Titel aus LiveRoom-Daten
+    viewer_count: int = 0
+    title: str = f"{username} Live Stream"  # Fallback-Titel
+    live_room_info = _dig(data, "LiveRoom", "liveRoomInfo", default=None)
+    if isinstance(live_room_info, dict):
+        # Versuche verschiedene Thumbnail-Felder
+        thumbnail_url = (_dig(live_room_info, "cover", "url_list", 0, default="")
+                         or _dig(live_room_info, "cover", "urlList", 0, default=""))
+        # Versuche Zuschauerzahl zu extrahieren
+        viewer_count = (live_room_info.get("userCount", 0)
+                        or _dig(live_room_info, "liveRoomUserInfo", "userCount"))
+        # Versuche Titel zu extrahieren
+        title = live_room_info.get("title", title)
+        title = _dig(live_room_info, "titleStruct", "default", default=title)
+
+    return {
+        "is_live": live_status == 1,
+        "live_status": live_status,
+        "thumbnail_url": thumbnail_url,
+        "profile_image_url": profile_image_url,
+        "follower_count": follower_count,
+        "viewer_count": viewer_count,
+        "title": title
+    }
+
+# Browser-Headers für TikTok-Seitenabrufe (einmal gebaut, für alle Requests;
+# MappingProxyType verhindert versehentliche Mutation des geteilten Dicts)
+DEFAULT_HEADERS = MappingProxyType({
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.5',
+    # br: aiohttp dekodiert Brotli automatisch, brotli steht in requirements.txt
+    'Accept-Encoding': 'gzip, deflate, br',
+    'DNT': '1',
+    'Connection': 'keep-alive',
+    'Upgrade-Insecure-Requests': '1',
+})
+
+# Getrennte Timeouts: ein hängender POP soll nach 3s Verbindungsaufbau
+# aufgegeben werden statt den vollen 10s-Slot eines Poll-Zyklus zu blockieren
+_HTTP_TIMEOUT = aiohttp.ClientTimeout(total=10, connect=3, sock_read=6)
+
 class TikTokLiveChecker:
     """Verbesserte TikTok Live-Status-Überprüfung mit doppelter Verifikation"""
-    
+
+    # Obergrenze für gecachte TikTokLive-Clients (LRU-Verdrängung darüber)
+    CLIENT_CACHE_MAX = 128
+
     def __init__(self):
         # Client-Cache für Wiederverwendung (Performance-Optimierung)
-        self.tiktok_clients = {}  # username -> TikTokLiveClient
-        self.client_creation_time = {}  # username -> creation timestamp
+        # LRU: ältester Eintrag fliegt raus, wenn die Obergrenze erreicht ist
+        self._clients: "OrderedDict[str, tuple]" = OrderedDict()  # username -> (timestamp, Client)
         self.client_max_age = 3600  # Clients nach 1 Stunde erneuern
+        self._sweeper_task: Optional[asyncio.Task] = None
+        # Ein geteilter Client für alle Usernames, falls die Library
+        # is_live(unique_id=...) unterstützt (None = noch nicht probiert)
+        self._shared_client = None
+        self._shared_client_supported: Optional[bool] = None
+        # Geteilte HTTP-Session: Keep-Alive über TikToks CDN statt TLS-Handshake pro Check
+        self._http: Optional[aiohttp.ClientSession] = None
+        # Kurzlebiger Ergebnis-Cache: Aufrufer innerhalb eines Poll-Ticks teilen sich eine Probe
+        self._result_cache = {}  # username -> (timestamp, Ergebnis)
+        self._result_ttl = 20.0
+        self._inflight = {}  # username -> Future der gerade laufenden Probe (Single-Flight)
+        # Dasselbe pro Einzel-Probe, falls Poller sich direkt überlappen
+        self._inflight_html = {}  # username -> Future des laufenden HTML-Abrufs
+        self._inflight_lib = {}  # username -> Future des laufenden Library-Checks
+        # Validatoren der letzten HTML-Antwort für Conditional Requests
+        self._cond_cache = {}  # username -> (ETag, Last-Modified, geparstes Ergebnis)
+
+    def _get_http(self) -> aiohttp.ClientSession:
+        """Liefert die geteilte HTTP-Session (lazy angelegt)"""
+        if self._http is None or self._http.closed:
+            self._http = aiohttp.ClientSession(
+                headers=DEFAULT_HEADERS,
+                connector=aiohttp.TCPConnector(limit=32, keepalive_timeout=75, ttl_dns_cache=300)
+            )
+        return self._http
+
+    async def close(self):
+        """Schließt die geteilte HTTP-Session beim Shutdown"""
+        if self._sweeper_task is not None:
+            self._sweeper_task.cancel()
+            self._sweeper_task = None
+        if self._http is not None and not self._http.closed:
+            await self._http.close()
 
     def _get_or_create_client(self, username: str):
         """Holt wiederverwendbaren Client oder erstellt neuen (Performance-Optimierung)"""
         current_time = time.time()
-        
+
         # Prüfe ob Client existiert und noch gültig ist
-        if username in self.tiktok_clients:
-            client_age = current_time - self.client_creation_time.get(username, 0)
-            if client_age < self.client_max_age:
-                # Client ist noch gültig, wiederverwenden
-                return self.tiktok_clients[username]
-            else:
-                # Client zu alt, entfernen
-                del self.tiktok_clients[username]
-                del self.client_creation_time[username]
-        
+        entry = self._clients.get(username)
+        if entry is not None:
+            created, client = entry
+            if current_time - created < self.client_max_age:
+                # Client ist noch gültig, wiederverwenden (als jüngsten markieren)
+                self._clients.move_to_end(username)
+                return client
+            # Client zu alt, entfernen
+            del self._clients[username]
+
         # Neuen Client erstellen und cachen
         client = TikTokLiveClient(unique_id=username)
-        self.tiktok_clients[username] = client
-        self.client_creation_time[username] = current_time
-        logger.debug(f"TikTok {username}: Neuer Client erstellt (Cache: {len(self.tiktok_clients)} Clients)")
+        self._clients[username] = (current_time, client)
+        if len(self._clients) > self.CLIENT_CACHE_MAX:
+            # Am längsten unbenutzten Client verdrängen
+            self._clients.popitem(last=False)
+        logger.debug("TikTok %s: Neuer Client erstellt (Cache: %d Clients)", username, len(self._clients))
         return client
-    
+
+    async def _sweep_expired_clients(self):
+        """Räumt regelmäßig Clients weg, deren max_age überschritten ist"""
+        while True:
+            await asyncio.sleep(self.client_max_age / 4)
+            cutoff = time.time() - self.client_max_age
+            expired = [name for name, (created, _) in self._clients.items() if created < cutoff]
+            for name in expired:
+                self._clients.pop(name, None)
+            if expired:
+                logger.debug("TikTok Client-Cache: %d abgelaufene Clients entfernt", len(expired))
+
+    def _ensure_sweeper(self):
+        """Startet den Aufräum-Task lazy (beim ersten Check im laufenden Loop)"""
+        if self._sweeper_task is None or self._sweeper_task.done():
+            self._sweeper_task = asyncio.create_task(self._sweep_expired_clients())
+
+
+    async def _coalesce(self, inflight: dict, username: str, probe):
+        """Single-Flight: Parallele Aufrufer für denselben User teilen sich
+        eine laufende Probe statt eigene HTTP-Requests zu starten"""
+        fut = inflight.get(username)
+        if fut is not None:
+            return await fut
+
+        fut = asyncio.get_event_loop().create_future()
+        inflight[username] = fut
+
+        result = None
+        try:
+            result = await probe(username)
+        finally:
+            if not fut.done():
+                fut.set_result(result)
+            inflight.pop(username, None)
+
+        return result
+
     async def check_tiktoklive_library(self, username: str) -> bool:
+        """Überprüfung mit TikTokLive library (gebündelt pro Username)"""
+        result = await self._coalesce(self._inflight_lib, username, self._do_library_check)
+        return bool(result)
+
+    async def _do_library_check(self, username: str) -> bool:
         """Überprüfung mit TikTokLive library (async)"""
         try:
             if not TIKTOKLIVE_AVAILABLE:
-                logger.warning(f"TikTokLive library nicht verfügbar für {username}")
+                logger.warning("TikTokLive library nicht verfügbar für %s", username)
                 return False
                 
-            logger.info(f"TikTok {username}: Teste TikTokLive library...")
-            # Wiederverwendbaren Client holen statt neuen zu erstellen
-            client = self._get_or_create_client(username)
-            
+            logger.debug("TikTok %s: Teste TikTokLive library...", username)
+            self._ensure_sweeper()
+
+            # Bevorzugt: ein geteilter Client für alle Usernames (eine Session
+            # statt einer pro User); nur wenn die installierte Library-Version
+            # kein is_live(unique_id=...) kann, Clients pro Username cachen
+            client = None
+            if self._shared_client_supported is not False:
+                client = self._shared_client
+                if client is None:
+                    client = TikTokLiveClient(unique_id=username)
+                    self._shared_client = client
+            if client is None:
+                # Wiederverwendbaren Client holen statt neuen zu erstellen
+                client = self._get_or_create_client(username)
+
             # Prüfe Live-Status (richtig mit await aufrufen!)
             try:
-                is_live = await client.is_live()
-                logger.info(f"TikTok {username}: TikTokLive async call erfolgreich: {is_live}")
+                if self._shared_client_supported is not False:
+                    try:
+                        is_live = await client.is_live(unique_id=username)
+                        self._shared_client_supported = True
+                    except TypeError:
+                        # Library ohne unique_id-Parameter -> Client pro User
+                        logger.debug("TikTokLive: is_live(unique_id=...) nicht unterstützt - Clients pro Username")
+                        self._shared_client_supported = False
+                        self._shared_client = None
+                        client = self._get_or_create_client(username)
+                        is_live = await client.is_live()
+                else:
+                    is_live = await client.is_live()
+                logger.debug("TikTok %s: TikTokLive async call erfolgreich: %s", username, is_live)
             except Exception as async_error:
-                logger.warning(f"TikTok {username}: Async call fehlgeschlagen: {async_error}")
+                logger.warning("TikTok %s: Async call fehlgeschlagen: %s", username, async_error)
                 # Fallback: Versuche synchron
                 is_live_method = getattr(client, "is_live", None)
                 if callable(is_live_method):
                     result = is_live_method()
                     # Prüfe ob es eine coroutine ist
                     if hasattr(result, '__await__'):
-                        logger.warning(f"TikTok {username}: is_live() ist async aber wurde nicht awaited")
+                        logger.warning("TikTok %s: is_live() ist async aber wurde nicht awaited", username)
                         return False
                     is_live = bool(result)
                 else:
                     is_live = False
             
             if is_live:
-                logger.info(f"TikTok {username}: TikTokLive library bestätigt - user LIVE ✅")
+                logger.info("TikTok %s: TikTokLive library bestätigt - user LIVE ✅", username)
             else:
-                logger.info(f"TikTok {username}: TikTokLive library bestätigt - user offline")
+                logger.debug("TikTok %s: TikTokLive library bestätigt - user offline", username)
                 
             return is_live
         except Exception as e:
-            logger.error(f"TikTok {username}: TikTokLive library Fehler: {e}")
+            logger.error("TikTok %s: TikTokLive library Fehler: %s", username, e)
             return False
 
-    def _sync_html_parsing(self, username: str) -> Dict[str, Any]:
-        """Synchrone HTML-Parsing Hilfsfunktion (wird in Thread ausgeführt)"""
+    def _parse_live_page(self, username: str, html_content: bytes) -> Dict[str, Any]:
+        """Extrahiert Live-Status und Zusatzinfos aus der TikTok-Profilseite"""
         try:
-            url = f"https://www.tiktok.com/@{username}"
-            
-            # Erstelle neue Session pro Call für Thread-Sicherheit
-            session = requests.Session()
-            session.headers.update({
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-                'Accept-Language': 'en-US,en;q=0.5',
-                'Accept-Encoding': 'gzip, deflate',
-                'DNT': '1',
-                'Connection': 'keep-alive',
-                'Upgrade-Insecure-Requests': '1',
-            })
-            
-            # Mache Request zur TikTok-Seite
-            response = session.get(url, timeout=10)
-            
-            if response.status_code != 200:
-                logger.warning(f"TikTok {username}: HTTP Status {response.status_code}")
-                return {"is_live": False, "thumbnail_url": "", "profile_image_url": "", "follower_count": 0, "viewer_count": 0, "title": f"{username} Live Stream"}
-            
-            html_content = response.text
-            
-            # Suche nach SIGI_STATE JSON
-            match = re.search(r"window\['SIGI_STATE'\]\s*=\s*(.*?);</script>", html_content, re.DOTALL)
-            if not match:
-                logger.warning(f"TikTok {username}: SIGI_STATE nicht gefunden")
+            # Suche nach SIGI_STATE JSON (json.loads akzeptiert Bytes direkt)
+            blob = _extract_sigi_blob(html_content)
+            if blob is None:
+                logger.warning("TikTok %s: SIGI_STATE nicht gefunden", username)
                 return {"is_live": False, "thumbnail_url": "", "profile_image_url": "", "follower_count": 0, "viewer_count": 0, "title": f"{username} Live Stream"}
-            
+
             try:
-                data = json.loads(match.group(1))
-                
-                # Initialisiere Variablen
-                live_status = 0
-                thumbnail_url = ""
-                profile_image_url = ""
-                follower_count = 0
-                
-                # Pfad 1: Live -> liveStatus  
-                if "Live" in data and isinstance(data["Live"], dict):
-                    live_status = data["Live"].get("liveStatus", 0)
-                
-                # Pfad 2: LiveModule -> data -> liveStatus
-                if live_status == 0 and "LiveModule" in data:
-                    live_module = data["LiveModule"]
-                    if isinstance(live_module, dict) and "data" in live_module:
-                        live_data = live_module["data"]
-                        if isinstance(live_data, dict):
-                            live_status = live_data.get("liveStatus", 0)
-                
-                # Pfad 3: Suche in UserModule nach Live-Informationen
-                if live_status == 0 and "UserModule" in data:
-                    user_module = data["UserModule"]
-                    if isinstance(user_module, dict) and "users" in user_module:
-                        users = user_module["users"]
-                        if isinstance(users, dict):
-                            for user_id, user_data in users.items():
-                                if isinstance(user_data, dict) and user_data.get("uniqueId") == username:
-                                    # Prüfe auf Live-Indikatoren
-                                    if user_data.get("roomId"):  # Hat aktuelle Live-Room
-                                        live_status = 1
-                                    if user_data.get("liveStatus"):
-                                        live_status = user_data.get("liveStatus", 0)
-                
-                # Extrahiere Profilbild und Follower-Anzahl aus UserModule
-                if "UserModule" in data:
-                    user_module = data["UserModule"]
-                    if isinstance(user_module, dict) and "users" in user_module:
-                        users = user_module["users"]
-                        if isinstance(users, dict):
-                            for user_id, user_data in users.items():
-                                if isinstance(user_data, dict) and user_data.get("uniqueId") == username:
-                                    # Profilbild extrahieren
-                                    if "avatarLarger" in user_data:
-                                        profile_image_url = user_data["avatarLarger"]
-                                    elif "avatarMedium" in user_data:
-                                        profile_image_url = user_data["avatarMedium"]
-                                    elif "avatarThumb" in user_data:
-                                        profile_image_url = user_data["avatarThumb"]
-                                    
-                                    # Follower-Anzahl extrahieren
-                                    follower_count = user_data.get("followerCount", 0)
-                                    break
-                
-                # Extrahiere Thumbnail, Zuschauerzahl und Titel aus LiveRoom-Daten
-                viewer_count = 0
-                title = f"{username} Live Stream"  # Fallback-Titel
-                if "LiveRoom" in data and isinstance(data["LiveRoom"], dict):
-                    live_room = data["LiveRoom"]
-                    if "liveRoomInfo" in live_room and isinstance(live_room["liveRoomInfo"], dict):
-                        live_room_info = live_room["liveRoomInfo"]
-                        # Versuche verschiedene Thumbnail-Felder
-                        if "cover" in live_room_info and isinstance(live_room_info["cover"], dict):
-                            cover = live_room_info["cover"]
-                            for size in ["url_list", "urlList"]:
-                                if size in cover and isinstance(cover[size], list) and len(cover[size]) > 0:
-                                    thumbnail_url = cover[size][0]
-                                    break
-                        # Versuche Zuschauerzahl zu extrahieren
-                        viewer_count = live_room_info.get("userCount", 0)
-                        if viewer_count == 0:
-                            viewer_count = live_room_info.get("liveRoomUserInfo", {}).get("userCount", 0)
-                        
-                        # Versuche Titel zu extrahieren
-                        title = live_room_info.get("title", title)
-                        if "titleStruct" in live_room_info and isinstance(live_room_info["titleStruct"], dict):
-                            title = live_room_info["titleStruct"].get("default", title)
-                
-                is_live = live_status == 1
-                
+                # Bevorzugt nur die benötigten Module streamen statt den
+                # kompletten Blob als Python-Objektbaum aufzubauen
+                data = _extract_sigi_modules(blob)
+                if data is None:
+                    data = _json_loads(blob)
+
+                result = _extract_live_info(username, data)
+
+                is_live = result["is_live"]
+                live_status = result.pop("live_status")
+                profile_image_url = result["profile_image_url"]
+                thumbnail_url = result["thumbnail_url"]
+                follower_count = result["follower_count"]
+                viewer_count = result["viewer_count"]
+                title = result["title"]
+
                 if is_live:
-                    logger.info(f"TikTok {username}: HTML-Parsing bestätigt - user LIVE ✅ (liveStatus: {live_status})")
-                    logger.info(f"TikTok {username}: Profilbild: {profile_image_url[:50] if profile_image_url else 'Keine'}")
-                    logger.info(f"TikTok {username}: Thumbnail: {thumbnail_url[:50] if thumbnail_url else 'Keine'}")
-                    logger.info(f"TikTok {username}: Follower: {follower_count}")
-                    logger.info(f"TikTok {username}: Zuschauer: {viewer_count}")
-                    logger.info(f"TikTok {username}: Titel: {title}")
+                    logger.info("TikTok %s: HTML-Parsing bestätigt - user LIVE ✅ (liveStatus: %s)", username, live_status)
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug("TikTok %s: Profilbild: %s", username, profile_image_url[:50] if profile_image_url else 'Keine')
+                        logger.debug("TikTok %s: Thumbnail: %s", username, thumbnail_url[:50] if thumbnail_url else 'Keine')
+                        logger.debug("TikTok %s: Follower: %s", username, follower_count)
+                        logger.debug("TikTok %s: Zuschauer: %s", username, viewer_count)
+                        logger.debug("TikTok %s: Titel: %s", username, title)
                 else:
-                    logger.info(f"TikTok {username}: HTML-Parsing bestätigt - user offline (liveStatus: {live_status})")
-                
-                return {
-                    "is_live": is_live,
-                    "thumbnail_url": thumbnail_url,
-                    "profile_image_url": profile_image_url,
-                    "follower_count": follower_count,
-                    "viewer_count": viewer_count,
-                    "title": title
-                }
+                    logger.debug("TikTok %s: HTML-Parsing bestätigt - user offline (liveStatus: %s)", username, live_status)
                 
+                return result
+
             except json.JSONDecodeError as e:
-                logger.error(f"TikTok {username}: JSON-Parsing Fehler: {e}")
+                logger.error("TikTok %s: JSON-Parsing Fehler: %s", username, e)
                 return {"is_live": False, "thumbnail_url": "", "profile_image_url": "", "follower_count": 0, "viewer_count": 0, "title": f"{username} Live Stream"}
                 
         except Exception as e:
-            logger.error(f"TikTok {username}: HTML-Parsing Fehler: {e}")
+            logger.error("TikTok %s: HTML-Parsing Fehler: %s", username, e)
             return {"is_live": False, "thumbnail_url": "", "profile_image_url": "", "follower_count": 0, "viewer_count": 0, "title": f"{username} Live Stream"}
     
     async def check_html_parsing(self, username: str) -> Dict[str, Any]:
-        """Asynchrone Überprüfung mit HTML-Parsing (Event-Loop-sicher)"""
-        logger.info(f"TikTok {username}: Teste HTML-Parsing von https://www.tiktok.com/@{username}...")
+        """Asynchrone Überprüfung mit HTML-Parsing (gebündelt pro Username)"""
+        result = await self._coalesce(self._inflight_html, username, self._do_html_parsing)
+        if result is None:
+            return {"is_live": False, "thumbnail_url": "", "profile_image_url": "", "follower_count": 0, "viewer_count": 0, "title": f"{username} Live Stream"}
+        return result
+
+    async def _do_html_parsing(self, username: str) -> Dict[str, Any]:
+        """Asynchrone Überprüfung mit HTML-Parsing (geteilte Session mit Keep-Alive)"""
+        logger.debug("TikTok %s: Teste HTML-Parsing von https://www.tiktok.com/@%s...", username, username)
         try:
-            # Führe synchrones HTML-Parsing in separatem Thread aus (verhindert Event-Loop Blocking)
-            result = await asyncio.to_thread(self._sync_html_parsing, username)
+            url = f"https://www.tiktok.com/@{username}"
+
+            # Range-Request: SIGI_STATE steht am Seitenanfang, die ersten
+            # 256 KB reichen - spart bei 206-Antworten den Rest der ~1 MB Seite
+            headers = {'Range': 'bytes=0-262143'}
+            # Conditional Request: mit Validatoren der letzten Antwort fragen,
+            # damit der Server bei unveränderter Seite nur 304 schicken muss
+            cond = self._cond_cache.get(username)
+            if cond is not None:
+                etag, last_modified, _ = cond
+                if etag:
+                    headers['If-None-Match'] = etag
+                if last_modified:
+                    headers['If-Modified-Since'] = last_modified
+
+            session = self._get_http()
+            for attempt in (1, 2):
+                try:
+                    async with session.get(url, headers=headers, timeout=_HTTP_TIMEOUT) as response:
+                        if response.status == 304 and cond is not None:
+                            logger.debug("TikTok %s: 304 Not Modified - geparstes Ergebnis wiederverwendet", username)
+                            return dict(cond[2])
+                        # 206 Partial Content = Server respektiert den Range-Header,
+                        # 200 = volle Seite (funktioniert genauso, nur ohne Ersparnis)
+                        if response.status not in (200, 206):
+                            logger.warning("TikTok %s: HTTP Status %s", username, response.status)
+                            return {"is_live": False, "thumbnail_url": "", "profile_image_url": "", "follower_count": 0, "viewer_count": 0, "title": f"{username} Live Stream"}
+
+                        html_content = await response.read()
+                        etag = response.headers.get('ETag')
+                        last_modified = response.headers.get('Last-Modified')
+                    break
+                except (aiohttp.ClientConnectorError, aiohttp.ServerTimeoutError) as conn_error:
+                    # Transiente Verbindungsfehler sind auf TikTok-CDNs häufig:
+                    # einmal mit kleinem Jitter neu versuchen, dann aufgeben
+                    if attempt == 2:
+                        raise
+                    delay = 0.25 + random.random() * 0.5
+                    logger.debug("TikTok %s: Verbindungsfehler (%s) - Retry in %.2fs", username, conn_error, delay)
+                    await asyncio.sleep(delay)
+
+            result = self._parse_live_page(username, html_content)
+            if etag or last_modified:
+                self._cond_cache[username] = (etag, last_modified, dict(result))
             return result
         except Exception as e:
-            logger.error(f"TikTok {username}: Async HTML-Parsing Fehler: {e}")
+            logger.error("TikTok %s: Async HTML-Parsing Fehler: %s", username, e)
             return {"is_live": False, "thumbnail_url": "", "profile_image_url": "", "follower_count": 0, "viewer_count": 0, "title": f"{username} Live Stream"}
 
-    async def is_user_live(self, username: str) -> Dict[str, Any]:
+    async def is_user_live(self, username: str, require_metadata: bool = True) -> Dict[str, Any]:
         """
         Hauptfunktion: Intelligente Live-Verifikation
         TikTokLive library hat Priorität, HTML-Parsing als Zusatzbestätigung
-        
+
+        Ergebnisse werden kurz gecacht und parallele Aufrufer für denselben
+        User teilen sich eine laufende Probe (Single-Flight). Wer nur den
+        Booleschen Status braucht, kann mit require_metadata=False den
+        HTML-Abruf für per Library bestätigte Live-User einsparen.
+
         Returns:
             Dict mit Live-Status und Zusatzinfos
         """
-        logger.info(f"TikTok {username}: Starte intelligente Live-Verifikation...")
-        
-        # Methode 1: TikTokLive library (PRIORITÄT)
-        library_result = await self.check_tiktoklive_library(username)
-        logger.info(f"TikTok {username}: TikTokLive library Ergebnis: {library_result}")
-        
-        # Methode 2: HTML-Parsing (Zusatzbestätigung + Bild-Extraktion)
-        html_data = await self.check_html_parsing(username)
+        now = time.time()
+
+        cached = self._result_cache.get(username)
+        if cached and now - cached[0] < self._result_ttl:
+            logger.debug("TikTok %s: Ergebnis aus Cache (%.1fs alt)", username, now - cached[0])
+            return dict(cached[1])
+
+        if not require_metadata:
+            # Boolescher Schnellpfad: reduziertes Ergebnis nicht cachen, damit
+            # Metadaten-Aufrufer keine leeren Felder aus dem Cache bekommen
+            return await self._verify_user_live(username, require_metadata=False)
+
+        inflight = self._inflight.get(username)
+        if inflight is not None:
+            result = await inflight
+            return dict(result) if result is not None else {'is_live': False}
+
+        fut = asyncio.get_event_loop().create_future()
+        self._inflight[username] = fut
+
+        result = None
+        try:
+            result = await self._verify_user_live(username)
+            self._result_cache[username] = (time.time(), result)
+        finally:
+            if not fut.done():
+                fut.set_result(result)
+            self._inflight.pop(username, None)
+
+        return result
+
+    async def _verify_user_live(self, username: str, require_metadata: bool = True) -> Dict[str, Any]:
+        """Führt die eigentliche doppelte Live-Verifikation aus (ungecacht)"""
+        logger.debug("TikTok %s: Starte intelligente Live-Verifikation...", username)
+
+        if require_metadata:
+            # Beide Methoden sind unabhängige Netzwerk-Proben -> parallel ausführen
+            # Methode 1: TikTokLive library (PRIORITÄT)
+            # Methode 2: HTML-Parsing (Zusatzbestätigung + Bild-Extraktion)
+            library_result, html_data = await asyncio.gather(
+                self.check_tiktoklive_library(username),
+                self.check_html_parsing(username)
+            )
+        else:
+            # Nur der Boolesche Status zählt: Library zuerst, HTML nur als
+            # Fallback falls die Library offline meldet
+            library_result = await self.check_tiktoklive_library(username)
+            if library_result:
+                logger.debug("TikTok %s: Library bestätigt LIVE - HTML-Abruf übersprungen", username)
+                html_data = {}
+            else:
+                html_data = await self.check_html_parsing(username)
+        logger.debug("TikTok %s: TikTokLive library Ergebnis: %s", username, library_result)
+
         html_result = html_data.get("is_live", False)
-        logger.info(f"TikTok {username}: HTML-Parsing Ergebnis: {html_result}")
+        logger.debug("TikTok %s: HTML-Parsing Ergebnis: %s", username, html_result)
         
         # NEUE INTELLIGENTE LOGIK:
         # 1. Wenn TikTokLive library LIVE sagt → User ist live (sehr zuverlässig)
@@ -274,17 +586,17 @@ class TikTokLiveChecker:
             # TikTokLive library ist sehr zuverlässig für LIVE-Erkennung
             is_live = True
             verification_method = "library_priority"
-            logger.info(f"TikTok {username}: ✅ LIVE bestätigt via TikTokLive library (zuverlässig)!")
+            logger.info("TikTok %s: ✅ LIVE bestätigt via TikTokLive library (zuverlässig)!", username)
         elif html_result:
             # HTML kann manchmal false-positives haben, also vorsichtiger
             is_live = True  
             verification_method = "html_only"
-            logger.warning(f"TikTok {username}: ⚠️ LIVE via HTML-Parsing (TikTokLive library sagt offline)")
+            logger.warning("TikTok %s: ⚠️ LIVE via HTML-Parsing (TikTokLive library sagt offline)", username)
         else:
             # Beide sagen offline
             is_live = False
             verification_method = "both_offline"
-            logger.info(f"TikTok {username}: ❌ Beide Methoden bestätigen - User offline")
+            logger.debug("TikTok %s: ❌ Beide Methoden bestätigen - User offline", username)
         
         # Fallback-URLs für TikTok Profile und Thumbnails
         profile_fallback = f"https://p16-sign-sg.tiktokcdn.com/aweme/100x100/{username}.jpeg"
@@ -324,6 +636,21 @@ class TikTokLiveChecker:
                 'viewer_count': viewer_count
             }
 
+    async def is_users_live(self, usernames, max_concurrency: int = 8,
+                            require_metadata: bool = True):
+        """Prüft viele Usernames parallel (begrenzt durch eine Semaphore)
+
+        Returns:
+            Liste der is_user_live-Ergebnisse in Eingabe-Reihenfolge
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def _check_one(username: str) -> Dict[str, Any]:
+            async with semaphore:
+                return await self.is_user_live(username, require_metadata=require_metadata)
+
+        return await asyncio.gather(*(_check_one(username) for username in usernames))
+
 # Globale Instanz für den Bot
 improved_tiktok_checker = TikTokLiveChecker()
 
@@ -340,7 +667,7 @@ async def check_html(username: str) -> bool:
 
 async def is_user_live(username: str) -> bool:
     """Einfache intelligente Verifikation (nur True/False)"""
-    result = await improved_tiktok_checker.is_user_live(username)
+    result = await improved_tiktok_checker.is_user_live(username, require_metadata=False)
     return result.get('is_live', False)
 
 async def get_live_info(username: str) -> Dict[str, Any]:
@@ -360,7 +687,7 @@ async def tiktok_platform_task(db, bot, creators):
                 await asyncio.sleep(60)  # Wait 1 minute if no TikTok creators
                 continue
             
-            logger.info(f"🎵 Checking {len(tiktok_creators)} TikTok creators")
+            logger.info("🎵 Checking %d TikTok creators", len(tiktok_creators))
             
             for creator in tiktok_creators:
                 creator_id, discord_user_id, username, streamer_type, channel_id, twitch_user, youtube_user, tiktok_user = creator
@@ -370,14 +697,14 @@ async def tiktok_platform_task(db, bot, creators):
                     stream_info = await improved_tiktok_checker.is_user_live(tiktok_user)
                     
                     if stream_info and stream_info.get('is_live'):
-                        logger.info(f"🎵 {tiktok_user} is LIVE on TikTok!")
+                        logger.info("🎵 %s is LIVE on TikTok!", tiktok_user)
                         # Here you would call handle_stream_status or similar notification logic
                         # This will be handled by the main bot coordination
                     else:
-                        logger.debug(f"🎵 {tiktok_user} is offline on TikTok")
+                        logger.debug("🎵 %s is offline on TikTok", tiktok_user)
                     
                 except Exception as e:
-                    logger.error(f"🎵 Error checking TikTok user {tiktok_user}: {e}")
+                    logger.error("🎵 Error checking TikTok user %s: %s", tiktok_user, e)
                 
                 # Small delay between checks to avoid rate limits
                 await asyncio.sleep(1)
@@ -387,5 +714,5 @@ async def tiktok_platform_task(db, bot, creators):
             await asyncio.sleep(180)
             
         except Exception as e:
-            logger.error(f"🎵 Error in TikTok platform task: {e}")
+            logger.error("🎵 Error in TikTok platform task: %s", e)
             await asyncio.sleep(30)  # Wait before retrying on error
\ No newline at end of file